@@ -0,0 +1,295 @@
+"""
+요청 제한 (admission control) - 클라이언트별 토큰 버킷과 업스트림 동시 검색 상한
+
+초과 요청은 이벤트 루프 안에서 대기시키지 않고 즉시 거절하며, 재시도까지의
+대기 시간(Retry-After)을 함께 알려준다.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+import math
+import time
+
+
+class AdmissionRejected(Exception):
+    """요청 거절 (HTTP 429로 응답)"""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After 헤더 값 (정수 초, 최소 1)"""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class TokenBucket:
+    """
+    토큰 버킷
+
+    - rate: 초당 충전 토큰 수
+    - capacity: 최대 토큰 수 (순간 허용량)
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def wait_time(self, tokens: float = 1, now: Optional[float] = None) -> float:
+        """tokens개를 쓸 수 있을 때까지 남은 시간 (초, 0이면 즉시 가능)"""
+        self._refill(time.monotonic() if now is None else now)
+        if self.tokens >= tokens:
+            return 0.0
+        if self.rate <= 0:
+            return math.inf
+        return (tokens - self.tokens) / self.rate
+
+    def available(self, now: Optional[float] = None) -> float:
+        """지금 쓸 수 있는 토큰 수"""
+        self._refill(time.monotonic() if now is None else now)
+        return self.tokens
+
+    def consume(self, tokens: float = 1):
+        """토큰 차감 (wait_time()이 0일 때 호출)"""
+        self.tokens -= tokens
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """토큰을 즉시 쓸 수 있으면 차감 후 0, 아니면 차감 없이 대기 시간 반환"""
+        wait = self.wait_time(tokens)
+        if wait == 0:
+            self.consume(tokens)
+        return wait
+
+    @property
+    def idle(self) -> bool:
+        """가득 찬 상태 (삭제해도 동작이 같음)"""
+        self._refill(time.monotonic())
+        return self.tokens >= self.capacity
+
+
+@dataclass
+class PlatformLimit:
+    """플랫폼별 제한"""
+    rate: float  # 클라이언트별 초당 업스트림 검색 수
+    burst: float  # 클라이언트별 순간 허용량
+    max_concurrent: int  # 전체 동시 업스트림 검색 수
+
+
+class FanoutPermit:
+    """업스트림 검색 슬롯 (검색이 모두 끝나면 release)"""
+
+    def __init__(self, controller: "AdmissionController", platforms: List[str]):
+        self._controller = controller
+        self._platforms = platforms
+        self._released = False
+
+    def release(self, *_):
+        """슬롯 반환 (여러 번 호출해도 한 번만 반환, done callback으로도 사용)"""
+        if not self._released:
+            self._released = True
+            self._controller._release(self._platforms)
+
+
+class AdmissionController:
+    """
+    업스트림 검색 요청 제한
+
+    - 클라이언트별 토큰 버킷: (클라이언트, 플랫폼)마다 rate/burst 적용. 오래 쓰지 않은
+      버킷은 max_clients를 넘으면 LRU 순으로 정리한다.
+    - 동시 검색 상한: 전체 fan-out 수(max_fanouts)와 플랫폼별 동시 검색 수(max_concurrent)
+
+    제한이 설정되지 않은 플랫폼(로컬 스냅샷 등)은 검사하지 않는다.
+    """
+
+    def __init__(self, limits: Dict[str, PlatformLimit], max_fanouts: int = 32,
+                 max_clients: int = 10000):
+        self.limits = limits
+        self.max_fanouts = max_fanouts
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[Tuple[str, str], TokenBucket]" = OrderedDict()
+        self._fanouts = 0
+        self._active: Dict[str, int] = {platform: 0 for platform in limits}
+
+        # 통계 카운터
+        self.admitted = 0
+        self.rejected_rate = 0
+        self.rejected_concurrency = 0
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "AdmissionController":
+        """설정(mcp_config.yaml의 admission)으로 생성"""
+        client = config.get("client", {})
+        default_rate = float(client.get("rate", 2))
+        default_burst = float(client.get("burst", 5))
+        default_concurrent = int(config.get("max_concurrent_per_platform", 8))
+
+        limits = {}
+        for platform, platform_config in (config.get("platforms") or {}).items():
+            platform_config = platform_config or {}
+            limits[platform] = PlatformLimit(
+                rate=float(platform_config.get("rate", default_rate)),
+                burst=float(platform_config.get("burst", default_burst)),
+                max_concurrent=int(platform_config.get("max_concurrent", default_concurrent))
+            )
+
+        return cls(
+            limits,
+            max_fanouts=int(config.get("max_concurrent_fanouts", 32)),
+            max_clients=int(client.get("max_clients", 10000))
+        )
+
+    def _bucket(self, client_id: str, platform: str) -> TokenBucket:
+        key = (client_id, platform)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            limit = self.limits[platform]
+            bucket = TokenBucket(limit.rate, limit.burst)
+            self._buckets[key] = bucket
+            self._prune()
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def _prune(self):
+        """버킷 수 제한 (가장 오래 쓰지 않은 버킷부터 삭제)"""
+        while len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+
+    def limited(self, platforms: Iterable[str]) -> List[str]:
+        """제한 대상 플랫폼만 선택"""
+        return [p for p in platforms if p in self.limits]
+
+    def max_tokens(self, platforms: Iterable[str]) -> float:
+        """한 번에 차감할 수 있는 최대 토큰 수 (제한 플랫폼 버킷 용량 중 최솟값)"""
+        return min((self.limits[p].burst for p in self.limited(platforms)), default=math.inf)
+
+    def admit(self, client_id: str, platforms: Iterable[str], tokens: float = 1):
+        """
+        클라이언트의 업스트림 검색 허용 여부 확인
+
+        모든 플랫폼 버킷에 tokens개가 있을 때만 함께 차감한다 (일부만 차감하지 않음).
+        부족하면 모자란 토큰이 충전될 때까지의 시간을 Retry-After로 알려준다.
+        tokens는 max_tokens()를 넘을 수 없다 (큰 일괄 검색은 admit_partial 사용).
+
+        Raises:
+            AdmissionRejected: 토큰 부족
+            ValueError: tokens가 버킷 용량보다 큼 (기다려도 허용되지 않음)
+        """
+        if tokens > self.max_tokens(platforms):
+            raise ValueError(f"{tokens:g} searches exceed the per-client burst {self.max_tokens(platforms):g}")
+
+        buckets = [self._bucket(client_id, p) for p in self.limited(platforms)]
+        now = time.monotonic()
+        wait = max((b.wait_time(tokens, now=now) for b in buckets), default=0.0)
+        if wait > 0:
+            self.rejected_rate += 1
+            raise AdmissionRejected("Too many searches from this client", wait)
+
+        for bucket in buckets:
+            bucket.consume(tokens)
+        self.admitted += 1
+
+    def admit_partial(self, client_id: str, platforms: Iterable[str], tokens: int) -> Tuple[int, float]:
+        """
+        일괄 검색 허용 (지금 남은 만큼만 차감)
+
+        모든 플랫폼 버킷에 공통으로 남은 토큰 수까지만 허용하고 차감한다. 나머지는
+        호출한 쪽이 미루며, 다음 묶음(최대 버킷 용량)을 쓸 수 있을 때까지의 시간을 함께 반환한다.
+
+        Returns:
+            (허용된 토큰 수, 나머지를 재시도할 때까지의 시간(초), 나머지가 없으면 0)
+
+        Raises:
+            AdmissionRejected: 남은 토큰이 하나도 없음
+        """
+        buckets = [self._bucket(client_id, p) for p in self.limited(platforms)]
+        now = time.monotonic()
+        granted = min([tokens] + [int(b.available(now)) for b in buckets])
+        if granted < 1:
+            self.rejected_rate += 1
+            raise AdmissionRejected(
+                "Too many searches from this client", max(b.wait_time(1, now=now) for b in buckets)
+            )
+
+        for bucket in buckets:
+            bucket.consume(granted)
+        self.admitted += 1
+
+        remaining = tokens - granted
+        retry_after = max(
+            (b.wait_time(min(remaining, b.capacity), now=now) for b in buckets), default=0.0
+        ) if remaining else 0.0
+        return granted, retry_after
+
+    def acquire_fanout(self, platforms: Iterable[str]) -> FanoutPermit:
+        """
+        업스트림 검색 슬롯 확보 (대기하지 않음)
+
+        Raises:
+            AdmissionRejected: 전체 또는 플랫폼별 동시 검색 상한 초과
+        """
+        limited = self.limited(platforms)
+        full = self._fanouts >= self.max_fanouts or any(
+            self._active[p] >= self.limits[p].max_concurrent for p in limited
+        )
+        if full:
+            self.rejected_concurrency += 1
+            raise AdmissionRejected("Too many concurrent upstream searches", 1)
+
+        self._fanouts += 1
+        for platform in limited:
+            self._active[platform] += 1
+        return FanoutPermit(self, limited)
+
+    def acquire_fanouts(self, platforms: Iterable[str], count: int) -> List[FanoutPermit]:
+        """
+        업스트림 검색 슬롯 count개 확보 (전부 확보하거나 하나도 확보하지 않음)
+
+        Raises:
+            AdmissionRejected: 전체 또는 플랫폼별 동시 검색 상한 초과
+        """
+        permits: List[FanoutPermit] = []
+        try:
+            for _ in range(count):
+                permits.append(self.acquire_fanout(platforms))
+        except AdmissionRejected:
+            for permit in permits:
+                permit.release()
+            raise
+        return permits
+
+    def _release(self, platforms: List[str]):
+        self._fanouts -= 1
+        for platform in platforms:
+            self._active[platform] -= 1
+
+    def stats(self) -> Dict:
+        """제한 통계"""
+        # 가득 찬 버킷은 없는 것과 같으므로 통계 조회 시 정리
+        for key in [k for k, b in self._buckets.items() if b.idle]:
+            del self._buckets[key]
+
+        return {
+            "fanouts": self._fanouts,
+            "max_fanouts": self.max_fanouts,
+            "active": dict(self._active),
+            "limits": {
+                p: {"rate": l.rate, "burst": l.burst, "max_concurrent": l.max_concurrent}
+                for p, l in self.limits.items()
+            },
+            "tracked_clients": len(self._buckets),
+            "admitted": self.admitted,
+            "rejected_rate": self.rejected_rate,
+            "rejected_concurrency": self.rejected_concurrency
+        }
@@ -1,21 +1,167 @@
 """
 실시간 부동산 데이터 수집 API 서버
 """
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, Dict, List, Any
+from fastapi.responses import StreamingResponse, JSONResponse, PlainTextResponse
+from pydantic import BaseModel, Field
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, List, Any, Awaitable
 import asyncio
 import aiohttp
 from datetime import datetime, timedelta
 import json
+import math
 import sys
 import os
+import time
+import weakref
 from pathlib import Path
 
 # 프로젝트 루트 경로 추가
 sys.path.append(str(Path(__file__).parent.parent))
 
-app = FastAPI(title="부동산 실시간 검색 API", version="1.0.0")
+from backend.admission import AdmissionController, AdmissionRejected, FanoutPermit, TokenBucket
+from backend.cache import ResultCache, TwoTierCache
+from backend.cache_backends import create_backend
+from backend.cache_snapshot import load_snapshot, save_snapshot, snapshot_periodically
+from backend.conditional import ConditionalResponder, EncodedBodyCache, content_hash
+from src.mcp.config import load_config
+from backend.singleflight import SingleFlight
+from backend.http_pool import HTTPPool
+from backend.snapshot_store import SnapshotStore, watch_snapshots
+from backend.region_resolver import RegionResolver, Region
+from src.mcp.json_response import FastJSONResponse, dumps
+from backend.metrics import MetricsRegistry, MetricsMiddleware, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from backend.prewarm import SpaceSaving, PrewarmScheduler
+from backend.stats import SearchStats
+from backend.result_sets import ResultSet, ResultSetStore, InvalidCursorError, SORT_OPTIONS, encode_cursor
+
+# 공유 HTTP 커넥션 풀
+http_pool = HTTPPool(
+    limit=int(os.getenv("HTTP_POOL_LIMIT", "100")),
+    limit_per_host=int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20")),
+    dns_ttl=int(os.getenv("HTTP_DNS_TTL", "300")),
+    keepalive_timeout=float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30")),
+    total_timeout=float(os.getenv("HTTP_TOTAL_TIMEOUT", "10")),
+    connect_timeout=float(os.getenv("HTTP_CONNECT_TIMEOUT", "3"))
+)
+
+# 다방/KB 로컬 스냅샷 (scripts/collectors 수집기 결과 파일)
+PROJECT_ROOT = Path(__file__).parent.parent
+SNAPSHOT_DIRS = [
+    Path(d) for d in os.getenv(
+        "SNAPSHOT_DIRS",
+        os.pathsep.join(str(PROJECT_ROOT / d) for d in ("data/raw", "data/processed", "."))
+    ).split(os.pathsep)
+]
+SNAPSHOT_POLL_INTERVAL = float(os.getenv("SNAPSHOT_POLL_INTERVAL", "30"))
+
+snapshot_stores = {
+    "dabang": SnapshotStore("dabang", "dabang_*.json", SNAPSHOT_DIRS),
+    "kb": SnapshotStore("kb", "kb_*.json", SNAPSHOT_DIRS)
+}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 라이프사이클 관리"""
+    # 시작
+    await http_pool.start()
+    snapshot_saver = None
+    if CACHE_SNAPSHOT_PATH:
+        restored = load_snapshot(cache.l1, CACHE_SNAPSHOT_PATH)
+        print(f"캐시 스냅샷 복원: {restored}개")
+        snapshot_saver = asyncio.create_task(
+            snapshot_periodically(cache.l1, CACHE_SNAPSHOT_PATH, CACHE_SNAPSHOT_INTERVAL)
+        )
+    for store in snapshot_stores.values():
+        await store.refresh()
+    snapshot_watcher = asyncio.create_task(
+        watch_snapshots(list(snapshot_stores.values()), SNAPSHOT_POLL_INTERVAL)
+    )
+    prewarm_task = asyncio.create_task(prewarm.run()) if PREWARM_ENABLED else None
+    yield
+    # 종료
+    snapshot_watcher.cancel()
+    if prewarm_task is not None:
+        prewarm_task.cancel()
+    if snapshot_saver is not None:
+        # 주기 저장 루프를 멈춘 뒤 마지막 저장 (실행 중인 executor 쓰기는 쓰기 락이 끝날 때까지 대기)
+        snapshot_saver.cancel()
+        await asyncio.gather(snapshot_saver, return_exceptions=True)
+        try:
+            save_snapshot(cache.l1, CACHE_SNAPSHOT_PATH)
+        except OSError as e:
+            print(f"캐시 스냅샷 저장 오류: {e}")
+    await cache.close()
+    for store in snapshot_stores.values():
+        store.close()
+    await http_pool.close()
+
+# 고속 JSON 응답 (orjson 직렬화, 검색 응답은 jsonable_encoder 생략) - FAST_JSON=1로 활성화
+FAST_JSON = os.getenv("FAST_JSON", "0") == "1"
+
+app = FastAPI(
+    title="부동산 실시간 검색 API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse if FAST_JSON else JSONResponse
+)
+
+def respond(content: Dict, headers: Optional[Dict[str, str]] = None) -> Any:
+    """검색 응답 반환 (고속 모드에서는 직렬화된 응답을 바로 반환)"""
+    if FAST_JSON:
+        return FastJSONResponse(content, headers=headers)
+    return JSONResponse(content, headers=headers) if headers else content
+
+# 실시간 검색 조건부 응답 (ETag → 304, 일정 크기 이상 gzip/brotli 압축)
+conditional = ConditionalResponder(
+    min_size=int(os.getenv("COMPRESS_MIN_SIZE", "1024")),
+    body_cache=EncodedBodyCache(
+        max_entries=int(os.getenv("ENCODED_BODY_CACHE_MAX", "256")),
+        max_bytes=int(os.getenv("ENCODED_BODY_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    )
+)
+
+# 조회할 때마다 바뀌는 매물 필드 (ETag 계산에서 제외)
+VOLATILE_PROPERTY_FIELDS = frozenset({"collected_at"})
+
+def content_etag(properties: List[Dict], total: int, errors: Optional[List[str]],
+                 timed_out: Optional[List[str]]) -> str:
+    """검색 결과 ETag (내용 필드만 해시, 시각/핸들/통계 소요 시간과 매물 수집 시각은 제외)"""
+    return content_hash({
+        "properties": [
+            {k: v for k, v in prop.items() if k not in VOLATILE_PROPERTY_FIELDS}
+            for prop in properties
+        ],
+        "totalCount": total,
+        "errors": errors or None,
+        "timedOut": timed_out or []
+    })
+
+def result_etag(result: Dict) -> str:
+    """검색 결과 ETag (이전 버전 캐시 항목은 첫 페이지 기준으로 즉시 계산)"""
+    return result.get("etag") or content_etag(
+        result.get("properties") or [], result.get("totalCount", 0),
+        result.get("errors"), result.get("timedOut")
+    )
+
+# Prometheus 메트릭 (/metrics)
+metrics = MetricsRegistry(prefix="realestate_")
+http_request_latency = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency by endpoint", ("endpoint",)
+)
+http_requests_total = metrics.counter(
+    "http_requests_total", "HTTP requests by endpoint, method and status", ("endpoint", "method", "status")
+)
+http_inflight = metrics.gauge("http_requests_in_flight", "HTTP requests currently being served")
+
+app.add_middleware(
+    MetricsMiddleware,
+    latency=http_request_latency,
+    requests=http_requests_total,
+    inflight=http_inflight
+)
 
 # CORS 설정
 app.add_middleware(
@@ -24,36 +170,143 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Cache"],  # 다른 출처의 대시보드도 조건부 요청/캐시 여부 확인
 )
 
-# 캐시 저장소 (메모리)
-cache = {}
+# 캐시 저장소 (메모리, LRU + TTL)
 CACHE_DURATION = timedelta(minutes=5)  # 5분 캐시
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1000"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # 64MB
+# 만료 후 stale 응답 허용 시간 (0이면 stale 응답 비활성)
+CACHE_STALE_GRACE = timedelta(seconds=int(os.getenv("CACHE_STALE_GRACE", "600")))
 
-def is_cache_valid(cache_key: str) -> bool:
-    """캐시 유효성 검사"""
-    if cache_key not in cache:
-        return False
-    
-    cached_data = cache[cache_key]
-    if datetime.now() - cached_data['timestamp'] > CACHE_DURATION:
-        return False
-    
-    return True
+# config/mcp_config.yaml 설정
+config = load_config()
 
-async def search_naver_realtime(address: str) -> List[Dict]:
-    """네이버 부동산 실시간 검색"""
+# 워커 간 공유 L2 캐시 (cache 설정, CACHE_L2_BACKEND로 재정의)
+cache_config = config.get("cache", {})
+if os.getenv("CACHE_L2_BACKEND"):
+    cache_config["type"] = os.getenv("CACHE_L2_BACKEND")
+if cache_config.get("path"):
+    cache_config["path"] = str(PROJECT_ROOT / cache_config["path"])
+
+try:
+    l2_backend = create_backend(cache_config)
+except (ImportError, ValueError) as e:
+    print(f"L2 캐시 비활성화: {e}")
+    l2_backend = None
+
+cache = TwoTierCache(
+    l1=ResultCache(
+        max_entries=CACHE_MAX_ENTRIES,
+        max_bytes=CACHE_MAX_BYTES,
+        ttl=CACHE_DURATION.total_seconds(),
+        grace=CACHE_STALE_GRACE.total_seconds()
+    ),
+    l2=l2_backend,
+    negative_ttl=float(cache_config.get("negative_ttl", 60)),
+    is_negative=lambda result: not result.get("totalCount")
+)
+
+# 재시작 시 L1 캐시 복원용 스냅샷 (빈 값이면 비활성, 종료 시에도 저장)
+CACHE_SNAPSHOT_PATH = os.getenv(
+    "CACHE_SNAPSHOT_PATH", str(PROJECT_ROOT / "data" / "processed" / "backend_cache.snapshot")
+)
+CACHE_SNAPSHOT_INTERVAL = float(os.getenv("CACHE_SNAPSHOT_INTERVAL", "60"))
+
+# 병합된 전체 검색 결과 (커서 페이지네이션용, 캐시된 응답보다 오래 유지)
+RESULT_PAGE_SIZE = 100
+# 공유 캐시에 보관하는 결과 집합 키
+RESULT_SET_KEY = "resultset:{}"
+result_sets = ResultSetStore(
+    max_sets=int(os.getenv("RESULT_SET_MAX", str(CACHE_MAX_ENTRIES))),
+    ttl=(CACHE_DURATION + CACHE_STALE_GRACE).total_seconds()
+)
+
+# 동일 검색 요청 병합
+search_flight = SingleFlight()
+
+# 클라이언트별 업스트림 검색 제한과 동시 검색 상한 (admission 설정)
+admission = AdmissionController.from_config(config.get("admission", {}))
+
+# 인기 검색 캐시 미리 갱신 (prewarm 설정, 업스트림 예산의 budget_share만 사용)
+prewarm_config = config.get("prewarm", {})
+PREWARM_ENABLED = os.getenv("PREWARM_ENABLED", str(prewarm_config.get("enabled", True))).lower() in ("1", "true")
+prewarm_rate = float(prewarm_config.get("upstream_rate", 4)) * float(prewarm_config.get("budget_share", 0.25))
+prewarm_interval = float(prewarm_config.get("interval", 5))
+search_popularity = SpaceSaving(capacity=int(prewarm_config.get("sketch_size", 512)))
+prewarm = PrewarmScheduler(
+    search_popularity,
+    cache,
+    refresh=lambda key, request: refresh_realtime_result(*request, key),
+    budget=TokenBucket(prewarm_rate, max(1.0, prewarm_rate * prewarm_interval)),
+    top_k=int(prewarm_config.get("top_k", 50)),
+    lead_time=float(prewarm_config.get("lead_time", 30)),
+    min_count=float(prewarm_config.get("min_hits", 3)),
+    interval=prewarm_interval,
+    decay_interval=float(prewarm_config.get("decay_interval", 300)),
+    is_busy=search_flight.is_inflight
+)
+
+# 검색 응답 대기 예산 (초, 요청별 timeout 파라미터로 조정)
+SEARCH_DEADLINE = float(os.getenv("SEARCH_DEADLINE", "5"))
+SEARCH_DEADLINE_MAX = float(os.getenv("SEARCH_DEADLINE_MAX", "30"))
+# 플랫폼별 최대 대기 시간 (초, 요청 예산보다 짧으면 우선 적용)
+PLATFORM_DEADLINES = {
+    "naver": float(os.getenv("NAVER_DEADLINE", "8")),
+    "zigbang": float(os.getenv("ZIGBANG_DEADLINE", "8")),
+    "dabang": float(os.getenv("DABANG_DEADLINE", "1")),
+    "kb": float(os.getenv("KB_DEADLINE", "1"))
+}
+
+# 업스트림 API 주소 (로컬 대역 서버로 벤치마크할 때 환경 변수로 덮어쓰기)
+NAVER_MOBILE_BASE_URL = os.getenv("NAVER_MOBILE_BASE_URL", "https://m.land.naver.com").rstrip("/")
+ZIGBANG_BASE_URL = os.getenv("ZIGBANG_BASE_URL", "https://apis.zigbang.com").rstrip("/")
+
+# 일괄 검색 최대 주소 수와 지역 동시 조회 수
+BATCH_MAX_ADDRESSES = int(os.getenv("BATCH_MAX_ADDRESSES", "200"))
+BATCH_REGION_CONCURRENCY = int(os.getenv("BATCH_REGION_CONCURRENCY", "4"))
+
+# 응답 이후에도 진행되는 백그라운드 작업 (GC 방지용 참조)
+background_jobs = set()
+
+# 주소 → 지역 코드/영역/geohash 해석기
+region_resolver = RegionResolver.from_files(
+    PROJECT_ROOT / "data" / "korea-regions.js",
+    PROJECT_ROOT / "data" / "region_centroids.json"
+)
+# 해석되지 않는 주소의 기본 검색 지역
+DEFAULT_REGION = region_resolver.resolve("서울 강남구 삼성동")
+
+def resolve_region(address: str) -> Region:
+    """검색 지역 해석 (실패 시 기본 지역)"""
+    return region_resolver.resolve(address) or DEFAULT_REGION
+
+def filter_by_address(properties: List[Dict], address: str) -> List[Dict]:
+    """주소가 포함된 매물만 선택"""
+    keyword = address.lower()
+    return [p for p in properties if keyword in p.get('address', '').lower()]
+
+async def fetch_naver_region(region: Region) -> List[Dict]:
+    """네이버 부동산 지역 매물 조회 (주소 필터링 전)"""
     properties = []
     
     try:
         # 네이버 부동산 모바일 API
-        url = "https://m.land.naver.com/cluster/ajax/articleList"
+        url = f"{NAVER_MOBILE_BASE_URL}/cluster/ajax/articleList"
         
+        bbox = region.bbox
         params = {
             "rletTpCd": "APT:OPST:VL:DDDGG:OR",  # 모든 매물 타입
             "tradTpCd": "A1:B1:B2:B3",  # 모든 거래 타입
             "z": 15,
-            "cortarNo": "1168010800",  # 강남구 삼성동 코드
+            "cortarNo": region.cortar_no,  # 주소에서 해석한 지역 코드
+            "lat": region.lat,
+            "lon": region.lng,
+            "btm": bbox["bottom"],
+            "lft": bbox["left"],
+            "top": bbox["top"],
+            "rgt": bbox["right"],
             "page": 1
         }
         
@@ -62,48 +315,48 @@ async def search_naver_realtime(address: str) -> List[Dict]:
             'Referer': 'https://m.land.naver.com/'
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
+        session = http_pool.session
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status != 200:
+                upstream_errors.labels("naver", "status").inc()
+            else:
+                data = await response.json()
                     
-                    for item in data.get('body', [])[:20]:  # 상위 20개만
-                        property_info = {
-                            'id': f"NAVER_{item.get('atclNo', '')}",
-                            'platform': 'naver',
-                            'title': item.get('atclNm', ''),
-                            'address': f"서울 강남구 삼성동 {item.get('bildNm', '')}",
-                            'price': int(item.get('prc', 0).replace(',', '') if isinstance(item.get('prc'), str) else item.get('prc', 0)),
-                            'area': item.get('spc1', 0),
-                            'floor': f"{item.get('flrInfo', '')}",
-                            'type': item.get('rletTpNm', ''),
-                            'trade_type': item.get('tradTpNm', ''),
-                            'lat': item.get('lat', 0),
-                            'lng': item.get('lng', 0),
-                            'description': item.get('atclFetrDesc', ''),
-                            'url': f"https://m.land.naver.com/article/info/{item.get('atclNo', '')}",
-                            'collected_at': datetime.now().isoformat()
-                        }
-                        
-                        # 주소 필터링
-                        if address.lower() in property_info['address'].lower():
-                            properties.append(property_info)
+                for item in data.get('body', [])[:20]:  # 상위 20개만
+                    property_info = {
+                        'id': f"NAVER_{item.get('atclNo', '')}",
+                        'platform': 'naver',
+                        'title': item.get('atclNm', ''),
+                        'address': f"{region.display_name} {item.get('bildNm', '')}",
+                        'price': int(item.get('prc', 0).replace(',', '') if isinstance(item.get('prc'), str) else item.get('prc', 0)),
+                        'area': item.get('spc1', 0),
+                        'floor': f"{item.get('flrInfo', '')}",
+                        'type': item.get('rletTpNm', ''),
+                        'trade_type': item.get('tradTpNm', ''),
+                        'lat': item.get('lat', 0),
+                        'lng': item.get('lng', 0),
+                        'description': item.get('atclFetrDesc', ''),
+                        'url': f"https://m.land.naver.com/article/info/{item.get('atclNo', '')}",
+                        'collected_at': datetime.now().isoformat()
+                    }
+                    properties.append(property_info)
     except Exception as e:
+        upstream_errors.labels("naver", "exception").inc()
         print(f"네이버 검색 오류: {e}")
     
     return properties
 
-async def search_zigbang_realtime(address: str) -> List[Dict]:
-    """직방 실시간 검색"""
+async def fetch_zigbang_region(region: Region) -> List[Dict]:
+    """직방 지역 매물 조회 (주소 필터링 전)"""
     properties = []
     
     try:
         # 직방 API
-        url = "https://apis.zigbang.com/v2/items"
+        url = f"{ZIGBANG_BASE_URL}/v2/items"
         
         params = {
             'domain': 'zigbang',
-            'geohash': 'wydm6',  # 삼성동 지역 해시
+            'geohash': region.geohash,  # 주소에서 해석한 지역 해시
             'zoom': 15,
             'item_ids': '',
             'sales_type': 'deposit|jeonse|monthly',
@@ -115,37 +368,132 @@ async def search_zigbang_realtime(address: str) -> List[Dict]:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
+        session = http_pool.session
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status != 200:
+                upstream_errors.labels("zigbang", "status").inc()
+            else:
+                data = await response.json()
                     
-                    for item in data.get('items', [])[:20]:
-                        property_info = {
-                            'id': f"ZIGBANG_{item.get('item_id', '')}",
-                            'platform': 'zigbang',
-                            'title': item.get('title', ''),
-                            'address': item.get('address', ''),
-                            'price': item.get('보증금', 0) // 10000 if item.get('보증금') else 0,
-                            'area': item.get('전용면적', 0),
-                            'floor': item.get('floor', ''),
-                            'type': item.get('building_type', ''),
-                            'trade_type': item.get('sales_type', ''),
-                            'monthly_rent': item.get('월세', 0),
-                            'lat': item.get('lat', 0),
-                            'lng': item.get('lng', 0),
-                            'description': item.get('description', ''),
-                            'url': f"https://zigbang.com/home/oneroom/{item.get('item_id', '')}",
-                            'collected_at': datetime.now().isoformat()
-                        }
-                        
-                        if address.lower() in property_info.get('address', '').lower():
-                            properties.append(property_info)
+                for item in data.get('items', [])[:20]:
+                    property_info = {
+                        'id': f"ZIGBANG_{item.get('item_id', '')}",
+                        'platform': 'zigbang',
+                        'title': item.get('title', ''),
+                        'address': item.get('address', ''),
+                        'price': item.get('보증금', 0) // 10000 if item.get('보증금') else 0,
+                        'area': item.get('전용면적', 0),
+                        'floor': item.get('floor', ''),
+                        'type': item.get('building_type', ''),
+                        'trade_type': item.get('sales_type', ''),
+                        'monthly_rent': item.get('월세', 0),
+                        'lat': item.get('lat', 0),
+                        'lng': item.get('lng', 0),
+                        'description': item.get('description', ''),
+                        'url': f"https://zigbang.com/home/oneroom/{item.get('item_id', '')}",
+                        'collected_at': datetime.now().isoformat()
+                    }
+                    properties.append(property_info)
     except Exception as e:
+        upstream_errors.labels("zigbang", "exception").inc()
         print(f"직방 검색 오류: {e}")
     
     return properties
 
+# 지역 단위로 조회하는 업스트림 플랫폼
+REGION_FETCHERS = {
+    "naver": fetch_naver_region,
+    "zigbang": fetch_zigbang_region
+}
+
+# 같은 지역의 동시 조회 병합 (주소가 달라도 지역이 같으면 업스트림 호출 1회)
+region_flight = SingleFlight()
+
+async def fetch_region(platform: str, region: Region) -> List[Dict]:
+    """플랫폼 지역 매물 조회 (진행 중인 같은 지역 조회와 결과 공유)"""
+    return await region_flight.do(
+        f"{platform}:{region.display_name}", lambda: REGION_FETCHERS[platform](region)
+    )
+
+async def search_naver_realtime(address: str) -> List[Dict]:
+    """네이버 부동산 실시간 검색"""
+    return filter_by_address(await fetch_region("naver", resolve_region(address)), address)
+
+async def search_zigbang_realtime(address: str) -> List[Dict]:
+    """직방 실시간 검색"""
+    return filter_by_address(await fetch_region("zigbang", resolve_region(address)), address)
+
+async def search_dabang_cached(address: str) -> List[Dict]:
+    """다방 캐시된 데이터 검색 (수집기 스냅샷)"""
+    return snapshot_stores["dabang"].search(address)
+
+async def search_kb_cached(address: str) -> List[Dict]:
+    """KB 캐시된 데이터 검색 (수집기 스냅샷)"""
+    return snapshot_stores["kb"].search(address)
+
+# 플랫폼별 검색 함수 (다방과 KB는 기존 수집기 사용)
+PLATFORM_SEARCHERS = {
+    "naver": search_naver_realtime,
+    "zigbang": search_zigbang_realtime,
+    "dabang": search_dabang_cached,
+    "kb": search_kb_cached
+}
+
+def select_platforms(platforms: str) -> List[str]:
+    """플랫폼 선택"""
+    if platforms == "all":
+        return list(PLATFORM_SEARCHERS.keys())
+    return platforms.split(",")
+
+# 플랫폼별 검색 메트릭 (핫 패스에서 라벨 조회를 하지 않도록 미리 생성)
+upstream_latency = metrics.histogram(
+    "upstream_search_duration_seconds", "Platform search latency", ("platform",)
+)
+upstream_inflight = metrics.gauge(
+    "upstream_searches_in_flight", "Platform searches currently running", ("platform",)
+)
+upstream_errors = metrics.counter(
+    "upstream_errors_total", "Platform search errors by kind (status, exception)", ("platform", "kind")
+)
+platform_metrics = {
+    p: (upstream_latency.labels(p), upstream_inflight.labels(p)) for p in PLATFORM_SEARCHERS
+}
+
+async def search_platform(platform: str, address: str) -> List[Dict]:
+    """단일 플랫폼 검색"""
+    return await measure_platform(platform, PLATFORM_SEARCHERS[platform](address))
+
+async def measure_platform(platform: str, search: Awaitable[List[Dict]]) -> List[Dict]:
+    """플랫폼 검색 지연 시간/진행 수/오류 기록"""
+    latency, inflight = platform_metrics[platform]
+    inflight.inc()
+    start = time.perf_counter()
+    try:
+        return await search
+    except Exception:
+        upstream_errors.labels(platform, "exception").inc()
+        raise
+    finally:
+        inflight.dec()
+        latency.observe(time.perf_counter() - start)
+
+def client_id(request: Request) -> str:
+    """
+    요청 제한용 클라이언트 식별자 (접속 IP)
+
+    클라이언트가 보내는 헤더(X-Client-Id 등)는 요청마다 바꿔 한도를 피할 수 있으므로 쓰지 않습니다.
+    """
+    return request.client.host if request.client else "unknown"
+
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected_handler(request: Request, exc: AdmissionRejected):
+    """요청 제한 초과 시 대기 없이 429 응답"""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": exc.reason, "retryAfter": exc.retry_after_header},
+        headers={"Retry-After": exc.retry_after_header}
+    )
+
 @app.get("/")
 async def root():
     """API 상태 확인"""
@@ -166,131 +514,585 @@ async def health():
 
 @app.get("/api/search/realtime")
 async def search_realtime(
+    request: Request,
+    background_tasks: BackgroundTasks,
     address: str = Query(..., description="검색할 주소"),
-    platforms: str = Query("all", description="플랫폼 선택 (all, naver, zigbang, dabang, kb)")
+    platforms: str = Query("all", description="플랫폼 선택 (all, naver, zigbang, dabang, kb)"),
+    allow_stale: bool = Query(True, description="만료된 캐시를 즉시 반환하고 백그라운드에서 갱신"),
+    timeout: Optional[float] = Query(None, gt=0, le=SEARCH_DEADLINE_MAX, description="응답 대기 예산 (초)")
 ):
     """
     실시간 부동산 매물 검색
     
     - **address**: 검색할 주소 (예: "삼성동 151-7")
     - **platforms**: 검색할 플랫폼 (기본값: all)
+    - **allow_stale**: stale 응답 허용 여부 (기본값: true)
+    - **timeout**: 응답 대기 예산 (기본값: SEARCH_DEADLINE). 시간 내 끝난 플랫폼만 반환하고
+      나머지는 timedOut에 표시합니다.
+    
+    업스트림 검색이 필요한 요청이 클라이언트별 제한이나 동시 검색 상한을 넘으면
+    429와 Retry-After 헤더로 응답합니다.
+    
+    응답에는 ETag가 붙으며, If-None-Match가 일치하면 본문 없이 304로 응답합니다.
+    ETag는 결과 내용만으로 정해지므로 캐시/갱신 여부와 관계없이 같은 내용이면 같습니다.
+    캐시 사용 여부는 본문의 cached/stale 필드와 X-Cache 헤더(HIT, STALE, MISS)로 알려줍니다.
+    COMPRESS_MIN_SIZE 이상인 본문은 Accept-Encoding에 따라 brotli 또는 gzip으로 압축합니다.
     """
     
     # 캐시 키 생성
     cache_key = f"{address}_{platforms}"
+    search_popularity.record(cache_key, (address, platforms))
     
     # 캐시 확인
-    if is_cache_valid(cache_key):
-        cached_result = cache[cache_key]
-        cached_result['cached'] = True
-        return cached_result['data']
+    if allow_stale:
+        cached_result, stale = await cache.get_with_state(cache_key)
+    else:
+        cached_result, stale = await cache.get(cache_key), False
+    
+    if cached_result is not None:
+        if stale:
+            # 만료된 결과는 즉시 반환하고 응답 후 갱신
+            background_tasks.add_task(refresh_realtime_result, address, platforms, cache_key)
+        variant = "STALE" if stale else "HIT"
+        return conditional.respond(
+            request, {**cached_result, "cached": True, "stale": stale}, result_etag(cached_result),
+            body_key=f"{cached_result.get('timestamp')}|{variant}",
+            headers={"X-Cache": variant}
+        )
+    
+    # 진행 중인 검색에 합류하는 요청은 업스트림 비용이 없으므로 제한하지 않음
+    if not search_flight.is_inflight(cache_key):
+        admission.admit(client_id(request), select_platforms(platforms))
+    
+    # 동일 키의 동시 요청은 하나의 업스트림 검색을 공유
+    budget = timeout or SEARCH_DEADLINE
+    result = await search_flight.do(
+        cache_key, lambda: fetch_realtime_result(address, platforms, cache_key, budget)
+    )
+    return conditional.respond(
+        request, result, result_etag(result),
+        body_key=f"{result.get('timestamp')}|MISS", headers={"X-Cache": "MISS"}
+    )
+
+async def fetch_realtime_result(address: str, platforms: str, cache_key: str,
+                                budget: Optional[float] = None) -> Dict:
+    """
+    플랫폼 병렬 검색 후 결과 통합 및 캐시 저장
+    
+    budget이 주어지면 플랫폼별 마감 시간까지 끝난 결과만 반환하고, 늦은 플랫폼은
+    백그라운드에서 마저 기다린 뒤 전체 결과로 캐시를 채웁니다.
+    budget이 None이면 모든 플랫폼을 기다립니다.
+    """
     
     # 플랫폼 선택
-    selected_platforms = []
-    if platforms == "all":
-        selected_platforms = ["naver", "zigbang", "dabang", "kb"]
-    else:
-        selected_platforms = platforms.split(",")
+    selected_platforms = select_platforms(platforms)
+    searchable = [p for p in selected_platforms if p in PLATFORM_SEARCHERS]
+    
+    # 동시 검색 상한 확인 (늦은 플랫폼까지 모두 끝나면 슬롯 반환)
+    permit = admission.acquire_fanout(searchable)
     
     # 병렬로 모든 플랫폼 검색
-    tasks = []
+    tasks = {p: asyncio.ensure_future(search_platform(p, address)) for p in searchable}
+    asyncio.gather(*tasks.values(), return_exceptions=True).add_done_callback(permit.release)
+    
+    if budget is None:
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        late_tasks = {}
+    else:
+        late_tasks = await wait_with_deadlines(tasks, budget)
     
-    if "naver" in selected_platforms:
-        tasks.append(search_naver_realtime(address))
+    finished = {p: t for p, t in tasks.items() if p not in late_tasks}
+    all_properties, errors = merge_platform_results(finished)
     
-    if "zigbang" in selected_platforms:
-        tasks.append(search_zigbang_realtime(address))
+    # 통계 계산
+    stats = SearchStats()
+    stats.add(all_properties)
+    
+    result = build_realtime_result(address, selected_platforms, all_properties, stats, errors,
+                                   timed_out=list(late_tasks))
     
-    # 다방과 KB는 기존 수집기 사용
-    if "dabang" in selected_platforms:
-        tasks.append(search_dabang_cached(address))
+    if late_tasks:
+        # 부분 결과는 캐시하지 않고, 늦은 플랫폼까지 끝나면 전체 결과로 캐시
+        job = asyncio.ensure_future(
+            cache_late_result(address, selected_platforms, cache_key, tasks)
+        )
+        background_jobs.add(job)
+        job.add_done_callback(background_jobs.discard)
+    else:
+        # 캐시 저장
+        await cache_result(cache_key, result, all_properties)
     
-    if "kb" in selected_platforms:
-        tasks.append(search_kb_cached(address))
+    return result
+
+async def wait_with_deadlines(tasks: Dict[str, asyncio.Task], budget: float) -> Dict[str, asyncio.Task]:
+    """플랫폼별 마감 시간까지 대기 후 끝나지 않은 작업 반환"""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    deadlines = {
+        task: start + min(budget, PLATFORM_DEADLINES.get(platform, budget))
+        for platform, task in tasks.items()
+    }
     
-    # 모든 플랫폼 결과 수집
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    pending = set(tasks.values())
+    timed_out = set()
+    while pending:
+        next_deadline = min(deadlines[t] for t in pending)
+        _, pending = await asyncio.wait(
+            pending,
+            timeout=max(0, next_deadline - loop.time()),
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        now = loop.time()
+        expired = {t for t in pending if deadlines[t] <= now}
+        timed_out |= expired
+        pending -= expired
     
-    # 결과 통합
+    return {p: t for p, t in tasks.items() if t in timed_out}
+
+def merge_platform_results(tasks: Dict[str, asyncio.Task]):
+    """완료된 플랫폼 작업의 매물과 오류 통합"""
     all_properties = []
     errors = []
     
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            errors.append(str(result))
-        elif isinstance(result, list):
-            all_properties.extend(result)
+    for task in tasks.values():
+        if task.cancelled():
+            continue
+        if task.exception() is not None:
+            errors.append(str(task.exception()))
+        elif isinstance(task.result(), list):
+            all_properties.extend(task.result())
     
-    # 통계 계산
-    stats = {
-        "byPlatform": {},
-        "byType": {},
-        "priceRange": {
-            "min": None,
-            "max": None,
-            "avg": None
-        }
-    }
+    return all_properties, errors
+
+async def cache_late_result(address: str, selected_platforms: List[str], cache_key: str,
+                            tasks: Dict[str, asyncio.Task]):
+    """늦은 플랫폼까지 기다린 뒤 전체 결과 캐시"""
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
     
-    if all_properties:
-        # 플랫폼별 집계
-        for prop in all_properties:
-            platform = prop.get('platform', 'unknown')
-            stats['byPlatform'][platform] = stats['byPlatform'].get(platform, 0) + 1
-            
-            prop_type = prop.get('type', 'unknown')
-            stats['byType'][prop_type] = stats['byType'].get(prop_type, 0) + 1
-        
-        # 가격 통계
-        prices = [p['price'] for p in all_properties if p.get('price', 0) > 0]
-        if prices:
-            stats['priceRange'] = {
-                "min": min(prices),
-                "max": max(prices),
-                "avg": sum(prices) / len(prices)
-            }
-    
-    result = {
+    all_properties, errors = merge_platform_results(tasks)
+    stats = SearchStats()
+    stats.add(all_properties)
+    
+    result = build_realtime_result(address, selected_platforms, all_properties, stats, errors)
+    await cache_result(cache_key, result, all_properties)
+
+async def cache_result(cache_key: str, result: Dict, all_properties: List[Dict]):
+    """
+    검색 결과와 결과 집합(전체 매물) 캐시 저장
+
+    결과 집합도 공유 캐시(L2, 스냅샷)에 두어 다른 워커나 재시작 후에도 resultHandle로
+    페이지를 조회할 수 있게 합니다.
+    """
+    await cache.set(
+        RESULT_SET_KEY.format(result["resultHandle"]),
+        {"totalCount": len(all_properties), "properties": all_properties}
+    )
+    await cache.set(cache_key, result)
+
+async def load_result_set(handle: str) -> Optional[ResultSet]:
+    """결과 집합 조회 (이 워커에 없으면 공유 캐시에서 복원)"""
+    result_set = result_sets.get(handle)
+    if result_set is None:
+        shared, _ = await cache.get_with_state(RESULT_SET_KEY.format(handle))
+        if shared is not None:
+            result_sets.create(shared["properties"], handle=handle)
+            result_set = result_sets.get(handle)
+    return result_set
+
+def build_realtime_result(address: str, selected_platforms: List[str], all_properties: List[Dict],
+                          stats: SearchStats, errors: List[str],
+                          timed_out: Optional[List[str]] = None) -> Dict:
+    """
+    검색 응답 생성 (전체 결과는 결과 집합으로 보관하고 첫 페이지만 포함)
+    
+    etag는 전체 매물(수집 시각 제외), 건수, 오류, 시간 초과 플랫폼의 내용 해시로, 캐시에 함께
+    저장되어 조건부 응답에 사용됩니다. 같은 내용을 다시 조회하면 etag와 결과 핸들이 그대로입니다.
+    """
+    total = len(all_properties)
+    etag = content_etag(all_properties, total, errors, timed_out)
+    return {
         "query": address,
         "platforms": selected_platforms,
-        "totalCount": len(all_properties),
-        "properties": all_properties[:100],  # 최대 100개
-        "stats": stats,
+        "totalCount": total,
+        "properties": all_properties[:RESULT_PAGE_SIZE],
+        "resultHandle": result_sets.create(all_properties, handle=etag),
+        "nextCursor": encode_cursor("default", RESULT_PAGE_SIZE) if total > RESULT_PAGE_SIZE else None,
+        "stats": stats.to_dict(),
         "cached": False,
+        "stale": False,
         "timestamp": datetime.now().isoformat(),
-        "errors": errors if errors else None
+        "errors": errors if errors else None,
+        "timedOut": timed_out or [],
+        "etag": etag
     }
+
+async def refresh_realtime_result(address: str, platforms: str, cache_key: str):
+    """stale 캐시 백그라운드 갱신"""
+    # 이미 갱신 중이면 중복 실행하지 않음
+    if search_flight.is_inflight(cache_key):
+        return
     
-    # 캐시 저장
-    cache[cache_key] = {
-        'data': result,
-        'timestamp': datetime.now()
-    }
+    try:
+        await search_flight.do(
+            cache_key, lambda: fetch_realtime_result(address, platforms, cache_key)
+        )
+    except Exception as e:
+        print(f"캐시 갱신 오류 ({cache_key}): {e}")
+
+@app.get("/api/search/results/{handle}")
+async def search_results_page(
+    handle: str,
+    cursor: Optional[str] = Query(None, description="이전 페이지의 nextCursor"),
+    limit: int = Query(20, ge=1, le=RESULT_PAGE_SIZE, description="페이지 크기"),
+    sort: Optional[str] = Query(None, description=f"정렬 ({', '.join(SORT_OPTIONS)})")
+):
+    """
+    검색 결과 페이지 조회
     
-    return result
+    실시간 검색 응답의 resultHandle로 저장된 전체 결과를 업스트림 재검색 없이 페이지 단위로 조회합니다.
+    다른 워커가 만든 핸들이나 재시작 전의 핸들도 캐시 유효 기간 동안은 공유 캐시에서 복원합니다.
+    
+    - **cursor**: 다음 페이지 커서 (없으면 첫 페이지)
+    - **sort**: 정렬 옵션 (커서를 이어서 쓸 때는 생략)
+    """
+    await load_result_set(handle)
+    try:
+        page = result_sets.page(handle, cursor=cursor, limit=limit, sort=sort)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if page is None:
+        raise HTTPException(status_code=404, detail="Result set not found or expired")
+    
+    return respond(page)
 
-async def search_dabang_cached(address: str) -> List[Dict]:
-    """다방 캐시된 데이터 검색"""
-    # 임시로 빈 리스트 반환 (실제로는 기존 수집기 사용)
-    return []
+class BatchSearchRequest(BaseModel):
+    """일괄 검색 요청"""
+    addresses: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_ADDRESSES, description="검색할 주소 목록")
+    platforms: str = Field("all", description="플랫폼 선택 (all, naver, zigbang, dabang, kb)")
 
-async def search_kb_cached(address: str) -> List[Dict]:
-    """KB 캐시된 데이터 검색"""
-    # 임시로 빈 리스트 반환 (실제로는 기존 수집기 사용)
-    return []
+@app.post("/api/search/batch")
+async def search_batch(request: Request, batch: BatchSearchRequest):
+    """
+    여러 주소 일괄 검색
+    
+    캐시에 없는 주소는 해석된 지역별로 묶어 업스트림(네이버, 직방)을 지역당 한 번만 조회한 뒤
+    주소별로 메모리에서 필터링합니다. 주소별 결과는 실시간 검색과 같은 형식이며 캐시에도 저장되고,
+    stats는 전체 주소의 매물(중복 제외)에 대한 통계입니다.
+    
+    조회할 지역 수만큼 클라이언트 검색 한도를 차감합니다. 캐시에 없는 지역이 남은 한도보다 많으면
+    한도만큼의 지역만 조회하고, 나머지 지역의 주소는 deferred 항목(retryAfter 포함)으로 돌려주며
+    Retry-After 헤더를 붙입니다. 같은 요청을 다시 보내면 조회한 주소는 캐시에서 응답합니다.
+    남은 한도가 없으면 429로 응답합니다.
+    """
+    selected_platforms = select_platforms(batch.platforms)
+    searchable = [p for p in selected_platforms if p in PLATFORM_SEARCHERS]
+    upstream = [p for p in searchable if p in REGION_FETCHERS]
+    local = [p for p in searchable if p not in REGION_FETCHERS]
+    addresses = list(dict.fromkeys(a.strip() for a in batch.addresses if a.strip()))
+    
+    results: Dict[str, Dict] = {}
+    pending: Dict[str, Region] = {}
+    deferred: Dict[str, Region] = {}
+    for address in addresses:
+        cache_key = f"{address}_{batch.platforms}"
+        search_popularity.record(cache_key, (address, batch.platforms))
+        cached_result = await cache.get(cache_key)
+        if cached_result is not None:
+            results[address] = {**cached_result, "cached": True}
+        else:
+            pending[address] = resolve_region(address)
+    
+    # 캐시에 없는 주소를 지역별로 묶어 지역당 한 번만 업스트림 조회
+    regions = {region.display_name: region for region in pending.values()}
+    region_results: Dict[tuple, Any] = {}
+    retry_after = 0.0
+    if regions and upstream:
+        # 남은 한도만큼의 지역만 지금 조회하고 나머지 지역의 주소는 미룸
+        granted, retry_after = admission.admit_partial(client_id(request), upstream, len(regions))
+        if granted < len(regions):
+            regions = dict(list(regions.items())[:granted])
+            for address in [a for a, r in pending.items() if r.display_name not in regions]:
+                deferred[address] = pending.pop(address)
+        # 동시에 조회하는 지역마다 업스트림 검색 슬롯 하나 (단건 검색과 같은 기준)
+        permits = admission.acquire_fanouts(upstream, min(BATCH_REGION_CONCURRENCY, len(regions)))
+        semaphore = asyncio.Semaphore(len(permits))
+        
+        async def fetch(region: Region) -> List[Any]:
+            async with semaphore:
+                return await asyncio.gather(
+                    *(measure_platform(p, fetch_region(p, region)) for p in upstream),
+                    return_exceptions=True
+                )
+        
+        try:
+            outcomes = await asyncio.gather(*(fetch(region) for region in regions.values()))
+        finally:
+            for permit in permits:
+                permit.release()
+        region_results = {
+            (platform, name): outcome
+            for name, region_outcomes in zip(regions, outcomes)
+            for platform, outcome in zip(upstream, region_outcomes)
+        }
+    
+    for address, region in pending.items():
+        properties, errors = [], []
+        for platform in upstream:
+            outcome = region_results[(platform, region.display_name)]
+            if isinstance(outcome, BaseException):
+                errors.append(str(outcome))
+            else:
+                properties.extend(filter_by_address(outcome, address))
+        for platform in local:
+            try:
+                properties.extend(await search_platform(platform, address))
+            except Exception as e:
+                errors.append(str(e))
+        
+        stats = SearchStats()
+        stats.add(properties)
+        result = build_realtime_result(address, selected_platforms, properties, stats, errors)
+        await cache_result(f"{address}_{batch.platforms}", result, properties)
+        results[address] = result
+    
+    # 전체 통계 (여러 주소에 걸친 매물은 한 번만 집계)
+    unique: Dict[str, Dict] = {}
+    for result in results.values():
+        result_set = await load_result_set(result.get("resultHandle") or "")
+        for prop in (result_set.properties if result_set else result["properties"]):
+            unique.setdefault(prop.get("id") or id(prop), prop)
+    shared_stats = SearchStats()
+    shared_stats.add(list(unique.values()))
+    
+    # 한도 때문에 미룬 주소 (다시 요청하면 조회한 주소는 캐시에서 응답)
+    headers = None
+    if deferred:
+        retry_after_header = str(max(1, math.ceil(retry_after)))
+        headers = {"Retry-After": retry_after_header}
+        for address in deferred:
+            results[address] = {"query": address, "deferred": True, "retryAfter": retry_after_header}
+    
+    return respond({
+        "platforms": selected_platforms,
+        "addressCount": len(addresses),
+        "cachedCount": len(addresses) - len(pending) - len(deferred),
+        "deferredCount": len(deferred),
+        "regionCount": len(regions),
+        "upstreamFetches": len(region_results),
+        "totalCount": len(unique),
+        "results": [results[address] for address in addresses],
+        "stats": shared_stats.to_dict(),
+        "timestamp": datetime.now().isoformat()
+    }, headers=headers)
+
+def to_ndjson(event: Dict) -> bytes:
+    """NDJSON 한 줄 직렬화"""
+    return dumps(event) + b"\n"
+
+@app.get("/api/search/realtime/stream")
+async def search_realtime_stream(
+    request: Request,
+    address: str = Query(..., description="검색할 주소"),
+    platforms: str = Query("all", description="플랫폼 선택 (all, naver, zigbang, dabang, kb)")
+):
+    """
+    실시간 부동산 매물 검색 (NDJSON 스트리밍)
+    
+    플랫폼 검색이 끝나는 순서대로 한 줄씩 이벤트를 전송합니다.
+    
+    - **platform**: 플랫폼별 매물과 누적 통계
+    - **error**: 플랫폼 검색 오류
+    - **summary**: 전체 통계 (마지막 이벤트)
+    """
+    cache_key = f"{address}_{platforms}"
+    search_popularity.record(cache_key, (address, platforms))
+    cached_result = await cache.get(cache_key)
+    
+    # 업스트림 검색이 필요하면 스트림 시작 전에 제한 확인
+    permit = None
+    if cached_result is None:
+        selected_platforms = select_platforms(platforms)
+        admission.admit(client_id(request), selected_platforms)
+        permit = admission.acquire_fanout([p for p in selected_platforms if p in PLATFORM_SEARCHERS])
+    
+    events = stream_realtime_events(address, platforms, cache_key, cached_result, permit)
+    if permit is not None:
+        # 클라이언트가 끊겨 스트림이 시작되지도 않은 채 버려져도 슬롯 반환
+        weakref.finalize(events, permit.release)
+    return StreamingResponse(events, media_type="application/x-ndjson")
+
+async def stream_realtime_events(address: str, platforms: str, cache_key: str,
+                                 cached_result: Optional[Dict] = None,
+                                 permit: Optional[FanoutPermit] = None):
+    """
+    플랫폼별 검색 결과 이벤트 생성
+    
+    permit은 플랫폼 검색이 모두 끝나거나 클라이언트 연결이 끊겨 스트림이 닫힐 때 반환합니다
+    (연결이 끊기면 Starlette가 background 작업을 실행하지 않으므로 제너레이터에서 반환).
+    """
+    selected_platforms = select_platforms(platforms)
+    stats = SearchStats()
+    
+    # 캐시된 결과는 플랫폼별 이벤트로 재구성해 즉시 전송
+    if cached_result is not None:
+        by_platform: Dict[str, List[Dict]] = {}
+        for prop in cached_result['properties']:
+            by_platform.setdefault(prop.get('platform', 'unknown'), []).append(prop)
+        
+        for platform, properties in by_platform.items():
+            stats.add(properties)
+            yield to_ndjson({
+                "event": "platform",
+                "platform": platform,
+                "count": len(properties),
+                "properties": properties,
+                "stats": stats.to_dict()
+            })
+        
+        summary = {k: v for k, v in cached_result.items() if k != 'properties'}
+        yield to_ndjson({"event": "summary", **summary, "cached": True})
+        return
+    
+    async def run(platform: str):
+        try:
+            return platform, await search_platform(platform, address), None
+        except Exception as e:
+            return platform, [], e
+    
+    tasks = [
+        asyncio.ensure_future(run(p))
+        for p in selected_platforms if p in PLATFORM_SEARCHERS
+    ]
+    all_properties = []
+    errors = []
+    
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            platform, properties, error = await next_done
+            
+            if error is not None:
+                errors.append(str(error))
+                yield to_ndjson({"event": "error", "platform": platform, "error": str(error)})
+                continue
+            
+            all_properties.extend(properties)
+            stats.add(properties)
+            yield to_ndjson({
+                "event": "platform",
+                "platform": platform,
+                "count": len(properties),
+                "properties": properties,
+                "stats": stats.to_dict()
+            })
+    finally:
+        # 클라이언트 연결 종료 시 남은 검색 취소
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        if permit is not None:
+            permit.release()
+    
+    result = build_realtime_result(address, selected_platforms, all_properties, stats, errors)
+    await cache_result(cache_key, result, all_properties)
+    
+    summary = {k: v for k, v in result.items() if k != 'properties'}
+    yield to_ndjson({"event": "summary", **summary})
 
 @app.get("/api/cache/clear")
 async def clear_cache():
     """캐시 초기화"""
-    cache.clear()
+    await cache.clear()
     return {"message": "캐시가 초기화되었습니다", "timestamp": datetime.now().isoformat()}
 
 @app.get("/api/cache/status")
 async def cache_status():
     """캐시 상태 확인"""
     return {
-        "total_keys": len(cache),
-        "keys": list(cache.keys()),
+        **cache.stats(),
+        "singleflight": search_flight.stats(),
+        "result_sets": result_sets.stats(),
+        "conditional": conditional.stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+@app.get("/api/region/resolve")
+async def resolve_address_region(address: str = Query(..., description="해석할 주소")):
+    """주소의 검색 지역(지역 코드, 영역, geohash) 확인"""
+    region = region_resolver.resolve(address)
+    return {
+        "address": address,
+        "resolved": region is not None,
+        "region": (region or DEFAULT_REGION).to_dict()
+    }
+
+@app.get("/api/snapshots/status")
+async def snapshots_status():
+    """로컬 스냅샷 상태 확인"""
+    return {
+        "snapshots": [store.stats() for store in snapshot_stores.values()],
+        "timestamp": datetime.now().isoformat()
+    }
+
+@app.get("/api/admission/status")
+async def admission_status():
+    """요청 제한 상태 확인"""
+    return {
+        **admission.stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+def cache_metric_samples():
+    stats = cache.stats()
+    return [
+        (("l1", "hit"), stats["hits"]),
+        (("l1", "stale_hit"), stats["stale_hits"]),
+        (("l1", "miss"), stats["misses"]),
+        (("l2", "hit"), stats["l2"]["hits"]),
+        (("l2", "miss"), stats["l2"]["misses"]),
+        (("l2", "error"), stats["l2"]["errors"])
+    ]
+
+# 다른 객체가 이미 세는 값은 수집 시점에 읽음
+metrics.callback("cache_lookups_total", "Cache lookups by tier and result", "counter",
+                 cache_metric_samples, ("tier", "result"))
+metrics.callback("cache_evictions_total", "L1 cache LRU evictions", "counter",
+                 lambda: [((), cache.l1.evictions)])
+metrics.callback("cache_expirations_total", "L1 cache TTL expirations", "counter",
+                 lambda: [((), cache.l1.expirations)])
+metrics.callback("cache_entries", "L1 cache entries", "gauge", lambda: [((), len(cache.l1))])
+metrics.callback("cache_bytes", "L1 cache size in bytes", "gauge", lambda: [((), cache.l1.stats()["bytes"])])
+metrics.callback("singleflight_coalesced_total", "Searches that joined an in-flight search", "counter",
+                 lambda: [((), search_flight.coalesced)])
+metrics.callback("admission_rejected_total", "Searches rejected by admission control", "counter",
+                 lambda: [(("rate",), admission.rejected_rate),
+                          (("concurrency",), admission.rejected_concurrency)], ("reason",))
+
+metrics.callback("prewarm_refreshes_total", "Cache refreshes started by the prewarm scheduler", "counter",
+                 lambda: [((), prewarm.refreshes)])
+
+metrics.callback("responses_not_modified_total", "Search responses answered with 304", "counter",
+                 lambda: [((), conditional.not_modified)])
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Prometheus 메트릭"""
+    return PlainTextResponse(metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+@app.get("/api/prewarm/status")
+async def prewarm_status():
+    """인기 검색 미리 갱신 상태 확인"""
+    return {
+        "enabled": PREWARM_ENABLED,
+        **prewarm.stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+@app.get("/api/pool/status")
+async def pool_status():
+    """HTTP 커넥션 풀 상태 확인"""
+    return {
+        **http_pool.stats(),
         "timestamp": datetime.now().isoformat()
     }
 
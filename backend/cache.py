@@ -0,0 +1,360 @@
+"""
+실시간 검색 결과 캐시 - 크기/용량 제한이 있는 LRU + TTL 캐시
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목"""
+    value: Any
+    size: int
+    stored_at: float
+    expires_at: float
+
+
+class ResultCache:
+    """
+    LRU + TTL 결과 캐시
+
+    - max_entries: 최대 항목 수
+    - max_bytes: 최대 용량 (JSON 직렬화 기준 바이트)
+    - ttl: 항목 유효 시간 (초)
+    - grace: 만료 후에도 stale 응답용으로 보관하는 시간 (초, 0이면 비활성)
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 64 * 1024 * 1024,
+                 ttl: float = 300, grace: float = 0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.grace = grace
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+
+        # 통계 카운터
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        """유효(미만료) 항목 존재 여부"""
+        entry = self._entries.get(key)
+        return entry is not None and entry.expires_at > time.monotonic()
+
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        """값의 크기 추정 (JSON 직렬화 바이트 수)"""
+        try:
+            return len(json.dumps(value, ensure_ascii=False, default=str).encode('utf-8'))
+        except (TypeError, ValueError):
+            return 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료된 항목은 None 반환)"""
+        value, _ = self._lookup(key, allow_stale=False)
+        return value
+
+    def get_with_state(self, key: str, allow_stale: bool = True) -> Tuple[Optional[Any], bool]:
+        """
+        캐시 조회 (stale 허용 여부 선택)
+
+        Returns:
+            (값, stale 여부) - allow_stale이면 유예 시간 안의 만료 항목을 stale=True로 반환
+        """
+        return self._lookup(key, allow_stale=allow_stale)
+
+    def _lookup(self, key: str, allow_stale: bool) -> Tuple[Optional[Any], bool]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None, False
+
+        now = time.monotonic()
+        if entry.expires_at <= now:
+            if entry.expires_at + self.grace <= now:
+                # 유예 시간까지 지난 항목은 제거
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None, False
+
+            if not allow_stale:
+                self.misses += 1
+                return None, False
+
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            return entry.value, True
+
+        # 최근 사용 항목으로 이동
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value, False
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, size: Optional[int] = None):
+        """
+        캐시 저장 (제한 초과 시 가장 오래 사용되지 않은 항목부터 제거)
+
+        size를 지정하지 않으면 JSON 직렬화 크기로 추정
+        """
+        if size is None:
+            size = self._estimate_size(value)
+        if size > self.max_bytes:
+            # 단일 항목이 전체 용량보다 크면 저장하지 않음
+            self._remove(key)
+            return
+
+        now = time.monotonic()
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = CacheEntry(
+            value=value,
+            size=size,
+            stored_at=now,
+            expires_at=now + (self.ttl if ttl is None else ttl)
+        )
+        self._bytes += size
+        self._evict()
+
+    def ttl_remaining(self, key: str) -> Optional[float]:
+        """
+        항목의 남은 유효 시간 (통계와 LRU 순서에 영향 없음)
+
+        Returns:
+            남은 초 (유예 시간 안의 만료 항목은 음수), 항목이 없으면 None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        remaining = entry.expires_at - time.monotonic()
+        if remaining <= -self.grace:
+            return None
+        return remaining
+
+    def items_with_ttl(self) -> List[Tuple[str, Any, float, int]]:
+        """
+        유효/stale 항목 목록 (LRU 순서, 스냅샷 저장용)
+
+        Returns:
+            (키, 값, 남은 유효 시간(초, stale이면 음수), 크기) 목록
+        """
+        now = time.monotonic()
+        return [
+            (key, entry.value, entry.expires_at - now, entry.size)
+            for key, entry in self._entries.items()
+            if entry.expires_at + self.grace > now
+        ]
+
+    def delete(self, key: str) -> bool:
+        """캐시 항목 삭제"""
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def clear(self):
+        """캐시 초기화"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def purge_expired(self) -> int:
+        """유예 시간까지 지난 항목 일괄 제거"""
+        now = time.monotonic()
+        expired = [k for k, e in self._entries.items() if e.expires_at + self.grace <= now]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self):
+        """용량/개수 제한 적용"""
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self._bytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "grace_seconds": self.grace,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+
+class TwoTierCache:
+    """
+    2단계 캐시 (L1: 프로세스 내 ResultCache, L2: 워커 간 공유 백엔드)
+
+    - l1: 프로세스 내 LRU + TTL 캐시
+    - l2: 공유 캐시 백엔드 (None이면 L1만 사용)
+    - negative_ttl: 빈 결과의 유효 시간 (초)
+    - is_negative: 빈 결과 판별 함수
+
+    L2에는 값과 만료 시각(epoch)을 JSON으로 직렬화해 ttl + grace 동안 보관한다.
+    L2에서 읽은 값은 남은 유효 시간으로 L1에 채운다. L2 오류는 조회 실패로 취급하고
+    L1만으로 계속 동작한다. 오류 로그는 L2가 실패하기 시작할 때와 복구될 때만 남긴다.
+    """
+
+    def __init__(self, l1: ResultCache, l2=None, negative_ttl: float = 60,
+                 is_negative=None):
+        self.l1 = l1
+        self.l2 = l2
+        self.negative_ttl = negative_ttl
+        self.is_negative = is_negative or (lambda value: not value)
+
+        # L2 통계 카운터
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self.l2_errors = 0
+        self.negative_sets = 0
+        self._l2_failing = False
+
+    @property
+    def ttl(self) -> float:
+        return self.l1.ttl
+
+    @property
+    def grace(self) -> float:
+        return self.l1.grace
+
+    def __len__(self) -> int:
+        return len(self.l1)
+
+    def ttl_remaining(self, key: str) -> Optional[float]:
+        """L1 항목의 남은 유효 시간 (ResultCache.ttl_remaining 참고)"""
+        return self.l1.ttl_remaining(key)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료된 항목은 None 반환)"""
+        value, _ = await self.get_with_state(key, allow_stale=False)
+        return value
+
+    async def get_with_state(self, key: str, allow_stale: bool = True) -> Tuple[Optional[Any], bool]:
+        """캐시 조회 (L1 → L2 순서, stale 허용 여부 선택)"""
+        value, stale = self.l1.get_with_state(key, allow_stale=allow_stale)
+        if value is not None or self.l2 is None:
+            return value, stale
+
+        try:
+            raw = await self.l2.get(key)
+        except Exception as e:
+            self._l2_failed("조회", e)
+            return None, False
+        self._l2_recovered()
+
+        if raw is None:
+            self.l2_misses += 1
+            return None, False
+
+        try:
+            envelope = json.loads(raw)
+            value, expires_at = envelope["v"], envelope["e"]
+        except (ValueError, KeyError, TypeError):
+            self.l2_errors += 1
+            return None, False
+
+        remaining = expires_at - time.time()
+        if remaining <= -self.grace or (remaining <= 0 and not allow_stale):
+            self.l2_misses += 1
+            return None, False
+
+        # 남은 유효 시간으로 L1 채우기 (만료된 값은 stale 상태로 들어감)
+        self.l2_hits += 1
+        self.l1.set(key, value, ttl=remaining, size=len(raw))
+        return value, remaining <= 0
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """L1/L2 저장 (빈 결과는 negative_ttl 적용)"""
+        if ttl is None:
+            ttl = self.ttl
+            if self.is_negative(value):
+                ttl = min(ttl, self.negative_ttl)
+                self.negative_sets += 1
+
+        raw = json.dumps(
+            {"v": value, "e": time.time() + ttl}, ensure_ascii=False, default=str
+        ).encode('utf-8')
+        self.l1.set(key, value, ttl=ttl, size=len(raw))
+
+        if self.l2 is not None:
+            try:
+                await self.l2.set(key, raw, ttl + self.grace)
+            except Exception as e:
+                self._l2_failed("저장", e)
+            else:
+                self._l2_recovered()
+
+    async def clear(self):
+        """L1/L2 초기화"""
+        self.l1.clear()
+        if self.l2 is not None:
+            try:
+                await self.l2.clear()
+            except Exception as e:
+                self._l2_failed("초기화", e)
+            else:
+                self._l2_recovered()
+
+    def _l2_failed(self, operation: str, error: Exception):
+        """L2 오류 집계 (연속 오류는 처음 한 번만 로그)"""
+        self.l2_errors += 1
+        if not self._l2_failing:
+            self._l2_failing = True
+            logger.error("L2 캐시 사용 불가 (%s %s 오류: %s), 복구될 때까지 L1만 사용",
+                         self.l2.name, operation, error)
+
+    def _l2_recovered(self):
+        """L2 오류 후 첫 성공 시 복구 로그"""
+        if self._l2_failing:
+            self._l2_failing = False
+            logger.info("L2 캐시 복구 (%s)", self.l2.name)
+
+    async def close(self):
+        """L2 연결 종료"""
+        if self.l2 is not None:
+            await self.l2.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (L1 통계 + L2 카운터)"""
+        return {
+            **self.l1.stats(),
+            "negative_ttl_seconds": self.negative_ttl,
+            "negative_sets": self.negative_sets,
+            "l2": {
+                "backend": self.l2.name if self.l2 is not None else None,
+                "hits": self.l2_hits,
+                "misses": self.l2_misses,
+                "errors": self.l2_errors
+            }
+        }
@@ -0,0 +1,189 @@
+"""
+L2 캐시 백엔드 - 워커 간 공유 캐시 (Redis / SQLite)
+
+값은 직렬화된 bytes로 저장하며 TTL이 지나면 조회되지 않는다.
+"""
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional
+import asyncio
+import sqlite3
+import time
+
+
+class CacheBackend(ABC):
+    """L2 캐시 백엔드 인터페이스"""
+
+    name = "base"
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """값 조회 (없거나 만료되면 None)"""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float):
+        """값 저장 (ttl초 후 만료)"""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str):
+        """값 삭제"""
+        pass
+
+    @abstractmethod
+    async def clear(self):
+        """전체 삭제"""
+        pass
+
+    async def close(self):
+        """연결 종료"""
+        pass
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis 백엔드 (aioredis 또는 redis.asyncio 필요)
+
+    여러 앱이 같은 Redis를 쓸 수 있으므로 키에 prefix를 붙이고, clear()는 prefix 범위만 삭제한다.
+    """
+
+    name = "redis"
+
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                 password: Optional[str] = None, prefix: str = "realtime:"):
+        try:
+            import aioredis as redis_client
+        except ImportError:
+            try:
+                from redis import asyncio as redis_client
+            except ImportError:
+                raise ImportError("RedisCacheBackend requires aioredis or redis>=4.2")
+
+        self.prefix = prefix
+        self._client = redis_client.Redis(
+            host=host, port=int(port), db=int(db), password=password or None
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        await self._client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    async def delete(self, key: str):
+        await self._client.delete(self.prefix + key)
+
+    async def clear(self):
+        keys = [key async for key in self._client.scan_iter(match=self.prefix + "*")]
+        if keys:
+            await self._client.delete(*keys)
+
+    async def close(self):
+        await self._client.close()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    SQLite 백엔드 (단일 호스트 다중 워커 / 테스트용)
+
+    sqlite 호출은 블로킹이므로 잠금으로 직렬화해 executor 스레드에서 실행한다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = asyncio.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, func, *args):
+        async with self._lock:
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def _get(self, key: str) -> Optional[bytes]:
+        row = self._connect().execute(
+            "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, value: bytes, ttl: float):
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, time.time() + ttl)
+        )
+        # 만료 항목 정리 (쓰기 시점에 함께 처리)
+        conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        conn.commit()
+
+    def _delete(self, key: str):
+        conn = self._connect()
+        conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+        conn.commit()
+
+    def _clear(self):
+        conn = self._connect()
+        conn.execute("DELETE FROM cache")
+        conn.commit()
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._run(self._get, key)
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        await self._run(self._set, key, value, ttl)
+
+    async def delete(self, key: str):
+        await self._run(self._delete, key)
+
+    async def clear(self):
+        await self._run(self._clear)
+
+    async def close(self):
+        await self._run(self._close)
+
+
+def create_backend(config: Dict) -> Optional[CacheBackend]:
+    """
+    설정으로 L2 백엔드 생성
+
+    Args:
+        config: type(redis, sqlite, none)과 백엔드별 접속 정보
+
+    Returns:
+        백엔드 인스턴스 또는 None (L2 비활성)
+    """
+    backend_type = (config.get("type") or "none").lower()
+
+    if backend_type == "redis":
+        return RedisCacheBackend(
+            host=config.get("host", "localhost"),
+            port=config.get("port", 6379),
+            db=config.get("db", 0),
+            password=config.get("password"),
+            prefix=config.get("prefix", "realtime:")
+        )
+    if backend_type == "sqlite":
+        return SQLiteCacheBackend(config.get("path", "data/processed/backend_cache.sqlite3"))
+    if backend_type in ("none", "memory", ""):
+        return None
+
+    raise ValueError(f"Unknown cache backend: {backend_type}")
@@ -0,0 +1,148 @@
+"""
+캐시 스냅샷 - L1 캐시를 파일로 저장하고 재시작 시 남은 TTL로 복원
+
+파일 형식 (zlib 압축된 본문):
+    헤더: MAGIC(4바이트) + 저장 시각(epoch, double) + 항목 수(uint32)
+    항목: 키 길이(uint32) + 값 길이(uint32) + 만료 시각(epoch, double) + 키(UTF-8) + 값(JSON)
+
+만료 시각은 벽시계(epoch) 기준으로 저장해 프로세스가 바뀌어도 남은 TTL을 계산할 수 있다.
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+import asyncio
+import itertools
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+
+from backend.cache import ResultCache
+
+MAGIC = b"RCS1"
+_HEADER = struct.Struct("<4sdI")
+_ENTRY = struct.Struct("<IId")
+
+
+def encode_snapshot(entries: List[Tuple[str, Any, float, int]], now: float) -> bytes:
+    """(키, 값, 남은 TTL, 크기) 목록을 스냅샷 bytes로 인코딩"""
+    parts = [_HEADER.pack(MAGIC, now, len(entries))]
+    for key, value, remaining, _ in entries:
+        key_bytes = key.encode("utf-8")
+        value_bytes = json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+        parts.append(_ENTRY.pack(len(key_bytes), len(value_bytes), now + remaining))
+        parts.append(key_bytes)
+        parts.append(value_bytes)
+    return zlib.compress(b"".join(parts), 6)
+
+
+def decode_snapshot(data: bytes) -> List[Tuple[str, Any, float, int]]:
+    """스냅샷 bytes를 (키, 값, 만료 시각(epoch), 크기) 목록으로 디코딩"""
+    raw = zlib.decompress(data)
+    magic, _, count = _HEADER.unpack_from(raw, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a cache snapshot")
+
+    entries = []
+    offset = _HEADER.size
+    for _ in range(count):
+        key_len, value_len, expires_at = _ENTRY.unpack_from(raw, offset)
+        offset += _ENTRY.size
+        key = raw[offset:offset + key_len].decode("utf-8")
+        offset += key_len
+        value_bytes = raw[offset:offset + value_len]
+        offset += value_len
+        entries.append((key, json.loads(value_bytes), expires_at, value_len))
+    return entries
+
+
+# 프로세스 안의 스냅샷 쓰기 직렬화 (executor 스레드의 주기 저장과 종료 시 저장이 겹치지 않도록)
+_write_lock = threading.Lock()
+# 캐시 항목을 복사한 순서 (늦게 끝난 이전 저장이 최신 스냅샷을 덮어쓰지 않도록)
+_sequence = itertools.count(1)
+_written: Dict[Path, int] = {}
+
+
+def _write_atomic(path: Path, data: bytes, seq: int = 0):
+    """
+    임시 파일에 쓴 뒤 교체 (여러 워커가 같은 파일에 써도 깨지지 않음)
+
+    임시 파일 이름에 프로세스/스레드 ID를 붙이고, 같은 프로세스 안의 쓰기는 락으로
+    하나씩 실행한다. seq가 이미 저장된 스냅샷보다 오래되었으면 쓰지 않는다.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with _write_lock:
+        if seq and seq < _written.get(path, 0):
+            return
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        if seq:
+            _written[path] = seq
+
+
+def save_snapshot(cache: ResultCache, path: Path) -> int:
+    """캐시를 파일로 저장 (저장한 항목 수 반환)"""
+    seq = next(_sequence)
+    entries = cache.items_with_ttl()
+    _write_atomic(Path(path), encode_snapshot(entries, time.time()), seq)
+    return len(entries)
+
+
+async def save_snapshot_async(cache: ResultCache, path: Path) -> int:
+    """
+    캐시를 파일로 저장 (직렬화/압축/쓰기는 executor 스레드에서 실행)
+
+    항목 목록만 이벤트 루프에서 복사한다. 캐시된 값은 저장 후 수정하지 않으므로
+    스레드에서 읽어도 안전하다.
+    """
+    seq = next(_sequence)
+    entries = cache.items_with_ttl()
+    now = time.time()
+
+    def write():
+        _write_atomic(Path(path), encode_snapshot(entries, now), seq)
+
+    await asyncio.get_running_loop().run_in_executor(None, write)
+    return len(entries)
+
+
+def load_snapshot(cache: ResultCache, path: Path) -> int:
+    """
+    스냅샷 파일을 캐시에 복원 (복원한 항목 수 반환)
+
+    남은 TTL로 저장하며, 유예 시간까지 지난 항목은 건너뛴다. 파일이 없거나
+    손상되었으면 빈 캐시로 시작한다.
+    """
+    path = Path(path)
+    if not path.exists():
+        return 0
+
+    try:
+        entries = decode_snapshot(path.read_bytes())
+    except (ValueError, struct.error, zlib.error, UnicodeDecodeError) as e:
+        print(f"캐시 스냅샷 복원 실패 ({path}): {e}")
+        return 0
+
+    now = time.time()
+    restored = 0
+    # LRU 순서(오래된 것부터)로 저장되어 있으므로 그대로 넣으면 순서가 유지됨
+    for key, value, expires_at, size in entries:
+        remaining = expires_at - now
+        if remaining + cache.grace <= 0:
+            continue
+        cache.set(key, value, ttl=remaining, size=size)
+        restored += 1
+    return restored
+
+
+async def snapshot_periodically(cache: ResultCache, path: Path, interval: float):
+    """주기적 스냅샷 저장 루프 (취소될 때까지)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await save_snapshot_async(cache, path)
+        except Exception as e:
+            print(f"캐시 스냅샷 저장 오류 ({path}): {e}")
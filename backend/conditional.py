@@ -0,0 +1,186 @@
+"""
+조건부 응답과 압축 - 강한 ETag, If-None-Match → 304, gzip/brotli 인코딩
+
+ETag는 검색 결과를 만들 때 한 번 계산한 내용 해시(매물, 건수, 오류 등 내용 필드만)에
+인코딩을 붙여 만든다. 같은 내용이면 다시 조회하거나 캐시에서 꺼낸 결과도 ETag가 같으므로
+폴링 요청은 직렬화 없이 304로 응답한다. 압축된 본문은 본문 키별로 보관해 다른 클라이언트의
+같은 요청에도 재사용한다. cached/stale 같은 응답 변형은 본문에 있어도 ETag에는 넣지 않고,
+본문 캐시 키(body_key)로만 구분한다.
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import gzip
+import hashlib
+
+from fastapi import Request, Response
+
+from src.mcp.json_response import dumps
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def content_hash(content: Any) -> str:
+    """JSON 직렬화 내용의 해시 (16바이트 hex)"""
+    return hashlib.blake2b(dumps(content), digest_size=16).hexdigest()
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding에서 사용할 압축 방식 선택 (br 우선, q=0은 제외)"""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip())
+
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def etag_matches(if_none_match: Optional[str], *etags: str) -> bool:
+    """If-None-Match가 ETag 중 하나와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in etags:
+            return True
+    return False
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """본문 압축"""
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+class EncodedBodyCache:
+    """ETag별 직렬화/압축 본문 LRU 캐시 (본문, 적용된 인코딩)"""
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._bodies: "OrderedDict[str, Tuple[bytes, Optional[str]]]" = OrderedDict()
+        self._bytes = 0
+
+        # 통계 카운터
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        entry = self._bodies.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._bodies.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, body: bytes, encoding: Optional[str]):
+        if len(body) > self.max_bytes:
+            return
+        old = self._bodies.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old[0])
+        self._bodies[key] = (body, encoding)
+        self._bytes += len(body)
+        while len(self._bodies) > self.max_entries or self._bytes > self.max_bytes:
+            _, (evicted, _) = self._bodies.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._bodies),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+class ConditionalResponder:
+    """
+    ETag/압축 응답 생성기
+
+    - min_size: 이 크기(바이트) 이상인 본문만 압축
+    - body_cache: 인코딩된 본문 캐시
+    """
+
+    def __init__(self, min_size: int = 1024, body_cache: Optional[EncodedBodyCache] = None):
+        self.min_size = min_size
+        self.body_cache = body_cache or EncodedBodyCache()
+
+        # 통계 카운터
+        self.not_modified = 0
+        self.compressed = 0
+
+    def _encode(self, content: Any, key: str, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """본문 직렬화 및 압축 (작은 본문은 압축하지 않음)"""
+        cached = self.body_cache.get(key)
+        if cached is not None:
+            return cached
+
+        body = dumps(content)
+        if encoding is not None and len(body) >= self.min_size:
+            body = compress(body, encoding)
+            self.compressed += 1
+        else:
+            encoding = None
+        self.body_cache.set(key, body, encoding)
+        return body, encoding
+
+    def respond(self, request: Request, content: Dict, content_etag: str,
+                body_key: Optional[str] = None, headers: Optional[Dict[str, str]] = None) -> Response:
+        """
+        조건부 JSON 응답
+
+        Args:
+            request: 요청 (If-None-Match, Accept-Encoding 확인)
+            content: 응답 본문
+            content_etag: content의 내용 해시 (시각 등 검증 대상이 아닌 필드는 제외)
+            body_key: 인코딩된 본문 캐시 키 (같은 ETag라도 본문이 다를 수 있으면 지정)
+            headers: 추가 응답 헤더 (예: X-Cache)
+        """
+        encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+        plain_etag = f'"{content_etag}"'
+        encoded_etag = f'"{content_etag}-{encoding}"' if encoding else plain_etag
+        headers = {**(headers or {}), "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+
+        # 작은 본문은 압축하지 않으므로 인코딩 없는 ETag도 같은 내용으로 인정
+        if etag_matches(request.headers.get("if-none-match"), encoded_etag, plain_etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers={**headers, "ETag": encoded_etag})
+
+        key = f"{encoded_etag}|{body_key}" if body_key else encoded_etag
+        body, used = self._encode(content, key, encoding)
+        if used is not None:
+            headers["Content-Encoding"] = used
+            headers["ETag"] = encoded_etag
+        else:
+            headers["ETag"] = plain_etag
+
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "min_size": self.min_size,
+            "brotli": brotli is not None,
+            "not_modified": self.not_modified,
+            "compressed": self.compressed,
+            "bodies": self.body_cache.stats()
+        }
@@ -0,0 +1,96 @@
+"""
+공유 HTTP 커넥션 풀 - 앱 라이프사이클 동안 하나의 aiohttp 세션을 재사용
+"""
+from typing import Any, Dict, Optional
+import aiohttp
+
+
+class HTTPPool:
+    """
+    공유 aiohttp 세션 관리자
+
+    - limit: 전체 동시 커넥션 수
+    - limit_per_host: 호스트별 동시 커넥션 수
+    - dns_ttl: DNS 캐시 유지 시간 (초)
+    - keepalive_timeout: 유휴 커넥션 유지 시간 (초)
+    - total_timeout / connect_timeout: 요청 전체 / 연결 타임아웃 (초)
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 20, dns_ttl: int = 300,
+                 keepalive_timeout: float = 30, total_timeout: float = 10,
+                 connect_timeout: float = 3):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout, connect=connect_timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+
+        # 통계 카운터
+        self.sessions_created = 0
+
+    def _create_session(self):
+        """커넥터와 세션 생성"""
+        self._connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        self._session = aiohttp.ClientSession(
+            connector=self._connector,
+            timeout=self.timeout
+        )
+        self.sessions_created += 1
+
+    async def start(self):
+        """세션 생성"""
+        if self._session is None or self._session.closed:
+            self._create_session()
+
+    async def close(self):
+        """세션 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._connector = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """공유 세션 (앱 시작 전 호출 시 지연 생성)"""
+        if self._session is None or self._session.closed:
+            self._create_session()
+        return self._session
+
+    def stats(self) -> Dict[str, Any]:
+        """커넥션 풀 사용 현황"""
+        connector = self._connector
+        in_use = 0
+        in_use_per_host: Dict[str, int] = {}
+        idle = 0
+
+        if connector is not None and not connector.closed:
+            # aiohttp는 풀 현황을 공개 API로 제공하지 않으므로 내부 상태를 읽음
+            in_use = len(getattr(connector, '_acquired', ()))
+            for key, conns in getattr(connector, '_acquired_per_host', {}).items():
+                in_use_per_host[f"{key.host}:{key.port}"] = len(conns)
+            idle = sum(len(conns) for conns in getattr(connector, '_conns', {}).values())
+
+        return {
+            "active": self._session is not None and not self._session.closed,
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "in_use": in_use,
+            "in_use_per_host": in_use_per_host,
+            "idle": idle,
+            "utilization": round(in_use / self.limit, 4) if self.limit else 0.0,
+            "dns_ttl_seconds": self.dns_ttl,
+            "keepalive_timeout_seconds": self.keepalive_timeout,
+            "timeout_seconds": {
+                "total": self.timeout.total,
+                "connect": self.timeout.connect
+            },
+            "sessions_created": self.sessions_created
+        }
@@ -0,0 +1,282 @@
+"""
+Prometheus 텍스트 형식 메트릭 - 카운터, 게이지, 고정 버킷 히스토그램
+
+라벨 값 조합별 자식 메트릭은 처음 한 번만 만들고 이후에는 재사용한다.
+핫 패스에서는 미리 받아 둔 자식의 inc()/observe()만 호출하면 되므로 요청마다
+라벨 dict를 만들지 않는다. 다른 모듈이 이미 세는 값(캐시 통계 등)은
+CallbackMetric으로 수집 시점에만 읽는다.
+"""
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import math
+import time
+
+# 기본 지연 시간 버킷 (초)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """라벨 문자열 (예: {platform="naver",le="0.5"})"""
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # 버킷별 개수 (누적 아님, 마지막 칸은 +Inf)
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class _MetricFamily(ABC):
+    """이름/설명/라벨 이름을 가진 메트릭 패밀리 (samples()로 값 제공)"""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    @abstractmethod
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        """(메트릭 이름, 라벨 문자열, 값) 목록"""
+        pass
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        lines.extend(f"{name}{labels} {_format_value(value)}" for name, labels, value in self.samples())
+        return lines
+
+
+class _Metric(_MetricFamily):
+    """라벨별 자식 메트릭을 가진 메트릭 패밀리"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._default = self.labels()
+
+    @abstractmethod
+    def _new_child(self):
+        """라벨 값 조합 하나의 자식 메트릭 생성 (하위 클래스에서 구현)"""
+        pass
+
+    def labels(self, *values: str):
+        """라벨 값 조합의 자식 메트릭 (없으면 생성)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        for values, child in self._children.items():
+            yield self.name, _label_text(self.labelnames, values), child.value
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1):
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    """증감 가능한 게이지"""
+
+    type = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1):
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1):
+        self._default.dec(amount)
+
+    def set(self, value: float):
+        self._default.set(value)
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(float(b) for b in buckets if b != math.inf))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        for values, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket", _label_text(self.labelnames, values, le), cumulative
+            labels = _label_text(self.labelnames, values)
+            yield f"{self.name}_sum", labels, child.sum
+            yield f"{self.name}_count", labels, cumulative
+
+
+class CallbackMetric(_MetricFamily):
+    """
+    수집 시점에 값을 읽는 메트릭
+
+    func는 (라벨 값 튜플, 값) 목록을 반환한다. 다른 객체가 이미 세고 있는 값을
+    핫 패스에서 중복으로 세지 않기 위해 사용한다.
+    """
+
+    def __init__(self, name: str, documentation: str, metric_type: str,
+                 func: Callable[[], Iterable[Tuple[Tuple[str, ...], float]]],
+                 labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.type = metric_type
+        self.func = func
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        for values, value in self.func():
+            yield self.name, _label_text(self.labelnames, values), value
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 텍스트 형식 출력"""
+
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self._metrics: List[_MetricFamily] = []
+
+    def _register(self, metric: _MetricFamily) -> _MetricFamily:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(self.prefix + name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(self.prefix + name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Optional[Sequence[float]] = None) -> Histogram:
+        return self._register(Histogram(
+            self.prefix + name, documentation, labelnames, buckets or DEFAULT_LATENCY_BUCKETS
+        ))
+
+    def callback(self, name: str, documentation: str, metric_type: str,
+                 func: Callable[[], Iterable[Tuple[Tuple[str, ...], float]]],
+                 labelnames: Sequence[str] = ()) -> CallbackMetric:
+        return self._register(CallbackMetric(self.prefix + name, documentation, metric_type, func, labelnames))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 메트릭 ASGI 미들웨어
+
+    엔드포인트 라벨은 매칭된 라우트의 경로 템플릿(예: /api/search/results/{handle})을
+    사용해 라벨 종류가 늘어나지 않게 한다. 지연 시간은 응답 본문 전송 완료까지다.
+    """
+
+    def __init__(self, app, latency: Histogram, requests: Counter, inflight: Gauge):
+        self.app = app
+        self.latency = latency
+        self.requests = requests
+        self.inflight = inflight
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.inflight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.inflight.dec()
+            route = scope.get("route")
+            endpoint = getattr(route, "path", "unmatched")
+            self.latency.labels(endpoint).observe(time.perf_counter() - start)
+            self.requests.labels(endpoint, scope["method"], str(status)).inc()
@@ -0,0 +1,171 @@
+"""
+인기 검색 캐시 미리 갱신 - 검색 빈도 상위 키를 만료 직전에 백그라운드에서 갱신
+
+검색 빈도는 Space-Saving 알고리즘으로 고정 개수의 카운터만 유지해 추적한다.
+갱신 횟수는 업스트림 예산의 일부만 쓰도록 토큰 버킷으로 제한한다.
+"""
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import heapq
+import time
+
+from backend.admission import TokenBucket
+
+
+class SpaceSaving:
+    """
+    Space-Saving 빈도 상위 항목 추적 (heavy hitters)
+
+    capacity개의 카운터만 유지하며, 가득 차면 가장 작은 카운터를 새 키에 넘겨준다.
+    넘겨받은 값(error)만큼은 과대 추정일 수 있으므로 count - error가 보장된 최소 빈도다.
+    """
+
+    def __init__(self, capacity: int = 512):
+        self.capacity = capacity
+        self._counts: Dict[str, float] = {}
+        self._errors: Dict[str, float] = {}
+        self._payloads: Dict[str, Any] = {}
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def record(self, key: str, payload: Any = None):
+        """키 1회 등장 기록 (payload는 갱신 시 사용할 요청 정보)"""
+        self.total += 1
+        counts = self._counts
+        if key in counts:
+            counts[key] += 1
+            return
+
+        if len(counts) >= self.capacity:
+            victim = min(counts, key=counts.__getitem__)
+            floor = counts.pop(victim)
+            del self._errors[victim]
+            self._payloads.pop(victim, None)
+        else:
+            floor = 0
+
+        counts[key] = floor + 1
+        self._errors[key] = floor
+        if payload is not None:
+            self._payloads[key] = payload
+
+    def top(self, k: int, min_count: float = 1) -> List[Tuple[str, float, Any]]:
+        """보장 빈도가 min_count 이상인 상위 k개 (키, 빈도, payload)"""
+        candidates = (
+            (key, count) for key, count in self._counts.items()
+            if count - self._errors[key] >= min_count
+        )
+        return [
+            (key, count, self._payloads.get(key))
+            for key, count in heapq.nlargest(k, candidates, key=itemgetter(1))
+        ]
+
+    def decay(self, factor: float = 0.5):
+        """오래된 빈도 감쇠 (최근 트래픽 위주로 유지)"""
+        for key in list(self._counts):
+            count = self._counts[key] * factor
+            if count < 1:
+                del self._counts[key]
+                del self._errors[key]
+                self._payloads.pop(key, None)
+            else:
+                self._counts[key] = count
+                self._errors[key] *= factor
+
+
+class PrewarmScheduler:
+    """
+    인기 키 캐시 미리 갱신 스케줄러
+
+    - sketch: 검색 빈도 추적기
+    - cache: ttl_remaining(key)를 제공하는 캐시
+    - refresh: 키와 payload로 캐시를 갱신하는 코루틴 함수
+    - budget: 갱신 횟수 제한 토큰 버킷 (업스트림 예산 중 미리 갱신 몫)
+    - top_k: 갱신 대상 상위 키 수
+    - lead_time: 만료까지 남은 시간이 이보다 짧으면 갱신 (초)
+    - min_count: 갱신 대상 최소 보장 빈도
+    - interval: 점검 주기 (초)
+    - decay_interval: 빈도 감쇠 주기 (초)
+    - is_busy: 이미 갱신 중인 키 판별 함수 (single-flight 등)
+    """
+
+    def __init__(self, sketch: SpaceSaving, cache, refresh: Callable[[str, Any], Awaitable[Any]],
+                 budget: TokenBucket, top_k: int = 50, lead_time: float = 30,
+                 min_count: float = 3, interval: float = 5, decay_interval: float = 300,
+                 is_busy: Optional[Callable[[str], bool]] = None):
+        self.sketch = sketch
+        self.cache = cache
+        self.refresh = refresh
+        self.budget = budget
+        self.top_k = top_k
+        self.lead_time = lead_time
+        self.min_count = min_count
+        self.interval = interval
+        self.decay_interval = decay_interval
+        self.is_busy = is_busy or (lambda key: False)
+        self._running: Dict[str, asyncio.Task] = {}
+        self._last_decay = time.monotonic()
+
+        # 통계 카운터
+        self.refreshes = 0
+        self.budget_skips = 0
+
+    def tick(self) -> int:
+        """만료가 가까운 인기 키 갱신 시작 (시작한 갱신 수 반환)"""
+        started = 0
+        for key, _, payload in self.sketch.top(self.top_k, self.min_count):
+            if payload is None or key in self._running or self.is_busy(key):
+                continue
+
+            remaining = self.cache.ttl_remaining(key)
+            if remaining is not None and remaining > self.lead_time:
+                continue
+
+            # 예산이 없으면 다음 점검까지 대기 (상위 키부터 처리하므로 중단)
+            if self.budget.try_acquire() > 0:
+                self.budget_skips += 1
+                break
+
+            task = asyncio.ensure_future(self.refresh(key, payload))
+            self._running[key] = task
+            task.add_done_callback(lambda t, k=key: self._running.pop(k, None))
+            self.refreshes += 1
+            started += 1
+
+        now = time.monotonic()
+        if now - self._last_decay >= self.decay_interval:
+            self.sketch.decay()
+            self._last_decay = now
+
+        return started
+
+    async def run(self):
+        """주기적 점검 루프 (취소될 때까지)"""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"캐시 미리 갱신 오류: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """스케줄러 통계"""
+        return {
+            "tracked_keys": len(self.sketch),
+            "recorded": self.sketch.total,
+            "running": len(self._running),
+            "refreshes": self.refreshes,
+            "budget_skips": self.budget_skips,
+            "budget_rate": self.budget.rate,
+            "top": [
+                {"key": key, "count": round(count, 1), "ttl_remaining": self._ttl(key)}
+                for key, count, _ in self.sketch.top(self.top_k, self.min_count)
+            ]
+        }
+
+    def _ttl(self, key: str) -> Optional[float]:
+        remaining = self.cache.ttl_remaining(key)
+        return round(remaining, 1) if remaining is not None else None
@@ -0,0 +1,301 @@
+"""
+주소 → 지역 해석기 - 자유 입력 주소를 지역 코드(cortarNo), 영역(bbox), geohash로 변환
+
+data/korea-regions.js의 시도/시군구/동 계층과 data/region_centroids.json의 중심 좌표로
+지역명 prefix trie를 만들고, 주소 문자열에서 가장 구체적인 지역을 찾는다.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import json
+import re
+
+
+# 수준별 영역 반경 (위도, 경도 단위 도)
+BBOX_HALF_SIZE = {
+    "dong": (0.01, 0.0125),
+    "district": (0.035, 0.045),
+    "province": (0.3, 0.4)
+}
+
+# 수준별 geohash 정밀도 (직방 API는 5자리 ≈ 4.9km x 4.9km 단위 사용)
+GEOHASH_PRECISION = {
+    "dong": 5,
+    "district": 5,
+    "province": 4
+}
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# 시도명 접미사 (짧은 이름 생성용: 서울특별시 → 서울)
+_PROVINCE_SUFFIXES = ("특별자치시", "특별자치도", "특별시", "광역시", "도")
+
+# 지역 수준 순위 (클수록 구체적)
+_LEVEL_RANK = {"province": 0, "district": 1, "dong": 2}
+
+# 행정동 번호 제거 (삼성1동 → 삼성동)
+_NUMBERED_DONG = re.compile(r"([가-힣])\d+동")
+
+
+def encode_geohash(lat: float, lng: float, precision: int = 5) -> str:
+    """위경도를 geohash 문자열로 인코딩"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+
+    while len(chars) < precision:
+        if even:
+            mid = (lng_range[0] + lng_range[1]) / 2
+            if lng >= mid:
+                bits = (bits << 1) | 1
+                lng_range[0] = mid
+            else:
+                bits <<= 1
+                lng_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if lat >= mid:
+                bits = (bits << 1) | 1
+                lat_range[0] = mid
+            else:
+                bits <<= 1
+                lat_range[1] = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
+
+
+def short_province_name(name: str) -> str:
+    """시도 짧은 이름 (서울특별시 → 서울, 경기도 → 경기)"""
+    for suffix in _PROVINCE_SUFFIXES:
+        if name.endswith(suffix) and len(name) > len(suffix) + 1:
+            return name[:-len(suffix)]
+    return name
+
+
+@dataclass
+class Region:
+    """지역 계층 노드"""
+    level: str  # province, district, dong
+    name: str
+    code: str
+    lat: float
+    lng: float
+    province: str
+    district: Optional[str] = None
+    dong: Optional[str] = None
+    # 법정동 코드가 있는 동은 10자리 코드
+    dong_code: Optional[str] = None
+    # 자체 중심 좌표가 없으면 좌표를 빌려온 상위 수준 (bbox/geohash 크기 결정)
+    precision: Optional[str] = None
+
+    @property
+    def cortar_no(self) -> str:
+        """네이버 부동산 지역 코드 (10자리)"""
+        if self.dong_code:
+            return self.dong_code
+        return self.code.ljust(10, "0")
+
+    @property
+    def display_name(self) -> str:
+        """표시용 주소 (예: 서울 강남구 삼성동)"""
+        parts = [short_province_name(self.province), self.district, self.dong]
+        return " ".join(p for p in parts if p)
+
+    @property
+    def bbox(self) -> Dict[str, float]:
+        """중심 좌표 기준 검색 영역"""
+        lat_half, lng_half = BBOX_HALF_SIZE[self.precision or self.level]
+        return {
+            "top": round(self.lat + lat_half, 6),
+            "bottom": round(self.lat - lat_half, 6),
+            "left": round(self.lng - lng_half, 6),
+            "right": round(self.lng + lng_half, 6)
+        }
+
+    @property
+    def geohash(self) -> str:
+        """직방 지역 geohash"""
+        return encode_geohash(self.lat, self.lng, GEOHASH_PRECISION[self.precision or self.level])
+
+    def to_dict(self) -> Dict:
+        return {
+            "level": self.level,
+            "name": self.display_name,
+            "province": self.province,
+            "district": self.district,
+            "dong": self.dong,
+            "code": self.code,
+            "cortarNo": self.cortar_no,
+            "lat": self.lat,
+            "lng": self.lng,
+            "bbox": self.bbox,
+            "geohash": self.geohash
+        }
+
+
+class _TrieNode:
+    __slots__ = ("children", "regions")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.regions: List[Region] = []
+
+
+def _parse_js_object(source: str, name: str) -> Dict:
+    """JS 모듈의 `export const NAME = {...};` 객체 리터럴을 JSON으로 파싱"""
+    match = re.search(r"export const %s = (\{.*?\n\});" % name, source, re.S)
+    if not match:
+        raise ValueError(f"{name} not found in regions file")
+    literal = match.group(1)
+    literal = re.sub(r"//[^\n]*", "", literal)
+    literal = re.sub(r"([{,]\s*)([A-Za-z_]\w*)\s*:", r'\1"\2":', literal)
+    literal = re.sub(r",(\s*[}\]])", r"\1", literal)
+    return json.loads(literal)
+
+
+class RegionResolver:
+    """
+    지역명 prefix trie 기반 주소 해석기
+
+    같은 이름의 지역(예: 중구, 신사동)이 여러 곳이면 주소에 함께 나온 상위 지역과
+    일치하는 후보를 우선하고, 없으면 계층 파일 순서상 앞선 지역을 고른다.
+    """
+
+    def __init__(self, regions: List[Region]):
+        self.regions = regions
+        self._root = _TrieNode()
+        for region in regions:
+            names = {region.dong or region.district or region.province}
+            if region.level == "province":
+                names.add(short_province_name(region.province))
+            elif region.level == "district" and len(region.district) > 2:
+                # 구/군/시 생략 표기 (강남구 → 강남)
+                names.add(region.district[:-1])
+            for name in names:
+                self._insert(name, region)
+
+        self._order = {id(r): i for i, r in enumerate(regions)}
+
+    @classmethod
+    def from_files(cls, regions_path: Path, centroids_path: Optional[Path] = None) -> "RegionResolver":
+        """계층 파일(korea-regions.js)과 중심 좌표 파일로 생성"""
+        source = Path(regions_path).read_text(encoding="utf-8")
+        hierarchy = _parse_js_object(source, "KOREA_REGIONS")
+        province_coords = _parse_js_object(source, "REGION_COORDINATES")
+
+        centroids = {"districts": {}, "dongs": {}}
+        if centroids_path and Path(centroids_path).exists():
+            centroids.update(json.loads(Path(centroids_path).read_text(encoding="utf-8")))
+
+        regions = []
+        for province, province_data in hierarchy.items():
+            coords = province_coords.get(province, {"lat": 0.0, "lng": 0.0})
+            regions.append(Region(
+                level="province", name=province, code=province_data["code"],
+                lat=coords["lat"], lng=coords["lng"], province=province
+            ))
+
+            for district, district_data in province_data.get("districts", {}).items():
+                code = district_data["code"]
+                district_coords = centroids["districts"].get(code)
+                district_precision = None if district_coords else "province"
+                district_coords = district_coords or coords
+                regions.append(Region(
+                    level="district", name=district, code=code,
+                    lat=district_coords["lat"], lng=district_coords["lng"],
+                    province=province, district=district, precision=district_precision
+                ))
+
+                dong_centroids = centroids["dongs"].get(code, {})
+                for dong in district_data.get("dongs", []):
+                    dong_info = dong_centroids.get(dong)
+                    if dong_info:
+                        regions.append(Region(
+                            level="dong", name=dong, code=code,
+                            lat=dong_info["lat"], lng=dong_info["lng"],
+                            province=province, district=district, dong=dong,
+                            dong_code=dong_info.get("code")
+                        ))
+                    else:
+                        regions.append(Region(
+                            level="dong", name=dong, code=code,
+                            lat=district_coords["lat"], lng=district_coords["lng"],
+                            province=province, district=district, dong=dong,
+                            precision=district_precision or "district"
+                        ))
+
+        return cls(regions)
+
+    def _insert(self, name: str, region: Region):
+        node = self._root
+        for char in name:
+            node = node.children.setdefault(char, _TrieNode())
+        node.regions.append(region)
+
+    def _longest_match(self, text: str, start: int) -> Tuple[int, List[Region]]:
+        """start 위치에서 가장 긴 지역명 일치 (끝 위치, 후보)"""
+        node = self._root
+        end, found = start, []
+        for i in range(start, len(text)):
+            node = node.children.get(text[i])
+            if node is None:
+                break
+            if node.regions:
+                end, found = i + 1, node.regions
+        return end, found
+
+    def _scan(self, text: str) -> List[List[Region]]:
+        """주소 문자열의 지역명 후보 목록 (등장 순서)"""
+        matches = []
+        i = 0
+        while i < len(text):
+            # 지역명은 단어 시작에서만 인식 (예: '서울'이 '동서울' 안에서 잡히지 않도록)
+            if i > 0 and text[i - 1] not in " ,":
+                i += 1
+                continue
+            end, found = self._longest_match(text, i)
+            if found:
+                matches.append(found)
+                i = end
+            else:
+                i += 1
+        return matches
+
+    @staticmethod
+    def _consistent(region: Region, context: Region) -> bool:
+        """context(상위 지역)와 같은 계층에 속하는지"""
+        if region.province != context.province:
+            return False
+        if context.district and region.district != context.district:
+            return False
+        return True
+
+    def resolve(self, address: str) -> Optional[Region]:
+        """주소를 가장 구체적인 지역으로 해석 (해석 실패 시 None)"""
+        return self._resolve_normalized(_NUMBERED_DONG.sub(r"\1동", address.strip()))
+
+    @lru_cache(maxsize=4096)
+    def _resolve_normalized(self, address: str) -> Optional[Region]:
+        context: Optional[Region] = None
+        for candidates in self._scan(address):
+            if context is not None:
+                consistent = [r for r in candidates if self._consistent(r, context)]
+                if not consistent:
+                    continue
+                candidates = consistent
+            chosen = min(candidates, key=lambda r: self._order[id(r)])
+            if context is None or _LEVEL_RANK[chosen.level] >= _LEVEL_RANK[context.level]:
+                context = chosen
+        return context
+
@@ -0,0 +1,151 @@
+"""
+검색 결과 집합 저장소 - 병합된 전체 결과를 핸들로 보관하고 커서 페이지네이션 제공
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import base64
+import binascii
+import json
+import uuid
+
+from backend.cache import ResultCache
+
+
+# 정렬 옵션: 이름 -> (정렬 필드, 내림차순 여부)
+SORT_OPTIONS = {
+    "default": (None, False),
+    "price_asc": ("price", False),
+    "price_desc": ("price", True),
+    "area_asc": ("area", False),
+    "area_desc": ("area", True)
+}
+
+
+class InvalidCursorError(ValueError):
+    """잘못된 커서 또는 정렬 옵션"""
+    pass
+
+
+def encode_cursor(sort: str, offset: int) -> str:
+    """커서 인코딩"""
+    return base64.urlsafe_b64encode(f"{sort}:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """커서 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort, offset = base64.urlsafe_b64decode(padded.encode()).decode().split(":", 1)
+        offset = int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+
+    if sort not in SORT_OPTIONS or offset < 0:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return sort, offset
+
+
+def _sort_value(prop: Dict, field_name: str) -> Optional[float]:
+    """정렬 값 (숫자가 아니거나 0 이하이면 None)"""
+    try:
+        value = float(prop.get(field_name))
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+@dataclass
+class ResultSet:
+    """병합된 검색 결과 집합"""
+    handle: str
+    properties: List[Dict]
+    # 정렬 옵션별 인덱스 순서 (처음 요청 시 계산 후 재사용)
+    _orders: Dict[str, List[int]] = field(default_factory=dict)
+
+    def order(self, sort: str) -> List[int]:
+        """정렬 옵션별 인덱스 순서"""
+        if sort not in self._orders:
+            field_name, reverse = SORT_OPTIONS[sort]
+            indices = list(range(len(self.properties)))
+            if field_name is not None:
+                keys = [_sort_value(p, field_name) for p in self.properties]
+                # 값이 없는 매물은 정렬 방향과 무관하게 맨 뒤에 위치
+                valid = [i for i in indices if keys[i] is not None]
+                missing = [i for i in indices if keys[i] is None]
+                valid.sort(key=keys.__getitem__, reverse=reverse)
+                indices = valid + missing
+            self._orders[sort] = indices
+        return self._orders[sort]
+
+    def page(self, sort: str, offset: int, limit: int) -> List[Dict]:
+        """한 페이지 조회"""
+        if sort == "default":
+            return self.properties[offset:offset + limit]
+        return [self.properties[i] for i in self.order(sort)[offset:offset + limit]]
+
+
+class ResultSetStore:
+    """
+    결과 집합 저장소 (LRU + TTL)
+
+    - max_sets: 최대 보관 결과 집합 수
+    - max_bytes: 최대 용량 (JSON 직렬화 기준 바이트)
+    - ttl: 결과 집합 유지 시간 (초)
+    """
+
+    def __init__(self, max_sets: int = 500, max_bytes: int = 128 * 1024 * 1024, ttl: float = 900):
+        self._sets = ResultCache(max_entries=max_sets, max_bytes=max_bytes, ttl=ttl)
+
+    def create(self, properties: List[Dict], handle: Optional[str] = None) -> str:
+        """결과 집합 저장 후 핸들 반환 (handle을 주면 그 핸들로 저장/갱신)"""
+        handle = handle or uuid.uuid4().hex
+        size = len(json.dumps(properties, ensure_ascii=False, default=str).encode('utf-8'))
+        self._sets.set(handle, ResultSet(handle=handle, properties=properties), size=size)
+        return handle
+
+    def get(self, handle: str) -> Optional[ResultSet]:
+        """결과 집합 조회"""
+        return self._sets.get(handle)
+
+    def page(self, handle: str, cursor: Optional[str] = None, limit: int = 20,
+             sort: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        커서 기반 페이지 조회
+
+        Args:
+            handle: 결과 집합 핸들
+            cursor: 이전 페이지의 nextCursor (없으면 첫 페이지)
+            limit: 페이지 크기
+            sort: 정렬 옵션 (커서와 함께 주어지면 커서의 정렬과 같아야 함)
+
+        Returns:
+            페이지 데이터 또는 None (핸들 만료/없음)
+        """
+        if cursor:
+            cursor_sort, offset = decode_cursor(cursor)
+            if sort and sort != cursor_sort:
+                raise InvalidCursorError("Cursor was issued for a different sort order")
+            sort = cursor_sort
+        else:
+            sort = sort or "default"
+            offset = 0
+            if sort not in SORT_OPTIONS:
+                raise InvalidCursorError(f"Unknown sort option: {sort}")
+
+        result_set = self.get(handle)
+        if result_set is None:
+            return None
+
+        total = len(result_set.properties)
+        next_offset = offset + limit
+        return {
+            "resultHandle": handle,
+            "sort": sort,
+            "totalCount": total,
+            "properties": result_set.page(sort, offset, limit),
+            "nextCursor": encode_cursor(sort, next_offset) if next_offset < total else None
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 통계"""
+        return self._sets.stats()
@@ -0,0 +1,56 @@
+"""
+동일 요청 병합 (single-flight) - 같은 키의 동시 요청은 하나의 업스트림 호출을 공유
+"""
+from typing import Any, Awaitable, Callable, Dict
+import asyncio
+
+
+class SingleFlight:
+    """
+    키별 진행 중 작업 공유
+
+    첫 요청(leader)이 작업을 태스크로 시작하고, 같은 키로 동시에 들어온
+    요청(follower)은 같은 태스크의 결과를 기다린다. 작업이 실패하면 같은
+    예외가 leader와 모든 follower에게 전달된다. 작업은 별도 태스크에서
+    실행되므로 한 요청이 취소되어도 다른 요청이 기다리는 작업은 계속된다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # 통계 카운터
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """키 단위로 작업 실행 (진행 중이면 결과 공유)"""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            self.leaders += 1
+            task.add_done_callback(lambda t, k=key: self._done(k, t))
+
+        return await asyncio.shield(task)
+
+    def _done(self, key: str, task: asyncio.Task):
+        """완료된 작업 정리"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 대기자가 취소된 경우에도 예외 미조회 경고가 나지 않도록 조회
+        if not task.cancelled():
+            task.exception()
+
+    def is_inflight(self, key: str) -> bool:
+        """해당 키의 작업 진행 여부"""
+        return key in self._inflight
+
+    def stats(self) -> Dict[str, int]:
+        """병합 통계"""
+        return {
+            "inflight": len(self._inflight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced
+        }
@@ -0,0 +1,196 @@
+"""
+로컬 스냅샷 저장소 - 수집기가 만든 JSON 스냅샷을 mmap 레코드 + 주소 인덱스로 제공
+
+scripts/collectors의 다방/KB 수집기가 저장한 스냅샷 파일(예: dabang_samsung1dong_*.json)을
+한 번만 파싱해 레코드 파일로 옮기고 mmap으로 연다. 주소 bigram 인덱스로 후보를 좁힌 뒤
+일치하는 레코드만 디코딩하므로 요청마다 JSON 전체를 파싱하지 않는다.
+새 스냅샷이 생기면 백그라운드에서 새 인덱스를 만든 뒤 참조를 교체한다.
+"""
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import asyncio
+import json
+import mmap
+import tempfile
+
+
+def _grams(text: str) -> set:
+    """문자 bigram 집합"""
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class PropertySnapshot:
+    """mmap된 레코드 파일과 주소 인덱스로 구성된 단일 스냅샷"""
+
+    def __init__(self, source: Path, mtime: float, records: mmap.mmap, file,
+                 offsets: array, addresses: List[str], index: Dict[str, array]):
+        self.source = source
+        self.mtime = mtime
+        self._records = records
+        self._file = file
+        self._offsets = offsets
+        self._addresses = addresses
+        self._index = index
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    @classmethod
+    def build(cls, source: Path) -> "PropertySnapshot":
+        """JSON 스냅샷에서 레코드 파일과 인덱스 생성"""
+        mtime = source.stat().st_mtime
+        with open(source, encoding='utf-8') as f:
+            data = json.load(f)
+        properties = data.get('properties', []) if isinstance(data, dict) else data
+
+        # 레코드 파일: 매물별 JSON을 이어 붙이고 시작 위치를 기록 (마지막 값은 파일 끝)
+        file = tempfile.TemporaryFile()
+        offsets = array('Q', [0])
+        addresses: List[str] = []
+        index: Dict[str, array] = {}
+
+        position = 0
+        for prop in properties:
+            if not isinstance(prop, dict):
+                continue
+            record = {k: v for k, v in prop.items() if k != 'raw_data'}
+            encoded = json.dumps(record, ensure_ascii=False, default=str).encode('utf-8')
+            file.write(encoded)
+            position += len(encoded)
+            offsets.append(position)
+
+            record_id = len(addresses)
+            address = str(prop.get('address', '')).lower()
+            addresses.append(address)
+            for gram in _grams(address):
+                index.setdefault(gram, array('I')).append(record_id)
+
+        file.flush()
+        if position:
+            records = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            records = None
+        return cls(source, mtime, records, file, offsets, addresses, index)
+
+    def _record(self, record_id: int) -> Dict:
+        start, end = self._offsets[record_id], self._offsets[record_id + 1]
+        return json.loads(self._records[start:end])
+
+    def search(self, address: str, limit: int = 20) -> List[Dict]:
+        """주소 부분 문자열 검색"""
+        query = address.lower()
+        grams = _grams(query)
+
+        if grams:
+            # 가장 짧은 포스팅만 후보로 쓰고 부분 문자열 비교로 확인
+            postings = [self._index.get(g) for g in grams]
+            if not all(postings):
+                return []
+            candidates = min(postings, key=len)
+        else:
+            candidates = range(len(self._addresses))
+
+        results = []
+        for record_id in candidates:
+            if query in self._addresses[record_id]:
+                results.append(self._record(record_id))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def close(self):
+        """mmap과 레코드 파일 정리"""
+        if self._records is not None:
+            self._records.close()
+        self._file.close()
+
+
+class SnapshotStore:
+    """
+    플랫폼별 스냅샷 저장소
+
+    - platform: 플랫폼 이름 (dabang, kb)
+    - pattern: 스냅샷 파일 glob 패턴
+    - directories: 스냅샷을 찾을 디렉터리 목록
+    """
+
+    def __init__(self, platform: str, pattern: str, directories: Sequence[Path]):
+        self.platform = platform
+        self.pattern = pattern
+        self.directories = [Path(d) for d in directories]
+        self._snapshot: Optional[PropertySnapshot] = None
+        self._lock = asyncio.Lock()
+
+        # 통계 카운터
+        self.loads = 0
+        self.load_errors = 0
+
+    def latest_source(self) -> Optional[Path]:
+        """가장 최근에 수정된 스냅샷 파일"""
+        candidates = [
+            path for directory in self.directories if directory.is_dir()
+            for path in directory.glob(self.pattern)
+        ]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda p: p.stat().st_mtime)
+
+    async def refresh(self) -> bool:
+        """새 스냅샷이 있으면 인덱스를 만들어 교체"""
+        async with self._lock:
+            source = self.latest_source()
+            if source is None:
+                return False
+
+            current = self._snapshot
+            if current is not None and current.source == source \
+                    and current.mtime >= source.stat().st_mtime:
+                return False
+
+            loop = asyncio.get_running_loop()
+            try:
+                snapshot = await loop.run_in_executor(None, PropertySnapshot.build, source)
+            except (OSError, ValueError) as e:
+                self.load_errors += 1
+                print(f"{self.platform} 스냅샷 로드 오류 ({source}): {e}")
+                return False
+
+            # 참조 교체 후 이전 스냅샷 정리 (검색은 동기 실행이라 교체 중 사용되지 않음)
+            self._snapshot = snapshot
+            self.loads += 1
+            if current is not None:
+                current.close()
+            return True
+
+    def search(self, address: str, limit: int = 20) -> List[Dict]:
+        """주소 검색 (스냅샷이 없으면 빈 리스트)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return snapshot.search(address, limit)
+
+    def close(self):
+        """스냅샷 정리"""
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    def stats(self) -> Dict:
+        """저장소 상태"""
+        snapshot = self._snapshot
+        return {
+            "platform": self.platform,
+            "source": str(snapshot.source) if snapshot else None,
+            "records": len(snapshot) if snapshot else 0,
+            "loads": self.loads,
+            "load_errors": self.load_errors
+        }
+
+
+async def watch_snapshots(stores: Sequence[SnapshotStore], interval: float):
+    """주기적으로 새 스냅샷 확인"""
+    while True:
+        await asyncio.sleep(interval)
+        for store in stores:
+            await store.refresh()
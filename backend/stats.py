@@ -0,0 +1,50 @@
+"""
+검색 결과 통계 - 플랫폼별 결과가 도착할 때마다 누적 갱신
+"""
+from typing import Any, Dict, Iterable, Optional
+
+
+class SearchStats:
+    """검색 결과 통계 누적기"""
+
+    def __init__(self):
+        self.by_platform: Dict[str, int] = {}
+        self.by_type: Dict[str, int] = {}
+        self.total_count = 0
+        self.price_min: Optional[int] = None
+        self.price_max: Optional[int] = None
+        self._price_sum = 0
+        self._price_count = 0
+
+    def add(self, properties: Iterable[Dict]):
+        """매물 목록 반영"""
+        for prop in properties:
+            self.total_count += 1
+
+            platform = prop.get('platform', 'unknown')
+            self.by_platform[platform] = self.by_platform.get(platform, 0) + 1
+
+            prop_type = prop.get('type', 'unknown')
+            self.by_type[prop_type] = self.by_type.get(prop_type, 0) + 1
+
+            # 가격 통계 (0 이하 가격 제외)
+            price = prop.get('price', 0)
+            if price and price > 0:
+                self._price_sum += price
+                self._price_count += 1
+                if self.price_min is None or price < self.price_min:
+                    self.price_min = price
+                if self.price_max is None or price > self.price_max:
+                    self.price_max = price
+
+    def to_dict(self) -> Dict[str, Any]:
+        """응답용 통계 (기존 stats 형식)"""
+        return {
+            "byPlatform": dict(self.by_platform),
+            "byType": dict(self.by_type),
+            "priceRange": {
+                "min": self.price_min,
+                "max": self.price_max,
+                "avg": self._price_sum / self._price_count if self._price_count else None
+            }
+        }
@@ -0,0 +1,91 @@
+"""
+수집기 처리량 벤치마크 - 로컬 대역 업스트림 서버(src/fake_upstream) 대상
+
+대역 서버를 같은 프로세스에서 띄우고 기본 URL 환경 변수를 설정한 뒤
+직방/다방/네이버 모바일 수집기를 실행해 수집 건수, 소요 시간, 업스트림 요청 수를 출력한다.
+
+실행: python scripts/benchmarks/bench_collectors_fake_upstream.py [--areas 4] [--items 20]
+      [--latency 0.05] [--error-rate 0.0] [--platforms zigbang,dabang,naver]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.fake_upstream.server import BASE_URL_ENV, PLATFORMS, UpstreamProfile, start_fake_upstreams
+
+AREAS = ["강남구", "서초구", "송파구", "강동구", "마포구", "용산구", "성동구", "광진구"]
+
+
+async def run_collector(platform: str, areas, max_items: int) -> int:
+    """플랫폼 수집기로 여러 지역을 동시에 수집하고 수집 건수 반환"""
+    # 기본 URL 환경 변수를 읽도록 대역 서버 시작 후 import
+    if platform == "zigbang":
+        from src.mcp.collectors.zigbang_collector import ZigbangCollector
+        async with ZigbangCollector() as collector:
+            results = await asyncio.gather(*(
+                collector.collect(area, room_type="officetel", max_items=max_items) for area in areas
+            ))
+    elif platform == "dabang":
+        from src.mcp.collectors.dabang_collector import DabangCollector
+        async with DabangCollector() as collector:
+            results = await asyncio.gather(*(
+                collector.collect(area, max_items=max_items) for area in areas
+            ))
+    else:
+        from src.mcp.collectors.naver_mobile_collector import NaverMobileCollector, PropertyType, TradeType
+        async with NaverMobileCollector() as collector:
+            results = await asyncio.gather(*(
+                collector._search_by_type(area, PropertyType.APT, TradeType.SALE) for area in areas
+            ))
+    return sum(len(r) for r in results)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="대역 업스트림 대상 수집기 벤치마크")
+    parser.add_argument("--areas", type=int, default=4, help="동시에 수집할 지역 수")
+    parser.add_argument("--items", type=int, default=20, help="지역당 최대 수집 건수")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--platforms", default="zigbang,dabang,naver")
+    args = parser.parse_args()
+
+    profile = dict(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate, pages=args.pages, page_size=args.page_size
+    )
+    runners, base_urls = await start_fake_upstreams({p: UpstreamProfile(**profile) for p in PLATFORMS})
+    for platform, url in base_urls.items():
+        os.environ[BASE_URL_ENV[platform]] = url
+    upstreams = dict(zip(PLATFORMS, (runner.app["upstream"] for runner in runners)))
+
+    areas = AREAS[:args.areas]
+    print(f"대역 서버: {base_urls}")
+    print(f"지역 {len(areas)}개, 지역당 최대 {args.items}건, 지연 {args.latency}s, 오류 비율 {args.error_rate}")
+    print(f"{'platform':<10}{'items':>8}{'seconds':>10}{'items/s':>10}{'requests':>10}{'errors':>8}")
+
+    try:
+        for platform in args.platforms.split(","):
+            before = upstreams[platform].requests
+            start = time.perf_counter()
+            count = await run_collector(platform, areas, args.items)
+            elapsed = time.perf_counter() - start
+            upstream = upstreams[platform]
+            print(f"{platform:<10}{count:>8}{elapsed:>10.2f}{count / elapsed:>10.1f}"
+                  f"{upstream.requests - before:>10}{upstream.errors + upstream.throttled:>8}")
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
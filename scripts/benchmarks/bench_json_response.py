@@ -0,0 +1,104 @@
+"""
+JSON 응답 직렬화 마이크로벤치마크 - FastAPI 기본 경로 vs FastJSONResponse
+
+기본 경로: jsonable_encoder로 변환 후 JSONResponse.render (json.dumps)
+고속 경로: FastJSONResponse.render (orjson, 없으면 json.dumps)
+
+실행: python scripts/benchmarks/bench_json_response.py [반복 횟수]
+"""
+import json
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.mcp.json_response import FastJSONResponse, orjson
+
+DONGS = ["삼성동", "역삼동", "대치동", "청담동", "논현동", "도곡동"]
+TYPES = ["아파트", "오피스텔", "빌라", "원룸"]
+TRADES = ["매매", "전세", "월세"]
+
+
+def make_property(i: int, now: datetime) -> dict:
+    """실시간 검색 응답과 같은 형태의 매물"""
+    dong = random.choice(DONGS)
+    platform = random.choice(["naver", "zigbang", "dabang", "kb"])
+    return {
+        'id': f"{platform.upper()}_{1000000 + i}",
+        'platform': platform,
+        'title': f"{dong} 래미안 {random.randint(101, 120)}동 {random.randint(1, 30)}층",
+        'address': f"서울 강남구 {dong} {random.randint(1, 999)}-{random.randint(1, 30)}",
+        'price': random.randint(1000, 500000),
+        'area': round(random.uniform(20, 200), 2),
+        'floor': f"{random.randint(1, 30)}/{random.randint(15, 35)}",
+        'type': random.choice(TYPES),
+        'trade_type': random.choice(TRADES),
+        'monthly_rent': random.randint(0, 300),
+        'lat': 37.5 + random.random() / 50,
+        'lng': 127.0 + random.random() / 50,
+        'description': "역세권, 남향, 풀옵션, 즉시 입주 가능한 깨끗한 매물입니다",
+        'url': f"https://m.land.naver.com/article/info/{1000000 + i}",
+        'collected_at': now - timedelta(seconds=i)
+    }
+
+
+def make_payload(count: int) -> dict:
+    """실시간 검색 응답 형태의 페이로드"""
+    now = datetime.now()
+    properties = [make_property(i, now) for i in range(count)]
+    prices = [p['price'] for p in properties]
+    return {
+        "query": "삼성동",
+        "platforms": ["naver", "zigbang", "dabang", "kb"],
+        "totalCount": count,
+        "properties": properties,
+        "stats": {
+            "byPlatform": {"naver": count // 2, "zigbang": count - count // 2},
+            "byType": {t: count // len(TYPES) for t in TYPES},
+            "priceRange": {"min": min(prices), "max": max(prices), "avg": sum(prices) / count}
+        },
+        "cached": False,
+        "stale": False,
+        "timestamp": now,
+        "errors": None,
+        "timedOut": []
+    }
+
+
+def default_path(payload: dict) -> bytes:
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+def fast_path(payload: dict) -> bytes:
+    return FastJSONResponse(payload).body
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    random.seed(42)
+
+    print(f"serializer: {'orjson' if orjson else 'json (orjson 미설치)'}, 반복: {number}")
+    print(f"{'매물 수':>8} {'기본 경로(ms)':>14} {'고속 경로(ms)':>14} {'배속':>7} {'응답 크기(KB)':>14}")
+
+    for count in (100, 1000):
+        payload = make_payload(count)
+        body = fast_path(payload)
+
+        # 두 경로의 결과가 같은 JSON인지 확인 (datetime은 ISO 문자열)
+        assert json.loads(body) == json.loads(default_path(payload))
+
+        default_ms = min(timeit.repeat(lambda: default_path(payload), number=number, repeat=3)) / number * 1000
+        fast_ms = min(timeit.repeat(lambda: fast_path(payload), number=number, repeat=3)) / number * 1000
+
+        print(f"{count:>8} {default_ms:>14.3f} {fast_ms:>14.3f} {default_ms / fast_ms:>6.1f}x {len(body) / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
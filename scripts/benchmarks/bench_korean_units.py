@@ -0,0 +1,163 @@
+"""
+가격/면적 파싱 벤치마크 - 기존 str.replace + 예외 방식 vs korean_units
+
+100만 개(기본값) 가격/면적 문자열 코퍼스를 만들어 세 가지 경로를 비교한다.
+    legacy: 기존 BaseCollector.normalize_price/normalize_area 구현
+    scalar: parse_price/parse_area (정규식 + 캐시, 캐시를 비운 상태에서 시작)
+    batch:  parse_prices/parse_areas (열 고유값만 파싱)
+
+실행: python scripts/benchmarks/bench_korean_units.py [문자열 수]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.mcp.collectors import korean_units
+from src.mcp.collectors.korean_units import parse_area, parse_areas, parse_price, parse_prices
+
+
+def legacy_price(price_str):
+    """기존 BaseCollector.normalize_price (로깅 제외)"""
+    if not price_str:
+        return None
+    try:
+        price_str = price_str.replace(',', '').replace(' ', '')
+        if '억' in price_str:
+            parts = price_str.split('억')
+            eok = int(parts[0]) * 10000
+            man = 0
+            if len(parts) > 1 and parts[1]:
+                man_str = parts[1].replace('만', '').replace('원', '')
+                if man_str:
+                    man = int(man_str)
+            return eok + man
+        elif '만' in price_str:
+            return int(price_str.replace('만', '').replace('원', ''))
+        else:
+            return int(price_str)
+    except Exception:
+        return None
+
+
+def legacy_area(area_str):
+    """기존 BaseCollector.normalize_area (로깅 제외)"""
+    if not area_str:
+        return None
+    try:
+        area_str = area_str.replace(' ', '')
+        if '㎡' in area_str or 'm²' in area_str:
+            return float(area_str.replace('㎡', '').replace('m²', ''))
+        elif '평' in area_str:
+            return float(area_str.replace('평', '')) * 3.3058
+        else:
+            return float(area_str)
+    except Exception:
+        return None
+
+
+# 기존 구현이 해석하지 못하던 표기와 기대값 (숫자만 골라내지 않고 표기 전체를 해석해야 함)
+AREA_CASES = {
+    "B1층 84㎡": 84.0,
+    "abc 12": None,
+    "12층": None,
+    "전용 84.95㎡": 84.95,
+    "112/84㎡": 84.0,
+    "84": 84.0,
+    "": None,
+}
+PRICE_CASES = {
+    "abc 12": None,
+    "3억 5천": 35000,
+    "12,000/80": 12000,
+    "매매 12억": 120000,
+    "": None,
+}
+
+
+def check_cases():
+    """표기별 기대값 확인 (스칼라/일괄 함수 모두)"""
+    for cases, scalar, batch in ((AREA_CASES, parse_area, parse_areas),
+                                 (PRICE_CASES, parse_price, parse_prices)):
+        values = list(cases)
+        expected = list(cases.values())
+        assert [scalar(v) for v in values] == expected, [scalar(v) for v in values]
+        assert batch(values) == expected
+    print(f"표기별 기대값: {len(AREA_CASES) + len(PRICE_CASES)}개 일치")
+
+
+def make_price(rng: random.Random) -> str:
+    """수집기에서 보는 가격 표기"""
+    man = rng.randrange(500, 400000, 500)
+    eok, rest = divmod(man, 10000)
+    form = rng.random()
+    if form < 0.35:
+        return f"{eok}억 {rest:,}" if eok and rest else (f"{eok}억" if eok else f"{rest:,}")
+    if form < 0.5:
+        return f"{eok}억" if eok else f"{rest:,}만원"
+    if form < 0.65:
+        return f"{man:,}만원"
+    if form < 0.8:
+        return str(man)
+    if form < 0.9:
+        return f"{rng.randrange(500, 20000, 500):,}/{rng.randrange(30, 300, 5)}"
+    return f"{rng.choice(['매매', '전세'])} {eok}억 {rest:,}" if eok else f"전세 {rest:,}"
+
+
+def make_area(rng: random.Random) -> str:
+    """수집기에서 보는 면적 표기"""
+    form = rng.random()
+    if form < 0.6:
+        return f"{rng.uniform(20, 200):.2f}㎡"
+    if form < 0.8:
+        return f"{rng.randint(5, 60)}평"
+    if form < 0.9:
+        return f"{rng.uniform(20, 200):.1f}"
+    return f"{rng.randint(30, 250)}/{rng.randint(20, 200)}㎡"
+
+
+def timed(label: str, fn, values):
+    start = time.perf_counter()
+    results = fn(values)
+    elapsed = time.perf_counter() - start
+    parsed = sum(r is not None for r in results)
+    print(f"{label:<16}{elapsed:>8.3f}s{elapsed / len(values) * 1e9:>10.0f} ns/item{parsed:>12,} parsed")
+    return results
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    prices = [make_price(rng) for _ in range(size)]
+    areas = [make_area(rng) for _ in range(size)]
+    check_cases()
+    print(f"코퍼스: 가격 {size:,}개 (고유 {len(set(prices)):,}), 면적 {size:,}개 (고유 {len(set(areas)):,})")
+
+    for name, values, legacy, scalar, batch in (
+        ("price", prices, legacy_price, parse_price, parse_prices),
+        ("area", areas, legacy_area, parse_area, parse_areas)
+    ):
+        print(f"\n[{name}]")
+        legacy_results = timed("legacy", lambda v: [legacy(x) for x in v], values)
+        korean_units._parse_price_info.cache_clear()
+        korean_units._parse_area_pair.cache_clear()
+        scalar_results = timed("scalar", lambda v: [scalar(x) for x in v], values)
+        batch_results = timed("batch", batch, values)
+        assert scalar_results == batch_results
+
+        # 기존 구현이 해석한 값은 결과가 같아야 함
+        mismatches = sum(
+            1 for old, new in zip(legacy_results, scalar_results)
+            if old is not None and (new is None or abs(old - new) > 1e-6)
+        )
+        print(f"legacy와 다른 결과: {mismatches}")
+        assert mismatches == 0
+
+    print(f"\n캐시: {korean_units.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
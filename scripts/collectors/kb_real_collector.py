@@ -6,11 +6,18 @@ Playwright를 사용하여 실제 웹사이트를 스크래핑합니다.
 
 import asyncio
 import json
+import os
 from datetime import datetime
 from loguru import logger
 import sys
+from pathlib import Path
 from playwright.async_api import async_playwright
 
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.mcp.collectors.korean_units import parse_area, parse_price
+
 # 한글 출력 설정
 sys.stdout.reconfigure(encoding='utf-8')
 
@@ -19,8 +26,9 @@ class KBRealCollector:
     """KB부동산 웹 스크래핑 수집기"""
     
     def __init__(self):
-        self.base_url = "https://onland.kbstar.com"
-        self.search_url = "https://onland.kbstar.com/quics?page=C020800&cc=b061373:b061374"
+        # KB_BASE_URL 환경 변수로 덮어쓰기 (로컬 대역 서버로 벤치마크할 때)
+        self.base_url = os.getenv("KB_BASE_URL", "https://onland.kbstar.com").rstrip("/")
+        self.search_url = f"{self.base_url}/quics?page=C020800&cc=b061373:b061374"
         
     async def collect_samsung1dong(self, max_items=2000):
         """삼성1동 매물 수집"""
@@ -292,65 +300,12 @@ class KBRealCollector:
             return None
     
     def _parse_price(self, price_text):
-        """가격 문자열 파싱"""
-        try:
-            if not price_text:
-                return 0
-                
-            # 숫자와 단위 추출
-            price_text = price_text.replace(',', '').replace(' ', '')
-            
-            # 억 단위 처리
-            if '억' in price_text:
-                parts = price_text.split('억')
-                eok = int(''.join(filter(str.isdigit, parts[0]))) * 10000
-                
-                man = 0
-                if len(parts) > 1 and parts[1]:
-                    man_part = ''.join(filter(str.isdigit, parts[1]))
-                    if man_part:
-                        man = int(man_part)
-                        
-                return eok + man
-                
-            # 만원 단위
-            elif '만' in price_text:
-                return int(''.join(filter(str.isdigit, price_text)))
-                
-            # 숫자만
-            else:
-                numbers = ''.join(filter(str.isdigit, price_text))
-                return int(numbers) if numbers else 0
-                
-        except Exception as e:
-            logger.debug(f"Price parsing error: {price_text} - {e}")
-            return 0
+        """가격 문자열 파싱 (만원, 실패 시 0)"""
+        return parse_price(price_text) or 0
     
     def _parse_area(self, area_text):
-        """면적 문자열 파싱"""
-        try:
-            if not area_text:
-                return 0
-                
-            # 제곱미터 추출
-            if '㎡' in area_text or 'm²' in area_text:
-                numbers = ''.join(filter(lambda x: x.isdigit() or x == '.', area_text))
-                return float(numbers) if numbers else 0
-                
-            # 평 단위 (평 -> 제곱미터 변환)
-            elif '평' in area_text:
-                numbers = ''.join(filter(lambda x: x.isdigit() or x == '.', area_text))
-                pyeong = float(numbers) if numbers else 0
-                return pyeong * 3.3058
-                
-            # 숫자만
-            else:
-                numbers = ''.join(filter(lambda x: x.isdigit() or x == '.', area_text))
-                return float(numbers) if numbers else 0
-                
-        except Exception as e:
-            logger.debug(f"Area parsing error: {area_text} - {e}")
-            return 0
+        """면적 문자열 파싱 (㎡, 실패 시 0)"""
+        return parse_area(area_text) or 0
     
     def _determine_property_type(self, title, address):
         """매물 유형 결정"""
@@ -0,0 +1,47 @@
+"""
+요청 제한 테스트 - 클라이언트 한도는 접속 주소 기준이어야 함
+
+X-Client-Id를 요청마다 바꿔도 같은 주소에서 온 업스트림 검색은 한 버킷에서 차감되어
+burst를 넘으면 429로 거절되는지 확인한다.
+
+실행: python scripts/tests/admission_test.py (또는 pytest scripts/tests)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from fastapi.testclient import TestClient
+
+import backend.app as backend
+from backend.admission import AdmissionController, PlatformLimit
+
+BURST = 2
+
+
+async def empty_region(region):
+    return []
+
+
+def test_client_id_header_does_not_reset_the_bucket():
+    backend.REGION_FETCHERS["naver"] = empty_region
+    backend.admission = AdmissionController({
+        "naver": PlatformLimit(rate=0.01, burst=BURST, max_concurrent=8)
+    })
+    asyncio.run(backend.cache.clear())
+    client = TestClient(backend.app)
+
+    statuses = [
+        client.get("/api/search/realtime",
+                   params={"address": f"삼성동 {i}", "platforms": "naver"},
+                   headers={"X-Client-Id": f"tab-{i}"}).status_code
+        for i in range(BURST + 1)
+    ]
+    assert statuses == [200] * BURST + [429]
+
+
+if __name__ == "__main__":
+    test_client_id_header_does_not_reset_the_bucket()
+    print("ok")
@@ -0,0 +1,83 @@
+"""
+일괄 검색 테스트 - 캐시에 없는 지역이 클라이언트 한도(burst)보다 많아도 거절하지 않아야 함
+
+네이버/직방 지역 조회를 대역 함수로 바꾸고 burst 5인 한도로 8개 동의 주소를 요청해
+한도만큼 조회하고 나머지는 deferred로 돌려준 뒤, 재시도하면 모두 채워지는지 확인한다.
+
+실행: python scripts/tests/batch_search_test.py (또는 pytest scripts/tests)
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from fastapi.testclient import TestClient
+
+import backend.app as backend
+from backend.admission import AdmissionController, PlatformLimit
+
+BURST = 5
+DONGS = ["삼성동", "대치동", "역삼동", "논현동", "청담동", "압구정동", "개포동", "도곡동"]
+ADDRESSES = [f"서울 강남구 {dong} 1" for dong in DONGS]
+
+
+def use_stub_upstream():
+    """주소마다 매물 하나를 돌려주는 지역 조회와 새 한도"""
+    fetched = []
+
+    def stub_fetcher(platform: str):
+        async def fetch(region):
+            fetched.append((platform, region.display_name))
+            return [{
+                'id': f"{platform.upper()}_{region.display_name}",
+                'platform': platform,
+                'title': region.display_name,
+                'address': f"{region.display_name} 1",
+                'price': 10000
+            }]
+        return fetch
+
+    backend.REGION_FETCHERS["naver"] = stub_fetcher("naver")
+    backend.REGION_FETCHERS["zigbang"] = stub_fetcher("zigbang")
+    backend.admission = AdmissionController({
+        "naver": PlatformLimit(rate=2, burst=BURST, max_concurrent=8),
+        "zigbang": PlatformLimit(rate=2, burst=BURST, max_concurrent=8)
+    })
+    asyncio.run(backend.cache.clear())
+    return fetched
+
+
+def test_batch_larger_than_burst_defers_the_rest():
+    fetched = use_stub_upstream()
+    client = TestClient(backend.app)
+    batch = {"addresses": ADDRESSES, "platforms": "naver,zigbang"}
+
+    first = client.post("/api/search/batch", json=batch)
+    assert first.status_code == 200
+    body = first.json()
+    assert body["regionCount"] == BURST
+    assert body["deferredCount"] == len(ADDRESSES) - BURST
+    deferred = [r["query"] for r in body["results"] if r.get("deferred")]
+    assert deferred == ADDRESSES[BURST:]
+    assert int(first.headers["Retry-After"]) >= 1
+    assert len(fetched) == BURST * 2
+
+    # 한도가 없으면 429, Retry-After만큼 기다리면 나머지를 조회
+    assert client.post("/api/search/batch", json=batch).status_code == 429
+    time.sleep(int(first.headers["Retry-After"]))
+    second = client.post("/api/search/batch", json=batch)
+    assert second.status_code == 200
+    body = second.json()
+    assert body["deferredCount"] == 0
+    assert body["cachedCount"] == BURST
+    assert "Retry-After" not in second.headers
+    assert all(r["totalCount"] == 2 for r in body["results"])
+    assert len(fetched) == len(ADDRESSES) * 2
+
+
+if __name__ == "__main__":
+    test_batch_larger_than_burst_defers_the_rest()
+    print("ok")
@@ -0,0 +1,96 @@
+"""
+collect_stream 조기 종료 테스트 - 중간에 멈추면 직방 파이프라인 작업이 남지 않아야 함
+
+목록/상세 조회를 대역 데이터로 바꾼 직방 수집기로 200건 중 5건만 받고
+break 또는 aclose()로 멈춘 뒤 남은 작업이 없는지 확인한다.
+
+실행: python scripts/tests/collect_stream_test.py (또는 pytest scripts/tests)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.fake_upstream.payloads import zigbang_detail
+from src.mcp.collectors.zigbang_collector import ZigbangCollector
+
+TOTAL = 200
+STOP_AFTER = 5
+
+
+class StubZigbangCollector(ZigbangCollector):
+    """네트워크 없이 목록/상세를 만들어 내는 직방 수집기"""
+
+    def __init__(self):
+        super().__init__()
+        self.queue_size = 2  # 큐가 가득 찬 상태에서 멈추는 경우 확인
+        self.detail_workers = 4
+
+    async def _get_area_id(self, area):
+        return "1168064000"
+
+    async def _iter_property_list(self, area_id, room_type, trade_type, limit):
+        for start in range(0, limit, 20):
+            await asyncio.sleep(0)
+            yield [{'item_id': 10000000 + i} for i in range(start, min(start + 20, limit))]
+
+    async def _get_property_detail(self, item_id):
+        await asyncio.sleep(0.001)
+        return zigbang_detail(item_id)
+
+
+async def leftover_tasks():
+    """정리가 끝날 시간을 준 뒤 현재 작업 외에 남은 작업 목록"""
+    for _ in range(20):
+        await asyncio.sleep(0.01)
+    return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+
+async def stop_with_break():
+    collector = StubZigbangCollector()
+    received = 0
+    async for _ in collector.collect_stream("강남구", max_items=TOTAL):
+        received += 1
+        if received >= STOP_AFTER:
+            break
+    assert received == STOP_AFTER
+    return await leftover_tasks()
+
+
+async def stop_with_aclose():
+    collector = StubZigbangCollector()
+    stream = collector.collect_stream("강남구", max_items=TOTAL)
+    for _ in range(STOP_AFTER):
+        await stream.__anext__()
+    await stream.aclose()
+    return await leftover_tasks()
+
+
+async def collect_all():
+    collector = StubZigbangCollector()
+    properties = await collector.collect("강남구", max_items=TOTAL)
+    expected = [collector.create_property_id('zigbang', str(10000000 + i)) for i in range(TOTAL)]
+    return properties, expected, await leftover_tasks()
+
+
+def test_break_leaves_no_tasks():
+    assert asyncio.run(stop_with_break()) == []
+
+
+def test_aclose_leaves_no_tasks():
+    assert asyncio.run(stop_with_aclose()) == []
+
+
+def test_collect_returns_all_in_order():
+    properties, expected, leftover = asyncio.run(collect_all())
+    assert leftover == []
+    assert [p['id'] for p in properties] == expected
+
+
+if __name__ == "__main__":
+    test_break_leaves_no_tasks()
+    test_aclose_leaves_no_tasks()
+    test_collect_returns_all_in_order()
+    print("ok")
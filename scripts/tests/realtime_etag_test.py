@@ -0,0 +1,108 @@
+"""
+실시간 검색 ETag 테스트 - 업스트림 내용이 같으면 다시 조회해도 ETag와 결과 핸들이 같아야 함
+
+네이버/직방 지역 조회를 매번 수집 시각만 새로 찍는 대역 함수로 바꾸고
+캐시를 비운 뒤 다시 조회했을 때 304로 응답하는지 확인한다.
+
+실행: python scripts/tests/realtime_etag_test.py (또는 pytest scripts/tests)
+"""
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from fastapi.testclient import TestClient
+
+import backend.app as backend
+from backend.admission import AdmissionController
+
+ADDRESS = "삼성동 151-7"
+PLATFORMS = "naver,zigbang"
+
+
+def stub_fetcher(platform: str):
+    """항상 같은 매물을 돌려주되 collected_at만 조회 시각으로 채우는 지역 조회"""
+    async def fetch(region):
+        return [
+            {
+                'id': f"{platform.upper()}_{i}",
+                'platform': platform,
+                'title': f"매물 {i}",
+                'address': f"{region.display_name} {ADDRESS}",
+                'price': 10000 + i,
+                'area': 84.9,
+                'collected_at': datetime.now().isoformat()
+            }
+            for i in range(3)
+        ]
+    return fetch
+
+
+def use_stub_upstream():
+    """대역 지역 조회와 제한 없는 요청 한도"""
+    backend.REGION_FETCHERS["naver"] = stub_fetcher("naver")
+    backend.REGION_FETCHERS["zigbang"] = stub_fetcher("zigbang")
+    backend.admission = AdmissionController({})
+
+
+def test_refetch_keeps_etag_and_handle():
+    use_stub_upstream()
+
+    async def fetch_twice():
+        cache_key = f"{ADDRESS}_{PLATFORMS}"
+        first = await backend.fetch_realtime_result(ADDRESS, PLATFORMS, cache_key)
+        await asyncio.sleep(0.01)
+        second = await backend.fetch_realtime_result(ADDRESS, PLATFORMS, cache_key)
+        return first, second
+
+    first, second = asyncio.run(fetch_twice())
+    assert first["totalCount"] == 6
+    assert first["properties"][0]["collected_at"] != second["properties"][0]["collected_at"]
+    assert first["etag"] == second["etag"]
+    assert first["resultHandle"] == second["resultHandle"]
+
+
+def test_refetch_answers_poll_with_304():
+    use_stub_upstream()
+    client = TestClient(backend.app)
+    params = {"address": ADDRESS, "platforms": PLATFORMS}
+
+    asyncio.run(backend.cache.clear())
+    first = client.get("/api/search/realtime", params=params)
+    assert first.status_code == 200
+    assert first.headers["X-Cache"] == "MISS"
+
+    # 캐시가 비워져도(만료/재시작) 같은 내용이면 폴링은 304
+    asyncio.run(backend.cache.clear())
+    second = client.get("/api/search/realtime", params=params,
+                        headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 304
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+
+def test_cached_flags_stay_in_body_and_headers_are_exposed():
+    use_stub_upstream()
+    client = TestClient(backend.app)
+    params = {"address": ADDRESS, "platforms": PLATFORMS}
+    origin = {"Origin": "http://dashboard.example"}
+
+    asyncio.run(backend.cache.clear())
+    fresh = client.get("/api/search/realtime", params=params, headers=origin)
+    cached = client.get("/api/search/realtime", params=params, headers=origin)
+
+    assert (fresh.json()["cached"], fresh.json()["stale"]) == (False, False)
+    assert (cached.json()["cached"], cached.json()["stale"]) == (True, False)
+    # cached/stale는 ETag에 영향을 주지 않음
+    assert cached.headers["ETag"] == fresh.headers["ETag"]
+    exposed = cached.headers["Access-Control-Expose-Headers"].lower()
+    assert "etag" in exposed and "x-cache" in exposed
+
+
+if __name__ == "__main__":
+    test_refetch_keeps_etag_and_handle()
+    test_refetch_answers_poll_with_304()
+    test_cached_flags_stay_in_body_and_headers_are_exposed()
+    print("ok")
@@ -0,0 +1,68 @@
+"""
+결과 페이지 테스트 - 결과 집합을 만든 워커가 아니어도 resultHandle/nextCursor로 조회되어야 함
+
+검색 후 결과 집합 저장소를 새로 만들어(다른 워커, 재시작) 캐시에 남은 결과의
+핸들과 커서로 다음 페이지를 조회한다.
+
+실행: python scripts/tests/result_pages_test.py (또는 pytest scripts/tests)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from fastapi.testclient import TestClient
+
+import backend.app as backend
+from backend.admission import AdmissionController
+from backend.result_sets import ResultSetStore
+
+ADDRESS = "삼성동 151-7"
+PLATFORMS = "naver,zigbang"
+PER_PLATFORM = 60
+
+
+def stub_fetcher(platform: str):
+    """플랫폼마다 PER_PLATFORM개의 매물을 돌려주는 지역 조회"""
+    async def fetch(region):
+        return [
+            {
+                'id': f"{platform.upper()}_{i}",
+                'platform': platform,
+                'title': f"매물 {i}",
+                'address': f"{region.display_name} {ADDRESS}",
+                'price': 10000 + i
+            }
+            for i in range(PER_PLATFORM)
+        ]
+    return fetch
+
+
+def test_page_after_result_sets_are_lost():
+    backend.REGION_FETCHERS["naver"] = stub_fetcher("naver")
+    backend.REGION_FETCHERS["zigbang"] = stub_fetcher("zigbang")
+    backend.admission = AdmissionController({})
+    asyncio.run(backend.cache.clear())
+    client = TestClient(backend.app)
+
+    first = client.get("/api/search/realtime", params={"address": ADDRESS, "platforms": PLATFORMS}).json()
+    assert first["totalCount"] == PER_PLATFORM * 2
+    assert first["nextCursor"] is not None
+
+    # 다른 워커/재시작: 프로세스 내 결과 집합은 없고 공유 캐시만 남음
+    backend.result_sets = ResultSetStore()
+    page = client.get(f"/api/search/results/{first['resultHandle']}",
+                      params={"cursor": first["nextCursor"], "limit": 50})
+    assert page.status_code == 200
+    body = page.json()
+    assert body["totalCount"] == PER_PLATFORM * 2
+    assert len(body["properties"]) == PER_PLATFORM * 2 - backend.RESULT_PAGE_SIZE
+
+    assert client.get("/api/search/results/unknown").status_code == 404
+
+
+if __name__ == "__main__":
+    test_page_after_result_sets_are_lost()
+    print("ok")
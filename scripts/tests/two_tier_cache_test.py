@@ -0,0 +1,79 @@
+"""
+2단계 캐시 테스트 - L2가 없으면 요청마다가 아니라 한 번만 오류를 로그해야 함
+
+항상 연결 오류를 내는 L2 백엔드로 조회/저장을 반복해 오류 로그가 한 번만 남고,
+L2가 돌아오면 복구 로그가 남는지 확인한다.
+
+실행: python scripts/tests/two_tier_cache_test.py (또는 pytest scripts/tests)
+"""
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from backend.cache import ResultCache, TwoTierCache
+
+
+class FlakyBackend:
+    """down이면 연결 오류를 내는 L2 백엔드"""
+
+    name = "flaky"
+
+    def __init__(self):
+        self.down = True
+        self.data = {}
+
+    async def get(self, key):
+        if self.down:
+            raise ConnectionError("Connection refused")
+        return self.data.get(key)
+
+    async def set(self, key, raw, ttl):
+        if self.down:
+            raise ConnectionError("Connection refused")
+        self.data[key] = raw
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_l2_outage_is_logged_once():
+    backend = FlakyBackend()
+    cache = TwoTierCache(ResultCache(ttl=60), l2=backend)
+    handler = RecordingHandler()
+    logger = logging.getLogger("backend.cache")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+    async def run():
+        for i in range(10):
+            await cache.get(f"miss_{i}")
+            await cache.set(f"key_{i}", {"totalCount": 1})
+        backend.down = False
+        await cache.set("key_up", {"totalCount": 1})
+        await cache.get("key_up_miss")
+
+    try:
+        asyncio.run(run())
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+
+    assert cache.l2_errors == 20
+    assert [r.levelno for r in handler.records] == [logging.ERROR, logging.INFO]
+    # L1은 L2 오류와 관계없이 동작
+    assert asyncio.run(cache.get("key_9")) == {"totalCount": 1}
+
+
+if __name__ == "__main__":
+    test_l2_outage_is_logged_once()
+    print("ok")
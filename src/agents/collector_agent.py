@@ -17,6 +17,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from mcp.collectors.naver_collector import NaverCollector
 from mcp.collectors.zigbang_collector import ZigbangCollector
 from mcp.collectors.dabang_collector import DabangCollector
+from mcp.collectors.circuit_breaker import circuit_breakers
 
 
 class CollectorAgent:
@@ -250,6 +251,8 @@ class CollectorAgent:
             'type': 'agent_status',
             'agent_id': self.agent_id,
             'status': status,
+            # 오케스트레이터가 장애 중인 플랫폼에 작업을 보내지 않도록 브레이커 상태 공유
+            'circuit_breakers': circuit_breakers.stats(),
             'timestamp': datetime.now().isoformat()
         }
         
@@ -12,6 +12,13 @@ from playwright.async_api import async_playwright, Page, Browser
 import aiohttp
 from bs4 import BeautifulSoup
 import logging
+import os
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.mcp.collectors.korean_units import parse_area_pair, parse_price_info
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -250,93 +257,27 @@ class NaverRealEstateCrawler:
         return hashlib.md5(unique_string.encode()).hexdigest()[:12]
     
     def _parse_price(self, price_str: str) -> Dict[str, Any]:
-        """가격 파싱"""
-        price_str = price_str.replace(',', '').replace(' ', '')
+        """가격 파싱 (예: "매매 3억 5,000", "전세 2억", "월세 1,000/50")"""
+        info = parse_price_info(price_str)
+        trade_type = info.trade_type or '매매'
+        amount = info.amount or 0
         
-        result = {
-            'type': '매매',
-            'amount': 0,
-            'deposit': 0,
-            'monthly_rent': 0,
-            'raw': price_str
+        return {
+            'type': trade_type,
+            'amount': amount if trade_type == '매매' else 0,
+            'deposit': amount if trade_type != '매매' else 0,
+            'monthly_rent': info.monthly_rent or 0,
+            'raw': price_str.replace(',', '').replace(' ', '')
         }
-        
-        try:
-            if '매매' in price_str:
-                result['type'] = '매매'
-                # 억/만원 파싱
-                if '억' in price_str:
-                    parts = price_str.split('억')
-                    result['amount'] = int(parts[0]) * 10000
-                    if len(parts) > 1 and parts[1]:
-                        extra = parts[1].replace('만원', '').replace('만', '')
-                        if extra.isdigit():
-                            result['amount'] += int(extra)
-                elif '만' in price_str:
-                    result['amount'] = int(price_str.replace('만원', '').replace('만', ''))
-            
-            elif '전세' in price_str:
-                result['type'] = '전세'
-                if '억' in price_str:
-                    parts = price_str.split('억')
-                    result['deposit'] = int(parts[0]) * 10000
-                    if len(parts) > 1 and parts[1]:
-                        extra = parts[1].replace('만원', '').replace('만', '')
-                        if extra.isdigit():
-                            result['deposit'] += int(extra)
-            
-            elif '월세' in price_str or '/' in price_str:
-                result['type'] = '월세'
-                parts = price_str.split('/')
-                if len(parts) >= 2:
-                    # 보증금
-                    deposit_str = parts[0].replace('월세', '')
-                    if '억' in deposit_str:
-                        deposit_parts = deposit_str.split('억')
-                        result['deposit'] = int(deposit_parts[0]) * 10000
-                    elif deposit_str.replace('만', '').isdigit():
-                        result['deposit'] = int(deposit_str.replace('만', ''))
-                    
-                    # 월세
-                    rent_str = parts[1].replace('만', '')
-                    if rent_str.isdigit():
-                        result['monthly_rent'] = int(rent_str)
-        except Exception as e:
-            logger.error(f"가격 파싱 오류: {price_str}, {e}")
-        
-        return result
     
     def _parse_area(self, area_str: str) -> Dict[str, Any]:
-        """면적 파싱"""
-        result = {
-            'supply': 0,  # 공급면적
-            'exclusive': 0,  # 전용면적
+        """면적 파싱 (예: "112/84㎡", "공급 112/전용 84", "25평")"""
+        supply, exclusive = parse_area_pair(area_str)
+        return {
+            'supply': supply or 0,  # 공급면적
+            'exclusive': exclusive or 0,  # 전용면적
             'raw': area_str
         }
-        
-        try:
-            area_str = area_str.replace(' ', '').replace('㎡', '')
-            
-            if '/' in area_str:
-                parts = area_str.split('/')
-                if len(parts) >= 2:
-                    supply = parts[0].replace('공급', '').replace('평', '')
-                    exclusive = parts[1].replace('전용', '').replace('평', '')
-                    
-                    if supply.replace('.', '').isdigit():
-                        result['supply'] = float(supply)
-                    if exclusive.replace('.', '').isdigit():
-                        result['exclusive'] = float(exclusive)
-            else:
-                # 단일 면적인 경우
-                area_num = area_str.replace('평', '').replace('전용', '').replace('공급', '')
-                if area_num.replace('.', '').isdigit():
-                    result['exclusive'] = float(area_num)
-                    result['supply'] = float(area_num)
-        except Exception as e:
-            logger.error(f"면적 파싱 오류: {area_str}, {e}")
-        
-        return result
     
     async def close(self):
         """브라우저 종료"""
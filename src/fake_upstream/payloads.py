@@ -0,0 +1,178 @@
+"""
+대역 서버용 합성 매물 데이터 - 실제 업스트림 응답과 같은 필드 구조
+
+같은 (플랫폼, 지역, 페이지)는 항상 같은 매물을 만들므로 반복 실행 결과를 비교할 수 있다.
+"""
+from typing import Dict, List
+import random
+import zlib
+
+DONGS = ["삼성동", "역삼동", "대치동", "청담동", "논현동", "도곡동", "개포동", "일원동"]
+BUILDINGS = ["래미안", "자이", "아이파크", "힐스테이트", "푸르지오", "롯데캐슬", "e편한세상"]
+DIRECTIONS = ["남향", "남동향", "남서향", "동향", "서향", "북향"]
+TRADES = ["매매", "전세", "월세"]
+
+# 삼성동 부근 중심 좌표
+CENTER_LAT = 37.5088
+CENTER_LNG = 127.0627
+
+
+def page_rng(*key) -> random.Random:
+    """키별 고정 난수 생성기"""
+    return random.Random(zlib.crc32("|".join(map(str, key)).encode("utf-8")))
+
+
+def item_id(platform: str, region: str, page: int, index: int) -> int:
+    """키별 고정 매물 ID (8자리)"""
+    return 10000000 + zlib.crc32(f"{platform}|{region}|{page}|{index}".encode("utf-8")) % 89999999
+
+
+def format_han_price(man: int) -> str:
+    """만원 단위 가격을 한글 표기로 (예: 125000 -> "12억 5,000")"""
+    eok, rest = divmod(man, 10000)
+    if eok and rest:
+        return f"{eok}억 {rest:,}"
+    if eok:
+        return f"{eok}억"
+    return f"{rest:,}"
+
+
+def _common(rng: random.Random) -> Dict:
+    """플랫폼 공통 필드"""
+    trade = rng.choice(TRADES)
+    if trade == "매매":
+        price = rng.randrange(30000, 400000, 500)
+    elif trade == "전세":
+        price = rng.randrange(10000, 200000, 500)
+    else:
+        price = rng.randrange(1000, 50000, 500)
+    building_floor = rng.randint(5, 35)
+    return {
+        "dong": rng.choice(DONGS),
+        "building": rng.choice(BUILDINGS),
+        "trade": trade,
+        "price": price,
+        "rent": rng.randrange(50, 500, 10) if trade == "월세" else 0,
+        "area": round(rng.uniform(20, 200), 2),
+        "floor": rng.randint(1, building_floor),
+        "building_floor": building_floor,
+        "lat": round(CENTER_LAT + rng.uniform(-0.01, 0.01), 6),
+        "lng": round(CENTER_LNG + rng.uniform(-0.01, 0.01), 6),
+        "direction": rng.choice(DIRECTIONS)
+    }
+
+
+def naver_articles(region: str, page: int, size: int) -> List[Dict]:
+    """m.land.naver.com/cluster/ajax/articleList의 body 항목"""
+    articles = []
+    for i in range(size):
+        rng = page_rng("naver", region, page, i)
+        c = _common(rng)
+        articles.append({
+            "atclNo": str(item_id("naver", region, page, i)),
+            "cortarNo": region,
+            "atclNm": f"{c['building']} {rng.randint(101, 120)}동",
+            "cortarNm": f"서울시 강남구 {c['dong']}",
+            "bildNm": f"{rng.randint(101, 120)}동",
+            "rletTpCd": "A01",
+            "rletTpNm": "아파트",
+            "tradTpCd": {"매매": "A1", "전세": "B1", "월세": "B2"}[c["trade"]],
+            "tradTpNm": c["trade"],
+            "prc": c["price"],
+            "hanPrc": format_han_price(c["price"]),
+            "rentPrc": c["rent"],
+            "spc1": str(round(c["area"] * 1.3, 2)),
+            "spc2": str(c["area"]),
+            "flrInfo": f"{c['floor']}/{c['building_floor']}",
+            "direction": c["direction"],
+            "lat": c["lat"],
+            "lng": c["lng"],
+            "atclFetrDesc": f"{c['direction']} 채광 좋음",
+            "rltrNm": f"{c['dong']}공인중개사",
+            "atclCfmYmd": "24.01.15."
+        })
+    return articles
+
+
+def zigbang_item(item_no: int, rng: random.Random) -> Dict:
+    """직방 매물 (목록/상세 공통 필드)"""
+    c = _common(rng)
+    return {
+        "item_id": item_no,
+        "title": f"{c['dong']} {c['building']} {c['area']:.0f}㎡",
+        "address": f"서울시 강남구 {c['dong']}",
+        "sales_type": c["trade"],
+        "sales_price": c["price"] if c["trade"] == "매매" else 0,
+        "deposit": c["price"] if c["trade"] != "매매" else 0,
+        "rent": c["rent"],
+        "보증금": c["price"] * 10000 if c["trade"] != "매매" else 0,
+        "월세": c["rent"],
+        "전용면적": c["area"],
+        "area": c["area"],
+        "floor": str(c["floor"]),
+        "building_floor": str(c["building_floor"]),
+        "building_type": "아파트",
+        "room_type": "아파트",
+        "lat": c["lat"],
+        "lng": c["lng"],
+        "description": f"{c['direction']}, 역세권",
+        "images": []
+    }
+
+
+def zigbang_items(region: str, page: int, size: int) -> List[Dict]:
+    """apis.zigbang.com 목록(v2/items, v3/items) 항목"""
+    return [
+        zigbang_item(item_id("zigbang", region, page, i), page_rng("zigbang", region, page, i))
+        for i in range(size)
+    ]
+
+
+def zigbang_detail(item_no: int) -> Dict:
+    """apis.zigbang.com/v3/items/{id}의 item"""
+    return zigbang_item(item_no, page_rng("zigbang-detail", item_no))
+
+
+def dabang_rooms(region: str, page: int, size: int) -> List[Dict]:
+    """다방 방 목록(rooms/list) 항목"""
+    rooms = []
+    for i in range(size):
+        rng = page_rng("dabang", region, page, i)
+        c = _common(rng)
+        rooms.append({
+            "room_id": str(item_id("dabang", region, page, i)),
+            "title": f"{c['dong']} {c['building']} 풀옵션",
+            "selling_type": c["trade"],
+            "price": c["price"],
+            "deposit": c["price"],
+            "price2": c["rent"],
+            "price_title": format_han_price(c["price"]) + (f"/{c['rent']}" if c["rent"] else ""),
+            "area": c["area"],
+            "address": f"서울시 강남구 {c['dong']}",
+            "desc": f"{c['direction']}, 주차 가능",
+            "floor_string": f"{c['floor']}층",
+            "building_floor": str(c["building_floor"]),
+            "room_type_string": "아파트",
+            "img_urls": [],
+            "room_options": ["에어컨", "세탁기"],
+            "latitude": c["lat"],
+            "longitude": c["lng"]
+        })
+    return rooms
+
+
+def kb_rows(region: str, page: int, size: int) -> List[Dict]:
+    """KB부동산 목록 페이지 행 (가격/면적은 화면 표기 문자열)"""
+    rows = []
+    for i in range(size):
+        rng = page_rng("kb", region, page, i)
+        c = _common(rng)
+        rows.append({
+            "id": item_id("kb", region, page, i),
+            "title": f"{c['building']} {rng.randint(101, 120)}동",
+            "address": f"서울 강남구 {c['dong']} {rng.randint(1, 999)}",
+            "price": format_han_price(c["price"]) + "만원",
+            "area": f"{c['area']}㎡" if rng.random() < 0.7 else f"{c['area'] / 3.3058:.1f}평",
+            "floor": f"{c['floor']}층"
+        })
+    return rows
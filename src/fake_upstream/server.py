@@ -0,0 +1,389 @@
+"""
+로컬 대역(fake) 업스트림 서버 - 네이버/직방/다방/KB API를 흉내 내는 aiohttp 앱
+
+실제 사이트에 요청하지 않고 수집기와 실시간 검색의 처리량을 측정하기 위한 서버.
+플랫폼마다 별도 포트로 띄우며, 지연 시간/페이지 수/오류 비율을 설정할 수 있다.
+
+실행:
+    python -m src.fake_upstream.server --port 8701 --latency 0.05 --error-rate 0.01
+
+출력되는 환경 변수(NAVER_MOBILE_BASE_URL, ZIGBANG_BASE_URL, DABANG_BASE_URL, KB_BASE_URL)를
+설정하면 수집기와 백엔드가 대역 서버로 요청한다.
+
+녹화한 응답을 재생하려면 --fixtures 디렉터리에 <플랫폼>/<경로의 /를 _로>.json 파일을 둔다
+(예: fixtures/zigbang/v2_items.json). 파일이 있는 경로는 합성 데이터 대신 파일 내용을 응답한다.
+"""
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import hashlib
+import html
+import json
+import random
+
+from aiohttp import web
+
+from . import payloads
+
+PLATFORMS = ("naver", "zigbang", "dabang", "kb")
+
+# 플랫폼별 기본 URL 환경 변수 (수집기/백엔드가 읽음)
+BASE_URL_ENV = {
+    "naver": "NAVER_MOBILE_BASE_URL",
+    "zigbang": "ZIGBANG_BASE_URL",
+    "dabang": "DABANG_BASE_URL",
+    "kb": "KB_BASE_URL"
+}
+
+# 다방 수집기는 /api 아래 경로를 쓴다
+BASE_URL_SUFFIX = {"dabang": "/api"}
+
+
+@dataclass
+class UpstreamProfile:
+    """
+    대역 서버 동작 설정
+
+    - latency/jitter: 응답 지연 평균/표준편차 (초)
+    - error_rate: 500 응답 비율
+    - throttle_rate: 429 응답 비율
+    - pages/page_size: 지역별 목록 페이지 수와 페이지당 항목 수
+    """
+    latency: float = 0.05
+    jitter: float = 0.02
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    pages: int = 5
+    page_size: int = 20
+
+    def update(self, values: Dict):
+        """일부 값만 변경 (/_fake/profile)"""
+        for field in fields(self):
+            if field.name in values:
+                setattr(self, field.name, type(getattr(self, field.name))(values[field.name]))
+
+
+class FakeUpstream:
+    """플랫폼 하나의 대역 서버 상태 (설정, 요청 통계, 녹화 응답)"""
+
+    def __init__(self, platform: str, profile: UpstreamProfile, fixtures: Optional[Path] = None):
+        self.platform = platform
+        self.profile = profile
+        self.fixtures = Path(fixtures) / platform if fixtures else None
+        self.rng = random.Random()
+
+        # 통계 카운터
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.not_modified = 0
+
+    def fixture(self, path: str) -> Optional[bytes]:
+        """녹화 응답 파일 (없으면 None)"""
+        if self.fixtures is None:
+            return None
+        name = path.strip("/").replace("/", "_") or "index"
+        file = self.fixtures / f"{name}.json"
+        return file.read_bytes() if file.exists() else None
+
+    def page_range(self, page: int) -> Tuple[int, bool]:
+        """페이지 항목 수와 다음 페이지 여부 (범위를 벗어나면 0)"""
+        if page < 0 or page >= self.profile.pages:
+            return 0, False
+        return self.profile.page_size, page < self.profile.pages - 1
+
+    def stats(self) -> Dict:
+        return {
+            "platform": self.platform,
+            "profile": asdict(self.profile),
+            "requests": self.requests,
+            "errors": self.errors,
+            "throttled": self.throttled,
+            "not_modified": self.not_modified
+        }
+
+
+def _json(data) -> web.Response:
+    return web.Response(
+        body=json.dumps(data, ensure_ascii=False).encode("utf-8"),
+        content_type="application/json", charset="utf-8"
+    )
+
+
+def _int(request: web.Request, name: str, default: int) -> int:
+    try:
+        return int(request.query.get(name, default))
+    except ValueError:
+        return default
+
+
+@web.middleware
+async def upstream_behavior(request: web.Request, handler):
+    """지연, 오류 주입, 녹화 응답, ETag/304 처리"""
+    upstream: FakeUpstream = request.app["upstream"]
+    if request.path.startswith("/_fake/"):
+        return await handler(request)
+
+    upstream.requests += 1
+    profile = upstream.profile
+    delay = upstream.rng.gauss(profile.latency, profile.jitter) if profile.jitter else profile.latency
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+    roll = upstream.rng.random()
+    if roll < profile.error_rate:
+        upstream.errors += 1
+        return web.Response(status=500, text="fake upstream error")
+    if roll < profile.error_rate + profile.throttle_rate:
+        upstream.throttled += 1
+        return web.Response(status=429, text="fake upstream throttled", headers={"Retry-After": "1"})
+
+    body = upstream.fixture(request.path)
+    if body is not None:
+        response = web.Response(body=body, content_type="application/json", charset="utf-8")
+    else:
+        response = await handler(request)
+
+    # 같은 요청은 같은 본문이므로 내용 해시를 ETag로 사용
+    if response.status == 200 and response.body is not None:
+        etag = '"' + hashlib.blake2b(response.body, digest_size=12).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            upstream.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+    return response
+
+
+# 네이버 (m.land.naver.com)
+
+async def naver_article_list(request: web.Request) -> web.Response:
+    """/cluster/ajax/articleList (page는 1부터)"""
+    upstream: FakeUpstream = request.app["upstream"]
+    page = _int(request, "page", 1)
+    region = request.query.get("cortarNo") or request.query.get("lat", "")
+    size, more = upstream.page_range(page - 1)
+    return _json({
+        "code": "success",
+        "hasPaging": True,
+        "page": page,
+        "more": more,
+        "body": payloads.naver_articles(region, page, size)
+    })
+
+
+async def naver_cluster_list(request: web.Request) -> web.Response:
+    """/cluster/clusterList (지역 전체 매물 수)"""
+    upstream: FakeUpstream = request.app["upstream"]
+    return _json({
+        "code": "success",
+        "data": {
+            "ARTICLE": [{
+                "lgeo": "2120213232",
+                "count": upstream.profile.pages * upstream.profile.page_size,
+                "lat": payloads.CENTER_LAT,
+                "lon": payloads.CENTER_LNG
+            }]
+        }
+    })
+
+
+# 직방 (apis.zigbang.com)
+
+async def zigbang_items(request: web.Request) -> web.Response:
+    """/v2/items, /v3/items, /v3/market-price/apartments (page는 0부터)"""
+    upstream: FakeUpstream = request.app["upstream"]
+    page = _int(request, "page", 0)
+    region = request.query.get("geohash") or request.query.get("region_id", "")
+    size, more = upstream.page_range(page)
+    items = payloads.zigbang_items(region, page, size)
+    key = "apartments" if request.path.endswith("apartments") else "items"
+    return _json({key: items, "page": page, "has_more": more})
+
+
+async def zigbang_item_detail(request: web.Request) -> web.Response:
+    """/v3/items/{item_id}"""
+    try:
+        item_no = int(request.match_info["item_id"])
+    except ValueError:
+        raise web.HTTPNotFound()
+    return _json({"item": payloads.zigbang_detail(item_no)})
+
+
+async def zigbang_search(request: web.Request) -> web.Response:
+    """/v2/search (지역명 → 지역 ID)"""
+    query = request.query.get("q", "")
+    return _json({"items": [{"id": 1168064000 + len(query), "name": query, "type": "address"}]})
+
+
+# 다방 (www.dabangapp.com/api, api.dabangapp.com)
+
+async def dabang_room_list(request: web.Request) -> web.Response:
+    """rooms/list (offset/limit 기반 페이지)"""
+    upstream: FakeUpstream = request.app["upstream"]
+    limit = max(1, _int(request, "limit", upstream.profile.page_size))
+    offset = max(0, _int(request, "offset", 0))
+    region = f"{request.query.get('latitude', '')},{request.query.get('longitude', '')}"
+    total = upstream.profile.pages * upstream.profile.page_size
+
+    rooms: List[Dict] = []
+    size = upstream.profile.page_size
+    for page in range(offset // size, min(upstream.profile.pages, (offset + limit - 1) // size + 1)):
+        page_rooms = payloads.dabang_rooms(region, page, size)
+        start = max(0, offset - page * size)
+        rooms.extend(page_rooms[start:start + limit - len(rooms)])
+    return _json({"rooms": rooms, "total": total, "has_more": offset + len(rooms) < total})
+
+
+# KB부동산 (onland.kbstar.com)
+
+async def kb_list_page(request: web.Request) -> web.Response:
+    """/quics 목록 페이지 (HTML, pageNo는 1부터)"""
+    upstream: FakeUpstream = request.app["upstream"]
+    page = _int(request, "pageNo", 1)
+    region = request.query.get("cc", "")
+    size, more = upstream.page_range(page - 1)
+
+    rows = []
+    for row in payloads.kb_rows(region, page, size):
+        rows.append(
+            '<div class="property-item">'
+            f'<a href="/quics?page=C020900&amp;id={row["id"]}">'
+            f'<span class="title">{html.escape(row["title"])}</span></a>'
+            f'<span class="address">{html.escape(row["address"])}</span>'
+            f'<span class="price">{html.escape(row["price"])}</span>'
+            f'<span class="area">{html.escape(row["area"])}</span>'
+            f'<span class="floor">{html.escape(row["floor"])}</span>'
+            '</div>'
+        )
+    next_link = ""
+    if more:
+        query = request.query.copy()
+        query["pageNo"] = str(page + 1)
+        href = html.escape(str(request.rel_url.with_query(query)))
+        next_link = f'<div class="pagination"><a class="next" href="{href}">다음</a></div>'
+
+    body = (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>KB부동산</title></head><body>'
+        '<input id="searchInput" placeholder="검색">'
+        f'<div class="property-list">{"".join(rows)}</div>{next_link}</body></html>'
+    )
+    return web.Response(text=body, content_type="text/html", charset="utf-8")
+
+
+# 관리용
+
+async def get_stats(request: web.Request) -> web.Response:
+    return _json(request.app["upstream"].stats())
+
+
+async def update_profile(request: web.Request) -> web.Response:
+    """동작 설정 변경 (예: 장애 재현용 error_rate=1)"""
+    upstream: FakeUpstream = request.app["upstream"]
+    upstream.profile.update(await request.json())
+    return _json(upstream.stats())
+
+
+ROUTES = {
+    "naver": [
+        ("GET", "/cluster/ajax/articleList", naver_article_list),
+        ("GET", "/cluster/clusterList", naver_cluster_list)
+    ],
+    "zigbang": [
+        ("GET", "/v2/items", zigbang_items),
+        ("GET", "/v3/items", zigbang_items),
+        ("GET", "/v3/market-price/apartments", zigbang_items),
+        ("GET", "/v3/items/{item_id}", zigbang_item_detail),
+        ("GET", "/v2/search", zigbang_search)
+    ],
+    "dabang": [
+        ("GET", "/api/v5/rooms/list", dabang_room_list),
+        ("GET", "/v5/rooms/list", dabang_room_list),
+        ("GET", "/v4/rooms/list", dabang_room_list),
+        ("GET", "/api/3/room/list", dabang_room_list)
+    ],
+    "kb": [
+        ("GET", "/quics", kb_list_page)
+    ]
+}
+
+
+def create_app(platform: str, profile: Optional[UpstreamProfile] = None,
+               fixtures: Optional[Path] = None) -> web.Application:
+    """플랫폼 대역 서버 앱"""
+    app = web.Application(middlewares=[upstream_behavior])
+    app["upstream"] = FakeUpstream(platform, profile or UpstreamProfile(), fixtures)
+    for method, path, handler in ROUTES[platform]:
+        app.router.add_route(method, path, handler)
+    app.router.add_get("/_fake/stats", get_stats)
+    app.router.add_post("/_fake/profile", update_profile)
+    return app
+
+
+async def start_fake_upstreams(profiles: Optional[Dict[str, UpstreamProfile]] = None,
+                               host: str = "127.0.0.1", port: int = 0,
+                               fixtures: Optional[Path] = None) -> Tuple[List[web.AppRunner], Dict[str, str]]:
+    """
+    플랫폼별 대역 서버 시작
+
+    Args:
+        profiles: 플랫폼별 설정 (없는 플랫폼은 기본값)
+        port: 첫 포트 (플랫폼마다 1씩 증가, 0이면 임의 포트)
+
+    Returns:
+        (runner 목록, 플랫폼별 기본 URL). 종료 시 runner.cleanup()을 호출한다.
+    """
+    profiles = profiles or {}
+    runners = []
+    base_urls = {}
+    for offset, platform in enumerate(PLATFORMS):
+        runner = web.AppRunner(create_app(platform, profiles.get(platform), fixtures))
+        await runner.setup()
+        site = web.TCPSite(runner, host, port + offset if port else 0)
+        await site.start()
+        bound_port = runner.addresses[0][1]
+        base_urls[platform] = f"http://{host}:{bound_port}{BASE_URL_SUFFIX.get(platform, '')}"
+        runners.append(runner)
+    return runners, base_urls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버/직방/다방/KB 대역 업스트림 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8701, help="첫 포트 (naver, zigbang, dabang, kb 순서로 1씩 증가)")
+    parser.add_argument("--latency", type=float, default=0.05, help="평균 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="응답 지연 표준편차 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--pages", type=int, default=5, help="지역별 목록 페이지 수")
+    parser.add_argument("--page-size", type=int, default=20, help="페이지당 항목 수")
+    parser.add_argument("--fixtures", type=Path, help="녹화 응답 디렉터리")
+    args = parser.parse_args()
+
+    def profile():
+        return UpstreamProfile(
+            latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate, pages=args.pages, page_size=args.page_size
+        )
+
+    async def serve():
+        runners, base_urls = await start_fake_upstreams(
+            {p: profile() for p in PLATFORMS}, args.host, args.port, args.fixtures
+        )
+        for platform, url in base_urls.items():
+            print(f"export {BASE_URL_ENV[platform]}={url}")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            for runner in runners:
+                await runner.cleanup()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -16,9 +16,14 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 from src.mcp.collectors.naver_collector import NaverCollector
 from src.mcp.collectors.zigbang_collector import ZigbangCollector
 from src.mcp.collectors.dabang_collector import DabangCollector
+from src.mcp.collectors.adaptive_concurrency import adaptive_limiters
+from src.mcp.collectors.circuit_breaker import circuit_breakers
 
 logger.add("logs/collector_agent_{time}.log", rotation="1 day")
 
+# 수집 중간 진행 상황 보고 간격 (매물 수)
+PROGRESS_EVERY = int(os.getenv("COLLECTOR_PROGRESS_EVERY", "20"))
+
 
 class CollectorAgent:
     """매물 수집 서브에이전트"""
@@ -121,17 +126,27 @@ class CollectorAgent:
         all_properties = []
         
         for area in areas:
+            if not circuit_breakers.available(platform):
+                # 장애 중인 플랫폼은 남은 지역을 요청하지 않고 바로 실패 보고
+                breaker = circuit_breakers.get(platform)
+                await self.report_error(task_id, platform, area,
+                                        f"circuit open (retry after {breaker.retry_after:.0f}s)")
+                continue
+                
             try:
                 logger.info(f"Collecting from {platform} for {area}...")
-                properties = await collector.collect(area)
+                properties = []
                 
-                # 수집된 데이터에 메타데이터 추가
-                for prop in properties:
+                # 매물이 정규화되는 대로 받아 메타데이터 추가, 중간 진행 상황 보고
+                async for prop in collector.collect_stream(area):
                     prop['task_id'] = task_id
                     prop['platform'] = platform
                     prop['area'] = area
                     prop['collected_at'] = datetime.now().isoformat()
-                    
+                    properties.append(prop)
+                    if PROGRESS_EVERY > 0 and len(properties) % PROGRESS_EVERY == 0:
+                        await self.report_progress(task_id, platform, area, len(properties))
+                        
                 all_properties.extend(properties)
                 
                 # 진행 상황 보고
@@ -144,8 +159,9 @@ class CollectorAgent:
                 logger.error(f"Error collecting from {platform} for {area}: {e}")
                 await self.report_error(task_id, platform, area, str(e))
                 
-        # 수집 완료 보고
+        # 수집 완료 보고 (수집 중 바뀐 브레이커 상태도 함께 공유)
         await self.report_completion(task_id, platform, all_properties)
+        await self.update_status("active")
         
     async def report_progress(self, task_id: str, platform: str, 
                              area: str, count: int):
@@ -222,6 +238,9 @@ class CollectorAgent:
             "type": "collector",
             "running_tasks": len(self.running_tasks),
             "platforms": list(self.collectors.keys()),
+            "concurrency": adaptive_limiters.stats(),
+            "circuit_breakers": circuit_breakers.stats(),
+            "metrics": adaptive_limiters.render_metrics(),
             "status": "active"
         }
         
@@ -233,6 +252,19 @@ class CollectorAgent:
         }
         
         await self.ws.send_json(message)
+        await self.update_status(status["status"])
+        
+    async def update_status(self, status: str):
+        """상태 업데이트 (오케스트레이터가 장애 중인 플랫폼에 작업을 보내지 않도록 브레이커 상태 공유)"""
+        message = {
+            "type": "agent_status",
+            "agent_id": self.agent_id,
+            "status": status,
+            "circuit_breakers": circuit_breakers.stats(),
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        await self.ws.send_json(message)
         
     async def run(self):
         """에이전트 실행"""
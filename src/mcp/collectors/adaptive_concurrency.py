@@ -0,0 +1,184 @@
+"""
+플랫폼별 적응형 동시성 제한 (AIMD) - 업스트림 응답에 따라 동시 요청 수를 자동 조절
+
+정상 응답이 이어지면 동시 요청 한도를 조금씩(가산) 늘리고, 429/5xx/타임아웃이나
+지연 시간 급증이 보이면 한도를 비율로(승산) 줄인다. 손으로 동시성을 맞추지 않아도
+업스트림이 감당할 수 있는 최대 처리량 근처에서 동작한다.
+"""
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+import asyncio
+import time
+
+from loguru import logger
+
+from .rate_limiter import collector_settings
+
+# 요청 결과 분류
+SUCCESS = "success"      # 정상 응답 (한도 증가 후보)
+OVERLOAD = "overload"    # 429/5xx/타임아웃 (한도 감소)
+IGNORE = "ignore"        # 한도와 무관한 실패 (404 등)
+
+
+class AIMDLimiter:
+    """
+    AIMD 동시성 제한기
+
+    - initial/min_limit/max_limit: 초기/최소/최대 동시 요청 수
+    - increase: 한도만큼의 요청이 성공할 때마다 늘릴 양
+    - decrease: 과부하 시 곱할 비율
+    - latency_tolerance: 기준 지연 시간의 몇 배를 넘으면 과부하로 볼지
+    """
+
+    def __init__(self, name: str, initial: float = 4, min_limit: float = 1,
+                 max_limit: float = 32, increase: float = 1, decrease: float = 0.5,
+                 latency_tolerance: float = 2.0):
+        self.name = name
+        self.limit = float(initial)
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.inflight = 0
+        # 정상 응답 지연 시간 이동 평균 (초)
+        self.baseline_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+
+        # 통계 카운터
+        self.successes = 0
+        self.overloads = 0
+        self.decreases = 0
+
+    @property
+    def _cond(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        동시 요청 슬롯 (한도가 찰 때까지 대기)
+
+        블록 안에서 permit.record(SUCCESS/OVERLOAD/IGNORE)로 결과를 알린다.
+        결과 없이 예외로 끝나면 과부하로, 결과 없이 정상 종료하면 무시로 처리한다.
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.inflight < int(self.limit))
+            self.inflight += 1
+
+        permit = _Permit()
+        start = time.monotonic()
+        try:
+            yield permit
+        except asyncio.CancelledError:
+            permit.outcome = permit.outcome or IGNORE
+            raise
+        except Exception:
+            permit.outcome = permit.outcome or OVERLOAD
+            raise
+        finally:
+            self._on_complete(permit.outcome or IGNORE, time.monotonic() - start)
+            async with self._cond:
+                self.inflight -= 1
+                self._cond.notify_all()
+
+    def _on_complete(self, outcome: str, latency: float):
+        """요청 결과로 한도 조정"""
+        if outcome == SUCCESS:
+            self.successes += 1
+            baseline = self.baseline_latency
+            self.baseline_latency = latency if baseline is None else baseline * 0.95 + latency * 0.05
+            if baseline is not None and latency > baseline * self.latency_tolerance:
+                self._decrease(f"latency {latency:.2f}s > {baseline:.2f}s x {self.latency_tolerance}")
+            else:
+                # 한도만큼 성공하면 increase만큼 증가
+                self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+        elif outcome == OVERLOAD:
+            self.overloads += 1
+            self._decrease("overload response")
+
+    def _decrease(self, reason: str):
+        """한도 감소 (같은 시점의 동시 실패로 연속 감소하지 않도록 기준 지연 시간만큼 간격을 둠)"""
+        now = time.monotonic()
+        if now - self._last_decrease < (self.baseline_latency or 0):
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self.limit = max(self.min_limit, self.limit * self.decrease)
+        self.decreases += 1
+        logger.info(f"[{self.name}] concurrency limit {previous:.1f} -> {self.limit:.1f} ({reason})")
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "limit": round(self.limit, 2),
+            "inflight": self.inflight,
+            "baseline_latency": round(self.baseline_latency, 3) if self.baseline_latency else None,
+            "successes": self.successes,
+            "overloads": self.overloads,
+            "decreases": self.decreases
+        }
+
+
+class _Permit:
+    """슬롯 안에서 요청 결과 기록"""
+    __slots__ = ("outcome",)
+
+    def __init__(self):
+        self.outcome: Optional[str] = None
+
+    def record(self, outcome: str):
+        self.outcome = outcome
+
+
+def classify_status(status: int) -> str:
+    """HTTP 상태 코드 분류"""
+    if status < 400:
+        return SUCCESS
+    if status == 429 or status >= 500:
+        return OVERLOAD
+    return IGNORE
+
+
+class AdaptiveLimiterRegistry:
+    """플랫폼별 AIMD 제한기 (프로세스 안의 수집기 인스턴스가 공유)"""
+
+    def __init__(self):
+        self._limiters: Dict[str, AIMDLimiter] = {}
+
+    def get(self, platform: str) -> AIMDLimiter:
+        """플랫폼 제한기 (없으면 collectors.<platform>.concurrency 설정으로 생성)"""
+        limiter = self._limiters.get(platform)
+        if limiter is None:
+            settings = collector_settings(platform).get("concurrency") or {}
+            limiter = self._limiters[platform] = AIMDLimiter(
+                platform,
+                initial=float(settings.get("initial", 4)),
+                min_limit=float(settings.get("min", 1)),
+                max_limit=float(settings.get("max", 32)),
+                latency_tolerance=float(settings.get("latency_tolerance", 2.0))
+            )
+        return limiter
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {platform: limiter.stats() for platform, limiter in self._limiters.items()}
+
+    def render_metrics(self) -> str:
+        """Prometheus 텍스트 형식 메트릭 (현재 동시성 한도, 진행 중 요청 수)"""
+        lines = [
+            "# HELP collector_concurrency_limit Current adaptive concurrency limit",
+            "# TYPE collector_concurrency_limit gauge"
+        ]
+        lines += [f'collector_concurrency_limit{{platform="{p}"}} {l.limit:.2f}' for p, l in self._limiters.items()]
+        lines += [
+            "# HELP collector_requests_in_flight Upstream requests in flight",
+            "# TYPE collector_requests_in_flight gauge"
+        ]
+        lines += [f'collector_requests_in_flight{{platform="{p}"}} {l.inflight}' for p, l in self._limiters.items()]
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 공유 인스턴스
+adaptive_limiters = AdaptiveLimiterRegistry()
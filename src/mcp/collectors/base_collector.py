@@ -2,25 +2,51 @@
 베이스 수집기 클래스 - 모든 플랫폼 수집기의 기본 클래스
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 import asyncio
 import aiohttp
 from datetime import datetime
+from urllib.parse import urlsplit
 from loguru import logger
+import os
 import random
 
+from .rate_limiter import host_rate_limiter, collector_settings
+from .adaptive_concurrency import adaptive_limiters, classify_status, OVERLOAD
+from .circuit_breaker import circuit_breakers, decorrelated_jitter
+from .response_cache import normalize_request, shared_response_cache
+from .korean_units import parse_area, parse_price
+
 
 class BaseCollector(ABC):
     """베이스 수집기 추상 클래스"""
     
+    # 설정 키 (config/mcp_config.yaml의 collectors.<platform>)
+    platform = ""
+    
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
-        self.rate_limit = 2  # requests per second
-        self.max_retries = 3
+        settings = collector_settings(self.platform)
+        self.rate_limit = float(settings.get('rate_limit', 2))  # requests per second
+        self.burst = float(settings.get('burst', max(1, self.rate_limit)))  # 순간 허용 요청 수
+        self.max_retries = int(settings.get('max_retries', 3))
+        self.retry_base_delay = float(settings.get('retry_base_delay', 0.5))  # 재시도 최소 대기 (초)
+        self.retry_max_delay = float(settings.get('retry_max_delay', 20))  # 재시도 최대 대기 (초)
+        self.response_cache = shared_response_cache()  # 디스크 응답 캐시 (비활성화 시 None)
         self.headers = {
             'User-Agent': self._get_random_user_agent()
         }
         
+    def _base_url(self, default: str) -> str:
+        """
+        플랫폼 API 기본 URL
+        
+        <PLATFORM>_BASE_URL 환경 변수나 collectors.<platform>.base_url 설정이 있으면
+        그 주소를 사용한다 (로컬 대역 서버로 벤치마크할 때).
+        """
+        override = os.getenv(f"{self.platform.upper()}_BASE_URL") if self.platform else None
+        return (override or collector_settings(self.platform).get('base_url') or default).rstrip('/')
+        
     def _get_random_user_agent(self) -> str:
         """랜덤 User-Agent 반환"""
         user_agents = [
@@ -41,18 +67,67 @@ class BaseCollector(ABC):
         if self.session:
             await self.session.close()
             
-    @abstractmethod
     async def collect(self, area: str, **kwargs) -> List[Dict]:
         """
-        매물 수집 메서드 (하위 클래스에서 구현)
+        매물 수집 (collect_stream 결과를 리스트로 모음)
         
         Args:
             area: 수집할 지역
-            **kwargs: 추가 파라미터
+            **kwargs: 추가 파라미터 (max_items 포함, 하위 클래스의 iter_properties 참고)
             
         Returns:
             수집된 매물 정보 리스트
         """
+        return [prop async for prop in self.collect_stream(area, **kwargs)]
+        
+    async def collect_stream(self, area: str, max_items: int = 100,
+                             **kwargs) -> AsyncIterator[Dict]:
+        """
+        매물을 정규화/검증되는 대로 하나씩 전달하는 비동기 제너레이터
+        
+        소비하는 쪽이 다음 항목을 요청할 때만 수집이 진행되므로(backpressure)
+        처리가 느리면 목록/상세 조회도 그만큼 기다린다. max_items개를 넘기거나
+        소비하는 쪽이 중간에 멈추면(break, aclose) 남은 요청과 작업을 취소한다.
+        
+        Args:
+            area: 수집할 지역
+            max_items: 최대 수집 개수
+            **kwargs: 추가 파라미터 (하위 클래스의 iter_properties 참고)
+            
+        Yields:
+            정규화된 매물 정보
+        """
+        count = 0
+        stream = self.iter_properties(area, max_items=max_items, **kwargs)
+        try:
+            if max_items <= 0:
+                return
+            async for prop in stream:
+                count += 1
+                yield prop
+                if count >= max_items:
+                    break
+        except Exception as e:
+            logger.error(f"Error collecting from {self.platform}: {e}")
+        finally:
+            # 조기 종료 시 하위 제너레이터의 요청/작업 정리
+            await stream.aclose()
+            logger.info(f"Collected {count} properties from {self.platform} for {area}")
+            
+    @abstractmethod
+    def iter_properties(self, area: str, max_items: int = 100,
+                        **kwargs) -> AsyncIterator[Dict]:
+        """
+        매물 수집 제너레이터 (하위 클래스에서 async def ... yield로 구현)
+        
+        Args:
+            area: 수집할 지역
+            max_items: 최대 수집 개수
+            **kwargs: 추가 파라미터
+            
+        Yields:
+            정규화/검증된 매물 정보
+        """
         pass
         
     @abstractmethod
@@ -73,6 +148,12 @@ class BaseCollector(ABC):
         """
         HTTP 요청 실행
         
+        플랫폼별 적응형 동시성 제한(AIMD) 안에서 요청하고, 응답 결과로 한도를 조정한다.
+        429/5xx와 네트워크 오류만 재시도하며, 그 밖의 4xx는 바로 포기한다.
+        플랫폼 서킷 브레이커가 열려 있으면 요청하지 않고 바로 None을 반환한다.
+        디스크 응답 캐시가 켜져 있으면 TTL 안의 응답은 요청 없이 반환하고,
+        만료된 응답은 ETag/Last-Modified로 재검증한다.
+        
         Args:
             url: 요청 URL
             method: HTTP 메서드
@@ -81,111 +162,124 @@ class BaseCollector(ABC):
         Returns:
             응답 데이터 또는 None
         """
+        cache = self.response_cache
+        cached = None
+        if cache is not None:
+            endpoint_class = self.cache_class(url)
+            cache_key = normalize_request(method, url, kwargs.get('params'),
+                                          kwargs.get('json', kwargs.get('data')))
+            cached = await cache.get(cache_key)
+            if cached is not None and cached.fresh:
+                return cached.data
+            if cached is not None and cached.revalidatable:
+                kwargs['headers'] = {**(kwargs.get('headers') or {}), **cached.conditional_headers()}
+                
         if not self.session:
             self.session = aiohttp.ClientSession(headers=self.headers)
             
+        platform = self.platform or 'default'
+        limiter = adaptive_limiters.get(platform)
+        breaker = circuit_breakers.get(platform)
+        delay = self.retry_base_delay
         for attempt in range(self.max_retries):
+            if not breaker.allow():
+                logger.warning(f"Circuit open for {platform}, skipping {url} "
+                               f"(retry after {breaker.retry_after:.0f}s)")
+                return None
+                
+            outcome = None
             try:
                 # Rate limiting
-                await self._rate_limit()
+                await self._rate_limit(url)
                 
-                async with self.session.request(method, url, **kwargs) as response:
-                    if response.status == 200:
-                        content_type = response.headers.get('Content-Type', '')
-                        if 'json' in content_type:
-                            return await response.json()
-                        else:
-                            return {'text': await response.text()}
-                    else:
+                async with limiter.slot() as permit:
+                    async with self.session.request(method, url, **kwargs) as response:
+                        outcome = classify_status(response.status)
+                        permit.record(outcome)
+                        if response.status == 304 and cached is not None:
+                            # 재검증 성공: 캐시된 응답 재사용
+                            await cache.refresh(cache_key, cached, endpoint_class)
+                            return cached.data
+                            
+                        if response.status == 200:
+                            content_type = response.headers.get('Content-Type', '')
+                            if 'json' in content_type:
+                                data = await response.json()
+                            else:
+                                data = {'text': await response.text()}
+                            if cache is not None:
+                                await cache.set(cache_key, data, endpoint_class,
+                                                etag=response.headers.get('ETag'),
+                                                last_modified=response.headers.get('Last-Modified'))
+                            return data
+                        
                         logger.warning(f"HTTP {response.status} for {url}")
+                        if outcome != OVERLOAD:
+                            # 재시도해도 같은 결과인 응답 (429 이외의 4xx 등)
+                            return None
                         
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
+                outcome = OVERLOAD
                 logger.error(f"Request error (attempt {attempt + 1}): {e}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+            finally:
+                # 취소되어 결과가 없으면 None (시험 요청 슬롯만 반환)
+                breaker.record(None if outcome is None else outcome == OVERLOAD)
+                
+            if attempt < self.max_retries - 1:
+                delay = decorrelated_jitter(delay, self.retry_base_delay, self.retry_max_delay)
+                await asyncio.sleep(delay)
                     
         return None
         
-    async def _rate_limit(self):
-        """Rate limiting 적용"""
-        await asyncio.sleep(1 / self.rate_limit)
+    def cache_class(self, url: str) -> str:
+        """
+        응답 캐시 TTL을 정할 엔드포인트 종류 (collectors.response_cache.ttl의 키)
+        
+        경로가 숫자 ID로 끝나면 detail, 검색 API는 search, 그 밖은 list.
+        플랫폼별 URL 구조가 다르면 하위 클래스에서 재정의한다.
+        """
+        path = urlsplit(url).path.rstrip('/')
+        if path.rsplit('/', 1)[-1].isdigit():
+            return 'detail'
+        if 'search' in path:
+            return 'search'
+        return 'list'
+        
+    async def _rate_limit(self, url: str):
+        """Rate limiting 적용 (호스트별 토큰 버킷, 같은 호스트의 수집기끼리 공유)"""
+        await host_rate_limiter.acquire(url, self.rate_limit, self.burst)
         
     def normalize_price(self, price_str: str) -> Optional[int]:
         """
         가격 문자열을 정수로 변환
         
         Args:
-            price_str: 가격 문자열 (예: "3억 5,000", "35000")
+            price_str: 가격 문자열 (예: "3억 5,000", "35000", "12,000/80")
             
         Returns:
-            만원 단위 정수 가격
+            만원 단위 정수 가격 (보증금/월세 표기는 보증금)
         """
-        if not price_str:
-            return None
-            
-        try:
-            # 문자열 정리
-            price_str = price_str.replace(',', '').replace(' ', '')
-            
-            # 억 단위 처리
-            if '억' in price_str:
-                parts = price_str.split('억')
-                eok = int(parts[0]) * 10000
-                
-                # 만원 단위 처리
-                man = 0
-                if len(parts) > 1 and parts[1]:
-                    man_str = parts[1].replace('만', '').replace('원', '')
-                    if man_str:
-                        man = int(man_str)
-                        
-                return eok + man
-                
-            # 만원 단위만 있는 경우
-            elif '만' in price_str:
-                return int(price_str.replace('만', '').replace('원', ''))
-                
-            # 숫자만 있는 경우
-            else:
-                return int(price_str)
-                
-        except Exception as e:
-            logger.error(f"Price parsing error: {price_str} - {e}")
-            return None
+        price = parse_price(price_str)
+        if price is None and price_str:
+            logger.debug(f"Price parsing failed: {price_str}")
+        return price
             
     def normalize_area(self, area_str: str) -> Optional[float]:
         """
         면적 문자열을 float로 변환
         
         Args:
-            area_str: 면적 문자열 (예: "84.95㎡", "25평")
+            area_str: 면적 문자열 (예: "84.95㎡", "25평", "112/84㎡")
             
         Returns:
-            제곱미터 단위 면적
+            제곱미터 단위 면적 (공급/전용 표기는 전용면적)
         """
-        if not area_str:
-            return None
-            
-        try:
-            # 문자열 정리
-            area_str = area_str.replace(' ', '')
-            
-            # 제곱미터 단위
-            if '㎡' in area_str or 'm²' in area_str:
-                return float(area_str.replace('㎡', '').replace('m²', ''))
-                
-            # 평 단위 (평 -> 제곱미터 변환)
-            elif '평' in area_str:
-                pyeong = float(area_str.replace('평', ''))
-                return pyeong * 3.3058  # 1평 = 3.3058㎡
-                
-            # 숫자만 있는 경우 (제곱미터로 가정)
-            else:
-                return float(area_str)
-                
-        except Exception as e:
-            logger.error(f"Area parsing error: {area_str} - {e}")
-            return None
+        area = parse_area(area_str)
+        if area is None and area_str:
+            logger.debug(f"Area parsing failed: {area_str}")
+        return area
             
     def create_property_id(self, platform: str, original_id: str) -> str:
         """
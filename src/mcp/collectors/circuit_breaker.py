@@ -0,0 +1,197 @@
+"""
+플랫폼별 서킷 브레이커 - 장애 중인 업스트림에 요청을 보내지 않고 바로 실패
+
+- closed: 정상. 최근 window초의 실패율이 failure_rate 이상이면 open
+- open: 요청 차단. open_seconds가 지나면 half-open
+- half-open: probes개의 시험 요청만 허용. 모두 성공하면 closed, 하나라도 실패하면 다시 open
+
+open이 반복되면 차단 시간을 두 배씩 늘린다 (max_open_seconds까지).
+"""
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+import random
+import time
+
+from loguru import logger
+
+from .rate_limiter import collector_settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    서킷 브레이커
+
+    - window: 실패율 계산 구간 (초)
+    - min_requests: 실패율을 판단할 최소 요청 수
+    - failure_rate: open으로 전환할 실패율 (0~1)
+    - open_seconds/max_open_seconds: 차단 시간 (연속 open 시 두 배씩 증가)
+    - probes: half-open에서 허용할 시험 요청 수
+    """
+
+    def __init__(self, name: str, window: float = 60, min_requests: int = 10,
+                 failure_rate: float = 0.5, open_seconds: float = 30,
+                 max_open_seconds: float = 600, probes: int = 1):
+        self.name = name
+        self.window = window
+        self.min_requests = min_requests
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.probes = probes
+
+        self.state = CLOSED
+        self._events: Deque[Tuple[float, bool]] = deque()  # (시각, 실패 여부)
+        self._failures = 0
+        self._opened_at = 0.0
+        self._open_for = open_seconds
+        self._probes_inflight = 0
+        self._probe_successes = 0
+
+        # 통계 카운터
+        self.rejected = 0
+        self.opened = 0
+
+    def _prune(self, now: float):
+        while self._events and self._events[0][0] < now - self.window:
+            _, failed = self._events.popleft()
+            self._failures -= failed
+
+    def _transition(self, state: str, reason: str = ""):
+        if state == self.state:
+            return
+        logger.warning(f"[{self.name}] circuit {self.state} -> {state}" + (f" ({reason})" if reason else ""))
+        self.state = state
+        if state == OPEN:
+            self.opened += 1
+            self._opened_at = time.monotonic()
+        elif state == HALF_OPEN:
+            self._probes_inflight = 0
+            self._probe_successes = 0
+        elif state == CLOSED:
+            self._events.clear()
+            self._failures = 0
+            self._open_for = self.open_seconds
+
+    @property
+    def retry_after(self) -> float:
+        """open 상태가 끝날 때까지 남은 시간 (초)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self._open_for - time.monotonic())
+
+    @property
+    def available(self) -> bool:
+        """요청을 보낼 수 있는 상태인지 (상태를 바꾸지 않음, 작업 분배 판단용)"""
+        return self.state != OPEN or self.retry_after == 0
+
+    def allow(self) -> bool:
+        """
+        요청 허용 여부
+
+        허용된 요청은 끝나면 반드시 record()로 결과를 알려야 한다.
+        """
+        if self.state == OPEN:
+            if self.retry_after > 0:
+                self.rejected += 1
+                return False
+            self._transition(HALF_OPEN, "probing")
+
+        if self.state == HALF_OPEN:
+            if self._probes_inflight + self._probe_successes >= self.probes:
+                self.rejected += 1
+                return False
+            self._probes_inflight += 1
+        return True
+
+    def record(self, failed: Optional[bool]):
+        """
+        요청 결과 기록
+
+        Args:
+            failed: 실패 여부 (None이면 취소 등으로 결과 없음, 시험 요청 슬롯만 반환)
+        """
+        if self.state == HALF_OPEN:
+            self._probes_inflight = max(0, self._probes_inflight - 1)
+            if failed is None:
+                return
+            if failed:
+                # 시험 요청 실패: 차단 시간을 늘려 다시 open
+                self._open_for = min(self.max_open_seconds, self._open_for * 2)
+                self._transition(OPEN, "probe failed")
+            else:
+                self._probe_successes += 1
+                if self._probe_successes >= self.probes:
+                    self._transition(CLOSED, "probe succeeded")
+            return
+
+        if failed is None or self.state != CLOSED:
+            return
+
+        now = time.monotonic()
+        self._events.append((now, failed))
+        self._failures += failed
+        self._prune(now)
+        total = len(self._events)
+        if total >= self.min_requests and self._failures / total >= self.failure_rate:
+            self._transition(OPEN, f"{self._failures}/{total} failed in {self.window:.0f}s")
+
+    def stats(self) -> Dict:
+        self._prune(time.monotonic())
+        return {
+            "state": self.state,
+            "available": self.available,
+            "retry_after": round(self.retry_after, 1),
+            "requests": len(self._events),
+            "failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected
+        }
+
+
+class CircuitBreakerRegistry:
+    """플랫폼별 서킷 브레이커 (프로세스 안의 수집기와 코디네이터가 공유)"""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, platform: str) -> CircuitBreaker:
+        """플랫폼 브레이커 (없으면 collectors.<platform>.circuit_breaker 설정으로 생성)"""
+        breaker = self._breakers.get(platform)
+        if breaker is None:
+            settings = collector_settings(platform).get("circuit_breaker") or {}
+            breaker = self._breakers[platform] = CircuitBreaker(
+                platform,
+                window=float(settings.get("window", 60)),
+                min_requests=int(settings.get("min_requests", 10)),
+                failure_rate=float(settings.get("failure_rate", 0.5)),
+                open_seconds=float(settings.get("open_seconds", 30)),
+                max_open_seconds=float(settings.get("max_open_seconds", 600)),
+                probes=int(settings.get("probes", 1))
+            )
+        return breaker
+
+    def available(self, platform: str) -> bool:
+        """플랫폼에 작업을 보내도 되는지 (브레이커가 없으면 True)"""
+        breaker = self._breakers.get(platform)
+        return breaker is None or breaker.available
+
+    def stats(self) -> Dict[str, Dict]:
+        return {platform: breaker.stats() for platform, breaker in self._breakers.items()}
+
+
+# 프로세스 공유 인스턴스
+circuit_breakers = CircuitBreakerRegistry()
+
+
+def decorrelated_jitter(previous: float, base: float, cap: float) -> float:
+    """
+    다음 재시도 대기 시간 (decorrelated jitter)
+
+    직전 대기 시간의 세 배까지 무작위로 늘려, 여러 수집기가 같은 시각에
+    동시에 재시도하지 않도록 한다.
+    """
+    return min(cap, random.uniform(base, max(base, previous) * 3))
@@ -1,7 +1,7 @@
 """
 다방 수집기
 """
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 import asyncio
 from datetime import datetime
 from loguru import logger
@@ -13,15 +13,17 @@ from .base_collector import BaseCollector
 class DabangCollector(BaseCollector):
     """다방 수집기"""
     
+    platform = "dabang"
+    
     def __init__(self):
         super().__init__()
-        self.base_url = "https://www.dabangapp.com/api"
+        self.base_url = self._base_url("https://www.dabangapp.com/api")
         self.web_url = "https://www.dabangapp.com"
         
-    async def collect(self, area: str, room_type: str = "apartment", 
-                     trade_type: str = "selling", max_items: int = 100) -> List[Dict]:
+    async def iter_properties(self, area: str, room_type: str = "apartment", 
+                              trade_type: str = "selling", max_items: int = 100) -> AsyncIterator[Dict]:
         """
-        다방에서 매물 수집
+        다방에서 매물 수집 (정규화되는 대로 하나씩 전달)
         
         Args:
             area: 지역명 (예: "강남구")
@@ -29,38 +31,29 @@ class DabangCollector(BaseCollector):
             trade_type: 거래 유형 (selling: 매매, jeonse: 전세, monthly: 월세)
             max_items: 최대 수집 개수
             
-        Returns:
-            수집된 매물 리스트
+        Yields:
+            정규화된 매물 정보
         """
-        properties = []
-        
-        try:
-            # 1. 지역 좌표 조회
-            lat, lng = await self._get_area_coordinates(area)
-            if not lat or not lng:
-                logger.warning(f"Could not find coordinates for {area}")
-                return []
-                
-            # 2. 매물 목록 조회
-            items = await self._get_property_list(lat, lng, room_type, trade_type, max_items)
-            
-            # 3. 각 매물의 상세 정보 수집
-            for item in items[:max_items]:
-                try:
-                    # 데이터 정규화 (다방은 목록에 상세 정보 포함)
-                    normalized = await self.parse_property(item)
-                    if self.validate_property(normalized):
-                        properties.append(normalized)
-                        
-                except Exception as e:
-                    logger.debug(f"Error processing item: {e}")
-                    
-        except Exception as e:
-            logger.error(f"Error collecting from Dabang: {e}")
+        # 1. 지역 좌표 조회
+        lat, lng = await self._get_area_coordinates(area)
+        if not lat or not lng:
+            logger.warning(f"Could not find coordinates for {area}")
+            return
             
-        logger.info(f"Collected {len(properties)} properties from Dabang for {area}")
-        return properties
+        # 2. 매물 목록 조회
+        items = await self._get_property_list(lat, lng, room_type, trade_type, max_items)
         
+        # 3. 각 매물 정규화 (다방은 목록에 상세 정보 포함)
+        for item in items[:max_items]:
+            try:
+                normalized = await self.parse_property(item)
+                if not self.validate_property(normalized):
+                    continue
+            except Exception as e:
+                logger.debug(f"Error processing item: {e}")
+                continue
+            yield normalized
+            
     async def _get_area_coordinates(self, area: str) -> tuple:
         """지역명으로 좌표 조회"""
         # 서울 주요 구의 대략적인 중심 좌표
@@ -0,0 +1,205 @@
+"""
+한국식 가격/면적 표기 파싱 - 수집기 공통 모듈
+
+가격은 만원 단위 정수, 면적은 제곱미터 float로 변환한다.
+
+    "3억 5,000" -> 35000      "5억" -> 50000        "1.5억" -> 15000
+    "3억 5천" -> 35000        "35,000만원" -> 35000  "매매 12억" -> 120000
+    "12,000/80" -> 보증금 12000, 월세 80
+    "84.95㎡" -> 84.95        "25평" -> 82.645      "112/84㎡" -> 공급 112, 전용 84
+    "B1층 84㎡" -> 84 (단위가 붙은 숫자)   "abc 12" -> None
+
+스칼라 함수(parse_price, parse_area)는 입력 문자열별로 결과를 캐시하고,
+일괄 함수(parse_prices, parse_areas)는 열(column)의 고유값만 한 번씩 파싱한다.
+파싱할 수 없는 값은 예외 없이 None을 반환한다.
+"""
+from functools import lru_cache
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+import math
+import re
+
+PYEONG_TO_M2 = 3.3058  # 1평 = 3.3058㎡
+
+_TRADE_RE = re.compile(r"^(매매|전세|월세|단기임대|단기)")
+_PRICE_RE = re.compile(
+    r"(?:(?P<eok>\d+(?:\.\d+)?)억)?"
+    r"(?:(?P<cheon>\d+)천)?"
+    r"(?P<man>\d+(?:\.\d+)?)?"
+    r"(?:만)?(?:원)?"
+)
+# 면적 표기 전체 ("전용84.95㎡", "25평", "84") - 앞뒤에 다른 글자가 있으면 단위가 붙은 숫자만 인정
+_AREA_RE = re.compile(r"(?:공급|전용|계약)?(?:면적)?(?P<num>\d+(?:\.\d+)?)(?P<unit>㎡|m²|m2|평)?")
+_AREA_UNIT_RE = re.compile(r"(?<![\d.])(?P<num>\d+(?:\.\d+)?)(?P<unit>㎡|m²|m2|평)")
+
+_CACHE_SIZE = 65536
+
+
+class PriceInfo(NamedTuple):
+    """가격 표기 해석 결과 (만원 단위)"""
+    trade_type: Optional[str]  # 매매/전세/월세 (표기에 없으면 None, 금액/금액이면 월세)
+    amount: Optional[int]  # 매매가 또는 전세/월세 보증금
+    monthly_rent: Optional[int]  # 월세 (없으면 None)
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _normalize(text: str) -> str:
+    """공백과 천 단위 구분 기호 제거"""
+    return "".join(text.replace(",", "").split())
+
+
+def _amount(text: str) -> Optional[int]:
+    """"3억5000", "5천", "35000만원" 형태의 금액 (만원)"""
+    if not text:
+        return None
+    match = _PRICE_RE.fullmatch(text)
+    if match is None:
+        return None
+    eok, cheon, man = match.group("eok", "cheon", "man")
+    if eok is None and cheon is None and man is None:
+        return None
+    total = 0.0
+    if eok is not None:
+        total += float(eok) * 10000
+    if cheon is not None:
+        total += int(cheon) * 1000
+    if man is not None:
+        total += float(man)
+    return int(round(total))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_price_info(text: str) -> PriceInfo:
+    """가격 문자열 해석 (원본 문자열 기준으로 캐시)"""
+    text = _normalize(text)
+    trade_type = None
+    match = _TRADE_RE.match(text)
+    if match is not None:
+        trade_type = match.group(1)
+        text = text[match.end():]
+
+    if "/" in text:
+        deposit, _, rent = text.partition("/")
+        return PriceInfo(trade_type or "월세", _amount(deposit), _amount(rent))
+    return PriceInfo(trade_type, _amount(text), None)
+
+
+def parse_price_info(value: Any) -> PriceInfo:
+    """가격 표기 해석 (거래 유형, 금액, 월세)"""
+    if type(value) is str:
+        return _parse_price_info(value)
+    if _is_missing(value):
+        return PriceInfo(None, None, None)
+    if isinstance(value, (int, float)):
+        return PriceInfo(None, int(value), None)
+    return _parse_price_info(str(value))
+
+
+def parse_price(value: Any) -> Optional[int]:
+    """
+    가격을 만원 단위 정수로 변환 (보증금/월세 표기는 보증금)
+
+    Returns:
+        만원 단위 가격 (해석할 수 없으면 None)
+    """
+    if type(value) is str:
+        return _parse_price_info(value).amount
+    if isinstance(value, int):
+        return value
+    return parse_price_info(value).amount
+
+
+def parse_rent(value: Any) -> Tuple[Optional[int], Optional[int]]:
+    """"보증금/월세" 표기를 (보증금, 월세)로 변환 (만원)"""
+    info = parse_price_info(value)
+    return info.amount, info.monthly_rent
+
+
+def _area_value(num: str, unit: Optional[str]) -> float:
+    value = float(num)
+    return value * PYEONG_TO_M2 if unit == "평" else value
+
+
+def _match_area(text: str) -> Optional[re.Match]:
+    """면적 한 개 찾기 (표기 전체가 면적이거나, 단위가 붙은 숫자; "B1층" 같은 숫자는 무시)"""
+    return _AREA_RE.fullmatch(text) or _AREA_UNIT_RE.search(text)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_area_pair(text: str) -> Tuple[Optional[float], Optional[float]]:
+    """면적 문자열 해석 (공급, 전용, 원본 문자열 기준으로 캐시)"""
+    text = _normalize(text)
+    if "/" not in text:
+        match = _match_area(text)
+        if match is None:
+            return None, None
+        value = _area_value(match.group("num"), match.group("unit"))
+        return value, value
+
+    supply_text, _, exclusive_text = text.partition("/")
+    supply = _match_area(supply_text)
+    exclusive = _match_area(exclusive_text)
+    # "112/84㎡"처럼 단위가 뒤에만 있으면 앞에도 적용
+    unit = (exclusive and exclusive.group("unit")) or (supply and supply.group("unit"))
+    return (
+        _area_value(supply.group("num"), supply.group("unit") or unit) if supply else None,
+        _area_value(exclusive.group("num"), exclusive.group("unit") or unit) if exclusive else None
+    )
+
+
+def parse_area_pair(value: Any) -> Tuple[Optional[float], Optional[float]]:
+    """면적 표기를 (공급면적, 전용면적) ㎡로 변환 (면적이 하나면 둘 다 같은 값)"""
+    if type(value) is str:
+        return _parse_area_pair(value)
+    if _is_missing(value):
+        return None, None
+    if isinstance(value, (int, float)):
+        return float(value), float(value)
+    return _parse_area_pair(str(value))
+
+
+def parse_area(value: Any) -> Optional[float]:
+    """
+    면적을 제곱미터로 변환 (평은 ㎡로 환산, 공급/전용 표기는 전용면적)
+
+    Returns:
+        제곱미터 면적 (해석할 수 없으면 None)
+    """
+    if type(value) is str:
+        return _parse_area_pair(value)[1]
+    if isinstance(value, float) and not math.isnan(value):
+        return value
+    return parse_area_pair(value)[1]
+
+
+def _parse_column(values: Iterable, parse) -> List:
+    """고유값만 파싱해 열 전체에 매핑"""
+    parsed = {}
+    results = []
+    for value in values:
+        try:
+            result = parsed[value]
+        except KeyError:
+            result = parsed[value] = parse(value)
+        except TypeError:
+            # 해시할 수 없는 값
+            result = parse(value)
+        results.append(result)
+    return results
+
+
+def parse_prices(values: Iterable) -> List[Optional[int]]:
+    """가격 열 일괄 변환 (리스트, pandas Series 등)"""
+    return _parse_column(values, parse_price)
+
+
+def parse_areas(values: Iterable) -> List[Optional[float]]:
+    """면적 열 일괄 변환 (리스트, pandas Series 등)"""
+    return _parse_column(values, parse_area)
+
+
+def cache_info():
+    """스칼라 캐시 통계"""
+    return {"price": _parse_price_info.cache_info(), "area": _parse_area_pair.cache_info()}
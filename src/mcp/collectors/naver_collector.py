@@ -1,7 +1,7 @@
 """
 네이버 부동산 수집기
 """
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 import asyncio
 from datetime import datetime
 from loguru import logger
@@ -14,6 +14,8 @@ from .base_collector import BaseCollector
 class NaverCollector(BaseCollector):
     """네이버 부동산 수집기"""
     
+    platform = "naver"
+    
     def __init__(self):
         super().__init__()
         self.base_url = "https://land.naver.com"
@@ -45,10 +47,10 @@ class NaverCollector(BaseCollector):
             "강북구": "1130500000"
         }
         
-    async def collect(self, area: str, property_type: str = "APT", 
-                     trade_type: str = "A1", max_items: int = 100) -> List[Dict]:
+    async def iter_properties(self, area: str, property_type: str = "APT", 
+                              trade_type: str = "A1", max_items: int = 100) -> AsyncIterator[Dict]:
         """
-        네이버 부동산에서 매물 수집
+        네이버 부동산에서 매물 수집 (정규화되는 대로 하나씩 전달)
         
         Args:
             area: 지역명 (예: "강남구")
@@ -56,20 +58,19 @@ class NaverCollector(BaseCollector):
             trade_type: 거래 유형 (A1: 매매, B1: 전세, B2: 월세)
             max_items: 최대 수집 개수
             
-        Returns:
-            수집된 매물 리스트
+        Yields:
+            정규화된 매물 정보
         """
         if area not in self.area_codes:
             logger.warning(f"Unsupported area: {area}")
-            return []
+            return
             
-        properties = []
         area_code = self.area_codes[area]
         
-        try:
-            # Playwright를 사용한 동적 페이지 수집
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
+        # Playwright를 사용한 동적 페이지 수집
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
                 context = await browser.new_context(
                     user_agent=self._get_random_user_agent()
                 )
@@ -100,8 +101,8 @@ class NaverCollector(BaseCollector):
                             # 데이터 정규화
                             normalized = await self.parse_property(property_data)
                             if self.validate_property(normalized):
-                                properties.append(normalized)
                                 collected += 1
+                                yield normalized
                                 
                     # 다음 페이지로 이동
                     has_next = await self._go_to_next_page(page)
@@ -111,14 +112,10 @@ class NaverCollector(BaseCollector):
                     page_num += 1
                     await asyncio.sleep(2)  # Rate limiting
                     
+            finally:
+                # 조기 종료 시에도 브라우저 정리
                 await browser.close()
                 
-        except Exception as e:
-            logger.error(f"Error collecting from Naver: {e}")
-            
-        logger.info(f"Collected {len(properties)} properties from Naver for {area}")
-        return properties
-        
     async def _apply_filters(self, page, property_type: str, trade_type: str):
         """필터 적용"""
         try:
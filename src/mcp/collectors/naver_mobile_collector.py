@@ -6,6 +6,7 @@
 import asyncio
 import json
 import logging
+import os
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from enum import Enum
@@ -13,6 +14,8 @@ import aiohttp
 from bs4 import BeautifulSoup
 from urllib.parse import urlencode, urlparse, parse_qs
 
+from .korean_units import parse_area, parse_price
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,9 +57,10 @@ class TradeType(Enum):
 class NaverMobileCollector:
     """네이버 부동산 모바일 크롤러"""
     
-    BASE_URL = "https://m.land.naver.com"
-    CLUSTER_API = "https://m.land.naver.com/cluster/clusterList"
-    ARTICLE_API = "https://m.land.naver.com/cluster/ajax/articleList"
+    # NAVER_MOBILE_BASE_URL 환경 변수로 덮어쓰기 (로컬 대역 서버로 벤치마크할 때)
+    BASE_URL = os.getenv("NAVER_MOBILE_BASE_URL", "https://m.land.naver.com").rstrip("/")
+    CLUSTER_API = f"{BASE_URL}/cluster/clusterList"
+    ARTICLE_API = f"{BASE_URL}/cluster/ajax/articleList"
     
     # 매물 유형별 필터 코드 매핑
     PROPERTY_TYPE_CODES = {
@@ -259,15 +263,9 @@ class NaverMobileCollector:
             파싱된 매물 정보
         """
         try:
-            # 가격 처리 (문자열로 올 수 있음)
-            price = article_data.get("prc", "0")
-            if isinstance(price, str):
-                price = int(price.replace(",", "")) if price else 0
-            
-            # 면적 처리
-            area = article_data.get("spc1", article_data.get("spc", "0"))
-            if isinstance(area, str):
-                area = float(area) if area else 0
+            # 가격/면적 처리 (숫자 또는 "3억 5,000", "84.95" 같은 문자열)
+            price = parse_price(article_data.get("prc")) or parse_price(article_data.get("hanPrc")) or 0
+            area = parse_area(article_data.get("spc1", article_data.get("spc"))) or 0
                 
             return {
                 "type": property_type.value,
@@ -0,0 +1,118 @@
+"""
+호스트별 토큰 버킷 rate limiter - 프로세스 안의 모든 수집기 인스턴스가 공유
+"""
+from functools import lru_cache
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import asyncio
+import time
+
+from loguru import logger
+
+from ..config import load_config
+
+
+class AsyncTokenBucket:
+    """
+    비동기 토큰 버킷
+
+    - rate: 초당 충전 토큰 수 (초당 요청 수)
+    - capacity: 최대 토큰 수 (순간 허용 요청 수)
+
+    토큰이 부족하면 미리 차감(예약)한 뒤 부족분이 채워질 때까지 대기한다.
+    대기 순서대로 예약되므로 락 없이 요청 순서가 유지된다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+        # 통계 카운터
+        self.acquired = 0
+        self.delayed = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, tokens: float = 1) -> float:
+        """토큰 사용 (부족하면 대기, 대기한 시간 반환)"""
+        self._refill()
+        self.tokens -= tokens
+        self.acquired += 1
+        if self.tokens >= 0:
+            return 0.0
+
+        wait = -self.tokens / self.rate
+        self.delayed += 1
+        self.wait_seconds += wait
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            # 취소된 요청의 예약분은 반환
+            self.tokens += tokens
+            raise
+        return wait
+
+    def stats(self) -> Dict[str, float]:
+        self._refill()
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "tokens": round(self.tokens, 3),
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "wait_seconds": round(self.wait_seconds, 3)
+        }
+
+
+class HostRateLimiter:
+    """
+    호스트별 토큰 버킷 모음
+
+    같은 호스트에 요청하는 수집기 인스턴스는 하나의 버킷을 공유한다. 버킷의 속도는
+    해당 호스트에 처음 요청한 수집기의 설정을 따른다.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, AsyncTokenBucket] = {}
+
+    def bucket(self, host: str, rate: float, capacity: Optional[float] = None) -> AsyncTokenBucket:
+        """호스트 버킷 (없으면 생성)"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = AsyncTokenBucket(rate, capacity)
+            logger.debug(f"Rate limiter for {host}: {rate} req/s, burst {bucket.capacity}")
+        return bucket
+
+    async def acquire(self, url: str, rate: float, capacity: Optional[float] = None) -> float:
+        """URL 호스트의 토큰 사용 (부족하면 대기)"""
+        return await self.bucket(urlparse(url).netloc, rate, capacity).acquire()
+
+    def reset(self):
+        """모든 버킷 삭제 (설정 변경/테스트용)"""
+        self._buckets.clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {host: bucket.stats() for host, bucket in self._buckets.items()}
+
+
+# 프로세스 공유 인스턴스
+host_rate_limiter = HostRateLimiter()
+
+
+@lru_cache(maxsize=1)
+def _collectors_config() -> Dict:
+    """config/mcp_config.yaml의 collectors 설정 (프로세스당 한 번 로드)"""
+    return load_config().get("collectors") or {}
+
+
+def collector_settings(platform: str) -> Dict:
+    """collectors.<platform> 설정 (없으면 빈 딕셔너리)"""
+    if not platform:
+        return {}
+    return _collectors_config().get(platform) or {}
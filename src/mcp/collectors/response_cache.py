@@ -0,0 +1,277 @@
+"""
+수집기 HTTP 응답 디스크 캐시 - 같은 지역을 다시 수집할 때 같은 응답을 다시 받지 않음
+
+- 키: 메서드 + URL + 정규화한 파라미터(params/json/data)의 해시. 파일 경로도 키 해시로 정한다.
+- TTL: 엔드포인트 종류(detail/list 등)별로 설정
+- 재검증: 만료된 항목에 ETag/Last-Modified가 있으면 조건부 요청 후 304면 그대로 재사용
+- 용량 제한: 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 삭제
+"""
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+
+from loguru import logger
+
+from ..config import PROJECT_ROOT
+from .rate_limiter import collector_settings
+
+
+def normalize_request(method: str, url: str, params: Any = None, body: Any = None) -> str:
+    """요청을 키 문자열로 정규화 (쿼리와 params를 합쳐 정렬, 본문은 키 정렬 JSON)"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        items = params.items() if isinstance(params, dict) else params
+        query.extend((str(k), str(v)) for k, v in items)
+    normalized_url = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path,
+                                 urlencode(sorted(query)), ""))
+    key = f"{method.upper()} {normalized_url}"
+    if body is not None:
+        key += " " + json.dumps(body, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return key
+
+
+class CachedResponse:
+    """캐시된 응답"""
+
+    __slots__ = ("data", "expires_at", "etag", "last_modified")
+
+    def __init__(self, data: Any, expires_at: float, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None):
+        self.data = data
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """재검증 요청 헤더"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    디스크 응답 캐시
+
+    - directory: 저장 디렉터리 (키 해시 앞 2자리로 하위 디렉터리를 나눔)
+    - max_bytes: 전체 파일 크기 상한
+    - ttls: 엔드포인트 종류별 TTL (초, 0이면 저장하지 않음)
+    - default_ttl: ttls에 없는 종류의 TTL
+    - stale_ttl: 만료 후 재검증용으로 보관할 시간 (초)
+
+    파일 쓰기는 임시 파일에 쓴 뒤 교체하므로 여러 프로세스가 같은 디렉터리를 써도 깨지지 않는다.
+    용량 계산은 프로세스별로 하므로 여러 프로세스가 쓰면 상한을 잠시 넘을 수 있다.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = 256 * 1024 * 1024,
+                 ttls: Optional[Dict[str, float]] = None, default_ttl: float = 300,
+                 stale_ttl: float = 7 * 24 * 3600):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        # 파일 경로 -> (크기, 마지막 사용 시각), 첫 사용 시 디렉터리를 스캔해 채움
+        self._index: Optional[Dict[Path, Tuple[int, float]]] = None
+        self._bytes = 0
+        # executor 스레드끼리 인덱스를 함께 수정하지 않도록
+        self._lock = threading.Lock()
+
+        # 통계 카운터
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "ResponseCache":
+        """설정(collectors.response_cache)으로 생성"""
+        ttl = dict(config.get("ttl") or {})
+        return cls(
+            # 상대 경로는 실행 디렉터리가 아니라 프로젝트 루트 기준 (절대 경로는 그대로)
+            PROJECT_ROOT / config.get("directory", "data/cache/http"),
+            max_bytes=int(float(config.get("max_mb", 256)) * 1024 * 1024),
+            ttls={k: float(v) for k, v in ttl.items() if k != "default"},
+            default_ttl=float(ttl.get("default", 300)),
+            stale_ttl=float(config.get("stale_ttl", 7 * 24 * 3600))
+        )
+
+    def ttl_for(self, endpoint_class: str) -> float:
+        return self.ttls.get(endpoint_class, self.default_ttl)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def _load_index(self):
+        """디렉터리 스캔 (파일 크기와 마지막 사용 시각)"""
+        self._index = {}
+        self._bytes = 0
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            self._index[path] = (stat.st_size, stat.st_mtime)
+            self._bytes += stat.st_size
+
+    def _get_sync(self, key: str) -> Optional[CachedResponse]:
+        if self._index is None:
+            self._load_index()
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Corrupt response cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        if entry.get("key") != key:
+            # 해시 충돌 (사실상 없음)
+            return None
+        if time.time() >= entry["expires_at"] + self.stale_ttl:
+            self._remove(path)
+            return None
+
+        # 마지막 사용 시각 갱신 (LRU 삭제 순서)
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        if path in self._index:
+            self._index[path] = (self._index[path][0], now)
+        return CachedResponse(entry["data"], entry["expires_at"], entry.get("etag"), entry.get("last_modified"))
+
+    def _set_sync(self, key: str, response: CachedResponse):
+        if self._index is None:
+            self._load_index()
+        path = self._path(key)
+        body = json.dumps({
+            "key": key,
+            "expires_at": response.expires_at,
+            "etag": response.etag,
+            "last_modified": response.last_modified,
+            "data": response.data
+        }, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+        if len(body) > self.max_bytes:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(body)
+        os.replace(tmp, path)
+
+        old = self._index.pop(path, None)
+        if old is not None:
+            self._bytes -= old[0]
+        self._index[path] = (len(body), time.time())
+        self._bytes += len(body)
+        self.stores += 1
+        self._evict()
+
+    def _remove(self, path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        old = self._index.pop(path, None) if self._index is not None else None
+        if old is not None:
+            self._bytes -= old[0]
+
+    def _evict(self):
+        """용량 상한까지 가장 오래 쓰지 않은 항목부터 삭제"""
+        if self._bytes <= self.max_bytes:
+            return
+        for path, _ in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self._bytes <= self.max_bytes:
+                break
+            self._remove(path)
+            self.evictions += 1
+
+    async def _run(self, fn, *args):
+        """파일 작업을 executor 스레드에서 실행"""
+        def locked():
+            with self._lock:
+                return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, locked)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """캐시 조회 (만료되었어도 재검증용으로 반환, fresh로 구분)"""
+        cached = await self._run(self._get_sync, key)
+        if cached is not None and cached.fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return cached
+
+    async def set(self, key: str, data: Any, endpoint_class: str,
+                  etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """응답 저장 (TTL이 0이고 재검증 정보도 없으면 저장하지 않음)"""
+        ttl = self.ttl_for(endpoint_class)
+        if ttl <= 0 and not (etag or last_modified):
+            return
+        response = CachedResponse(data, time.time() + ttl, etag, last_modified)
+        await self._run(self._set_sync, key, response)
+
+    async def refresh(self, key: str, cached: CachedResponse, endpoint_class: str):
+        """304 응답 후 만료 시각 갱신"""
+        self.revalidated += 1
+        await self.set(key, cached.data, endpoint_class, cached.etag, cached.last_modified)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "directory": str(self.directory),
+            "entries": len(self._index) if self._index is not None else None,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "stores": self.stores,
+            "evictions": self.evictions
+        }
+
+
+_shared_cache: Optional[ResponseCache] = None
+
+
+def shared_response_cache() -> Optional[ResponseCache]:
+    """
+    프로세스 공유 응답 캐시 (collectors.response_cache.enabled가 false면 None)
+
+    COLLECTOR_RESPONSE_CACHE 환경 변수(1/0)로 설정을 덮어쓸 수 있다.
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        config = collector_settings("response_cache")
+        enabled = os.getenv("COLLECTOR_RESPONSE_CACHE")
+        if not (config.get("enabled", False) if enabled is None else enabled == "1"):
+            return None
+        _shared_cache = ResponseCache.from_config(config)
+        logger.info(f"Collector response cache enabled: {_shared_cache.directory}")
+    return _shared_cache
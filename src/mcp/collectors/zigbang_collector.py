@@ -1,27 +1,39 @@
 """
 직방 수집기
 """
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
+from contextlib import aclosing
 import asyncio
 from datetime import datetime
 from loguru import logger
 import json
 
 from .base_collector import BaseCollector
+from .rate_limiter import collector_settings
 
 
 class ZigbangCollector(BaseCollector):
     """직방 수집기"""
     
+    platform = "zigbang"
+    
     def __init__(self):
         super().__init__()
-        self.base_url = "https://apis.zigbang.com"
+        self.base_url = self._base_url("https://apis.zigbang.com")
         self.web_url = "https://www.zigbang.com"
+        settings = collector_settings(self.platform)
+        self.detail_workers = int(settings.get('detail_workers', 4))  # 상세 조회 동시 작업 수
+        self.queue_size = int(settings.get('queue_size', 50))  # 단계 사이 큐 크기
         
-    async def collect(self, area: str, room_type: str = "apartment", 
-                     trade_type: str = "sales", max_items: int = 100) -> List[Dict]:
+    async def iter_properties(self, area: str, room_type: str = "apartment", 
+                              trade_type: str = "sales", max_items: int = 100) -> AsyncIterator[Dict]:
         """
-        직방에서 매물 수집
+        직방에서 매물 수집 (목록 순서대로 하나씩 전달)
+        
+        목록 조회 → 상세 조회 → 파싱/검증을 큐로 연결한 파이프라인으로 실행한다.
+        목록 페이지가 매물 ID를 크기 제한 큐에 넣으면 detail_workers개의 작업이
+        상세 정보를 동시에 조회하고(호스트 공유 rate limit 적용), 파싱/검증 단계가
+        결과를 목록 순서로 내보낸다. 큐가 차면 앞 단계가 기다리므로 메모리 사용이 제한된다.
         
         Args:
             area: 지역명 (예: "강남구")
@@ -29,44 +41,112 @@ class ZigbangCollector(BaseCollector):
             trade_type: 거래 유형 (sales: 매매, jeonse: 전세, monthly: 월세)
             max_items: 최대 수집 개수
             
-        Returns:
-            수집된 매물 리스트
+        Yields:
+            정규화된 매물 정보
         """
-        properties = []
+        # 1. 지역 ID 조회
+        area_id = await self._get_area_id(area)
+        if not area_id:
+            logger.warning(f"Could not find area ID for {area}")
+            return
+            
+        # 2~4. 목록 → 상세 → 파싱/검증 파이프라인
+        # 조기 종료 시 파이프라인 작업을 바로 정리하도록 명시적으로 닫음
+        async with aclosing(self._run_pipeline(area_id, room_type, trade_type, max_items)) as pipeline:
+            async for normalized in pipeline:
+                yield normalized
+            
+    async def _run_pipeline(self, area_id: str, room_type: str, 
+                            trade_type: str, max_items: int) -> AsyncIterator[Dict]:
+        """목록/상세/파싱 단계를 동시에 실행하고 검증된 매물을 목록 순서로 전달"""
+        id_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        detail_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        workers = max(1, self.detail_workers)
         
-        try:
-            # 1. 지역 ID 조회
-            area_id = await self._get_area_id(area)
-            if not area_id:
-                logger.warning(f"Could not find area ID for {area}")
-                return []
+        async def produce():
+            """목록 페이지의 매물 ID를 큐에 넣기 (중복 제외, 최대 max_items개)"""
+            seen = set()
+            cancelled = False
+            try:
+                async for page_items in self._iter_property_list(area_id, room_type, trade_type, max_items):
+                    for item in page_items:
+                        item_id = item.get('item_id')
+                        if item_id is None or item_id in seen:
+                            continue
+                        seen.add(item_id)
+                        await id_queue.put((len(seen), item_id))
+                        if len(seen) >= max_items:
+                            return
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                # 작업마다 종료 표시 (취소된 경우에는 작업도 취소되므로 생략,
+                # 가득 찬 큐에서 기다리면 정리가 끝나지 않음)
+                if not cancelled:
+                    for _ in range(workers):
+                        await id_queue.put(None)
+                    
+        async def fetch_details():
+            """상세 조회 작업 (실패한 매물도 순서 유지를 위해 None으로 전달)"""
+            cancelled = False
+            try:
+                while True:
+                    entry = await id_queue.get()
+                    if entry is None:
+                        return
+                    index, item_id = entry
+                    try:
+                        detail = await self._get_property_detail(item_id)
+                    except Exception as e:
+                        logger.debug(f"Error fetching item {item_id}: {e}")
+                        detail = None
+                    await detail_queue.put((index, detail))
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                if not cancelled:
+                    await detail_queue.put(None)
                 
-            # 2. 매물 목록 조회
-            items = await self._get_property_list(area_id, room_type, trade_type, max_items)
-            
-            # 3. 각 매물의 상세 정보 수집
-            for item in items[:max_items]:
-                try:
-                    # 상세 정보 조회
-                    detail = await self._get_property_detail(item['item_id'])
-                    if detail:
-                        # 데이터 정규화
+        producer = asyncio.create_task(produce())
+        tasks = [producer] + [asyncio.create_task(fetch_details()) for _ in range(workers)]
+        try:
+            # 파싱/검증 단계 (모든 상세 조회 작업이 끝날 때까지)
+            # 먼저 끝난 매물은 앞 순번이 도착할 때까지 pending에 보관
+            pending = {}
+            next_index = 1
+            finished = 0
+            while finished < workers:
+                entry = await detail_queue.get()
+                if entry is None:
+                    finished += 1
+                    continue
+                index, detail = entry
+                normalized = None
+                if detail:
+                    try:
                         normalized = await self.parse_property(detail)
-                        if self.validate_property(normalized):
-                            properties.append(normalized)
-                            
-                    # Rate limiting
-                    await asyncio.sleep(1)
-                    
-                except Exception as e:
-                    logger.debug(f"Error processing item: {e}")
-                    
-        except Exception as e:
-            logger.error(f"Error collecting from Zigbang: {e}")
+                        if not self.validate_property(normalized):
+                            normalized = None
+                    except Exception as e:
+                        logger.debug(f"Error processing item: {e}")
+                        normalized = None
+                pending[index] = normalized
+                while next_index in pending:
+                    normalized = pending.pop(next_index)
+                    next_index += 1
+                    if normalized:
+                        yield normalized
+                        
+            # 목록 조회 단계의 예외 전달
+            await producer
+        finally:
+            # 오류/조기 종료 시 남은 단계 정리
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             
-        logger.info(f"Collected {len(properties)} properties from Zigbang for {area}")
-        return properties
-        
     async def _get_area_id(self, area: str) -> Optional[str]:
         """지역명으로 지역 ID 조회"""
         # 직방의 실제 지역 ID 맵핑 (강남구 삼성1동)
@@ -96,11 +176,9 @@ class ZigbangCollector(BaseCollector):
         # 기본값으로 강남구 삼성1동 반환
         return "1168064000"
         
-    async def _get_property_list(self, area_id: str, room_type: str, 
-                                 trade_type: str, limit: int) -> List[Dict]:
-        """매물 목록 조회"""
-        items = []
-        
+    async def _iter_property_list(self, area_id: str, room_type: str, 
+                                  trade_type: str, limit: int) -> AsyncIterator[List[Dict]]:
+        """매물 목록을 페이지 단위로 조회 (요청 간격은 호스트 rate limit이 조절)"""
         try:
             # 직방의 실제 API 엔드포인트 사용
             if room_type == "apartment":
@@ -145,18 +223,13 @@ class ZigbangCollector(BaseCollector):
                 if not page_items:
                     break
                     
-                items.extend(page_items)
+                yield page_items
                 collected += len(page_items)
                 page += 1
                 
-                # 페이지간 딜레이
-                await asyncio.sleep(1)
-                
         except Exception as e:
             logger.error(f"Error fetching property list: {e}")
             
-        return items[:limit]
-        
     async def _get_property_detail(self, item_id: str) -> Optional[Dict]:
         """매물 상세 정보 조회"""
         url = f"{self.base_url}/v3/items/{item_id}"
@@ -0,0 +1,49 @@
+"""
+설정 로더 - config/mcp_config.yaml 읽기 (${ENV_VAR} 치환 지원)
+
+백엔드(backend)와 MCP 수집기/오케스트레이터(src/mcp)가 함께 사용한다.
+수집기 컨테이너에는 src/와 config/만 들어가므로 이 모듈은 src/mcp에 둔다.
+"""
+from pathlib import Path
+from typing import Any, Dict
+import os
+import re
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+CONFIG_PATH = PROJECT_ROOT / "config" / "mcp_config.yaml"
+
+_ENV_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+
+def _expand_env(value: Any) -> Any:
+    """문자열 값의 ${VAR}를 환경 변수로 치환 (없으면 빈 문자열)"""
+    if isinstance(value, str):
+        return _ENV_PATTERN.sub(lambda m: os.getenv(m.group(1), ""), value)
+    if isinstance(value, dict):
+        return {k: _expand_env(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_expand_env(v) for v in value]
+    return value
+
+
+def load_config(path: Path = None) -> Dict[str, Any]:
+    """
+    설정 파일 로드
+
+    Args:
+        path: 설정 파일 경로 (기본값: MCP_CONFIG_PATH 환경 변수 또는 config/mcp_config.yaml)
+
+    Returns:
+        설정 딕셔너리
+
+    Raises:
+        FileNotFoundError: 설정 파일이 없음 (기본값으로 조용히 동작하지 않도록)
+    """
+    path = Path(path or os.getenv("MCP_CONFIG_PATH", CONFIG_PATH))
+    if not path.exists():
+        raise FileNotFoundError(f"Config file not found: {path} (set MCP_CONFIG_PATH)")
+
+    with open(path, encoding='utf-8') as f:
+        return _expand_env(yaml.safe_load(f) or {})
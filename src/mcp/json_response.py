@@ -0,0 +1,60 @@
+"""
+고속 JSON 응답 - orjson이 있으면 orjson으로, 없으면 표준 json으로 직렬화
+
+FastAPI 기본 경로(jsonable_encoder + json.dumps)는 응답 dict를 한 번 더 복사하며 변환한다.
+엔드포인트가 FastJSONResponse를 직접 반환하면 이 단계를 건너뛰고 바로 bytes로 직렬화한다.
+"""
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+import json
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """표준 json/orjson이 직접 처리하지 못하는 타입 변환"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (UUID, Path)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(content: Any) -> bytes:
+        """UTF-8 JSON bytes 직렬화 (한글은 이스케이프하지 않음)"""
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+else:
+    def dumps(content: Any) -> bytes:
+        """UTF-8 JSON bytes 직렬화 (한글은 이스케이프하지 않음)"""
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default
+        ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (엔드포인트에서 직접 반환하면 jsonable_encoder 생략)"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
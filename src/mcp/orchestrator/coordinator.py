@@ -9,6 +9,7 @@ from enum import Enum
 from dataclasses import dataclass
 from loguru import logger
 import heapq
+import time
 
 from ..models.task import Task, TaskStatus, SubTask
 from ..models.agent import Agent, AgentStatus, AgentType
@@ -34,6 +35,9 @@ class TaskCoordinator:
         self.completed_tasks: Dict[str, Any] = {}
         self.task_results: Dict[str, List[Any]] = {}
         self.lock = asyncio.Lock()
+        # 수집 에이전트가 상태 메시지로 보고한 플랫폼별 서킷 브레이커 상태
+        # platform -> (보고 시각(monotonic), 브레이커 통계)
+        self.circuit_states: Dict[str, tuple] = {}
         
     async def initialize(self):
         """초기화"""
@@ -85,24 +89,78 @@ class TaskCoordinator:
             try:
                 if self.task_queue:
                     async with self.lock:
-                        # 우선순위가 가장 높은 작업 가져오기
-                        priority, created_at, subtask = heapq.heappop(self.task_queue)
+                        # 서킷이 열린 플랫폼을 건너뛰고 우선순위가 가장 높은 작업 가져오기
+                        entry = self.pop_dispatchable_task()
                         
-                        # 적합한 에이전트 찾기
-                        agent = await self.find_suitable_agent(subtask)
-                        
-                        if agent:
-                            # 작업 할당
-                            await self.assign_task_to_agent(subtask, agent)
-                        else:
-                            # 에이전트가 없으면 다시 큐에 넣기
-                            heapq.heappush(self.task_queue, (priority, created_at, subtask))
+                        if entry:
+                            priority, created_at, subtask = entry
+                            
+                            # 적합한 에이전트 찾기
+                            agent = await self.find_suitable_agent(subtask)
+                            
+                            if agent:
+                                # 작업 할당
+                                await self.assign_task_to_agent(subtask, agent)
+                            else:
+                                # 에이전트가 없으면 다시 큐에 넣기
+                                heapq.heappush(self.task_queue, entry)
                             
                 await asyncio.sleep(1)
                 
             except Exception as e:
                 logger.error(f"Task dispatcher error: {e}")
                 
+    def pop_dispatchable_task(self) -> Optional[tuple]:
+        """
+        분배할 수 있는 가장 높은 우선순위 작업 꺼내기
+        
+        에이전트가 보고한 서킷 브레이커가 열린(장애 중인) 플랫폼의 작업은 큐에 남겨 두고,
+        open 대기 시간이 지나면(브레이커가 시험 요청을 허용할 때) 다시 분배한다.
+        """
+        skipped = []
+        entry = None
+        while self.task_queue:
+            candidate = heapq.heappop(self.task_queue)
+            if self.platform_available(candidate[2].platform):
+                entry = candidate
+                break
+            skipped.append(candidate)
+            
+        for candidate in skipped:
+            heapq.heappush(self.task_queue, candidate)
+        return entry
+        
+    def update_circuit_states(self, states: Dict[str, Dict]):
+        """
+        수집 에이전트가 보고한 서킷 브레이커 상태 반영
+        
+        브레이커는 수집기가 도는 에이전트 프로세스에 있으므로, 에이전트 상태 메시지의
+        circuit_breakers(플랫폼별 CircuitBreaker.stats())를 받아 분배 판단에 쓴다.
+        """
+        now = time.monotonic()
+        for platform, stats in (states or {}).items():
+            if isinstance(stats, dict):
+                self.circuit_states[platform] = (now, stats)
+                
+    def platform_available(self, platform: str) -> bool:
+        """플랫폼에 작업을 보내도 되는지 (보고가 없거나 open 대기 시간이 지났으면 True)"""
+        entry = self.circuit_states.get(platform)
+        if entry is None:
+            return True
+        reported_at, stats = entry
+        if stats.get('available', True):
+            return True
+        return time.monotonic() >= reported_at + float(stats.get('retry_after') or 0)
+        
+    def circuit_status(self) -> Dict[str, Dict]:
+        """플랫폼별 보고된 브레이커 상태 (보고 후 경과 시간 포함)"""
+        now = time.monotonic()
+        return {
+            platform: {**stats, 'available': self.platform_available(platform),
+                       'reported_ago': round(now - reported_at, 1)}
+            for platform, (reported_at, stats) in self.circuit_states.items()
+        }
+        
     async def find_suitable_agent(self, subtask: SubTask) -> Optional[Agent]:
         """적합한 에이전트 찾기"""
         # 실제 구현에서는 AgentRegistry와 연동
@@ -290,6 +348,7 @@ class TaskCoordinator:
                 'running': len(self.running_tasks),
                 'completed': len(self.completed_tasks)
             },
+            'circuit_breakers': self.circuit_status(),
             'performance': {
                 'avg_task_time': asyncio.run(self.get_average_task_time()),
                 'success_rate': asyncio.run(self.get_success_rate())
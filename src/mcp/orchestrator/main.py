@@ -3,8 +3,10 @@ MCP 오케스트레이터 메인 서버 - 실제 구현
 """
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from typing import Dict, List, Optional, Any
 import asyncio
+import os
 import uvicorn
 from datetime import datetime
 import json
@@ -20,6 +22,7 @@ from ..communication.websocket_manager import WebSocketManager
 from ..communication.message_queue import MessageQueue
 from ..models.task import Task, TaskStatus
 from ..models.agent import Agent, AgentType, AgentStatus
+from ..json_response import FastJSONResponse
 
 # 로거 설정
 logger.add("logs/orchestrator_{time}.log", rotation="1 day", level="INFO")
@@ -126,6 +129,10 @@ class MCPOrchestrator:
         
         await self.registry.update_agent_status(agent_id, status)
         
+        # 에이전트 프로세스의 서킷 브레이커 상태를 작업 분배에 반영
+        if message.get('circuit_breakers'):
+            self.coordinator.update_circuit_states(message['circuit_breakers'])
+        
     async def handle_error(self, message: dict):
         """에러 처리"""
         error_type = message.get('error_type')
@@ -220,10 +227,14 @@ async def lifespan(app: FastAPI):
     # 종료
     await orchestrator.stop()
 
+# 고속 JSON 응답 (orjson 직렬화) - FAST_JSON=1로 활성화
+FAST_JSON = os.getenv("FAST_JSON", "0") == "1"
+
 app = FastAPI(
     title="MCP Orchestrator",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse if FAST_JSON else JSONResponse
 )
 
 # CORS 설정
@@ -378,6 +389,8 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
                 await orchestrator.ws_manager.subscribe(client_id, message.get('channel'))
             elif message.get('type') == 'unsubscribe':
                 await orchestrator.ws_manager.unsubscribe(client_id, message.get('channel'))
+            elif message.get('type') == 'agent_status':
+                await orchestrator.handle_agent_status(message)
                 
     except WebSocketDisconnect:
         await orchestrator.ws_manager.disconnect(client_id)